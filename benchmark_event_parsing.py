@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for Houston event parsing and deduplication
+
+Compares the original per-selector `select_one` field lookup on an
+html.parser soup with the compiled single-pass extractor on the faster
+tree builder, and the original pairwise duplicate removal with the dedup
+index, using synthetic data.
+
+The micro suite runs the scraper's own parsing steps over the saved
+listing pages in blog_automation/fixtures/listings, scaled up to
+thousands of cards, and compares throughput and peak memory with a stored
+baseline. Everything runs fully offline.
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# Add the blog_automation directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Keep the scraper's selector and tier caches out of the real cache directory
+os.environ['HOUSTON_EVENTS_CACHE_DIR'] = tempfile.mkdtemp(prefix='houston-bench-')
+
+from blog_automation.models import HoustonEvent
+from blog_automation.modules.event_dedup import EventDedupIndex
+from blog_automation.modules.event_extractor import DEFAULT_FIELD_SELECTORS, HTML_PARSER, get_field_extractor
+from blog_automation.modules.event_sources import get_source
+from blog_automation.modules.keyword_matcher import (EVENT_CATEGORIES, EVENT_TYPES, HOUSTON_AREAS,
+                                                     KeywordMatcher, get_keyword_matcher)
+
+FIXTURE_DIR = Path(__file__).parent / 'blog_automation' / 'fixtures' / 'listings'
+BASELINE_PATH = FIXTURE_DIR.parent / 'benchmark_baseline.json'
+
+# Fixed reference time so scores and date roll-over don't drift between runs
+BENCH_NOW = datetime(2026, 10, 1, 12, 0)
+
+CARD_TEMPLATES = [
+    """<div class="event-card"><a href="/events/{i}"><img src="/img/{i}.jpg"></a>
+    <div class="card-body"><h3 class="event-title">{title}</h3><p class="summary">{desc}</p>
+    <span class="event-date">{date}</span><span class="venue-name">{venue}</span></div></div>""",
+    """<div class="event-item"><div class="meta"><time>{date}</time></div>
+    <div class="name">{title}</div><div class="location">{venue}</div>
+    <div class="description-text">{desc}</div><a href="https://example.com/{i}">More</a></div>""",
+    """<div class="event-card"><div class="wrapper"><div class="inner"><div class="text">
+    <span class="card-title">{title}</span><div class="content">{desc}</div></div></div></div>
+    <div class="when">{date}</div><img src="/img/{i}.png"></div>""",
+]
+
+TITLES = ["Houston Symphony: Holiday Pops", "Bayou City Art Festival", "Rodeo Family Day",
+          "Downtown Food Truck Fair", "Astros Watch Party at Discovery Green", "Jazz in the Heights"]
+VENUES = ["Jones Hall", "Discovery Green", "NRG Park", "Miller Outdoor Theatre", "White Oak Music Hall"]
+
+
+def build_listing(num_cards: int, seed: int = 7) -> str:
+    """Build a synthetic listing page with the given number of event cards."""
+    rng = random.Random(seed)
+    cards = []
+    for i in range(num_cards):
+        template = CARD_TEMPLATES[i % len(CARD_TEMPLATES)]
+        cards.append(template.format(
+            i=i,
+            title=f"{rng.choice(TITLES)} #{i}",
+            desc="Join us for an evening of live music, food and fun. " * rng.randint(1, 4),
+            date=f"Dec {rng.randint(1, 28)}, 2026 7:30 PM",
+            venue=rng.choice(VENUES)
+        ))
+    return f"<html><head><title>Events</title></head><body><main>{''.join(cards)}</main></body></html>"
+
+
+def legacy_extract(element):
+    """Original field lookup: one select_one per selector until a field matches."""
+    fields = {}
+    for field, selectors in DEFAULT_FIELD_SELECTORS.items():
+        for selector in selectors:
+            match = element.select_one(selector)
+            if match:
+                fields[field] = match
+                break
+    return fields
+
+
+def time_extraction(label: str, html: str, parser: str, extract) -> list:
+    """Parse the page with a tree builder and time field extraction per card."""
+    start = time.perf_counter()
+    soup = BeautifulSoup(html, parser)
+    build_seconds = time.perf_counter() - start
+
+    cards = soup.select(".event-card, .event-item")
+    start = time.perf_counter()
+    results = [extract(card) for card in cards]
+    extract_seconds = time.perf_counter() - start
+
+    per_element_us = extract_seconds / max(len(cards), 1) * 1e6
+    print(f"{label:28} tree build {build_seconds * 1000:8.1f} ms | "
+          f"{len(cards)} cards | {per_element_us:8.1f} µs/element")
+    return [{field: tag.get_text().strip() for field, tag in fields.items()} for fields in results]
+
+
+def build_events(num_events: int, seed: int = 11) -> list:
+    """Build synthetic events where roughly a third are near-duplicates of earlier ones."""
+    rng = random.Random(seed)
+    words = ["houston", "live", "night", "festival", "jazz", "rodeo", "art", "market", "family",
+             "downtown", "heights", "symphony", "comedy", "food", "truck", "bayou", "summer", "series"]
+    base = datetime(2026, 11, 1, 19, 0)
+    events = []
+    for i in range(num_events):
+        if events and rng.random() < 0.33:
+            original = rng.choice(events)
+            title = original.title if rng.random() < 0.5 else original.title + " " + rng.choice(words)
+            date = original.date + timedelta(hours=rng.choice([0, 6, 20, 30, 50]))
+        else:
+            title = " ".join(rng.sample(words, rng.randint(3, 6))) + f" {i}"
+            date = base + timedelta(days=rng.randint(0, 90), hours=rng.randint(0, 5))
+        events.append(HoustonEvent(title=title, description="", date=date))
+    return events
+
+
+def legacy_remove_duplicates(events: list) -> list:
+    """Original pairwise duplicate removal."""
+    from blog_automation.modules.houston_events_scraper import HoustonEventsScraper
+    similarity = HoustonEventsScraper._calculate_similarity
+
+    unique_events = []
+    for event in events:
+        if not any(similarity(None, event.title, kept.title) > 0.8 and abs((event.date - kept.date).days) <= 1
+                   for kept in unique_events):
+            unique_events.append(event)
+    return unique_events
+
+
+def indexed_remove_duplicates(events: list) -> list:
+    """Duplicate removal through the dedup index."""
+    index = EventDedupIndex.for_events(events)
+    return [event for event in events if index.add_if_unique(event)]
+
+
+def bench_dedup(num_events: int, legacy_limit: int) -> bool:
+    """Time duplicate removal and check the index matches the pairwise rule."""
+    events = build_events(num_events)
+
+    start = time.perf_counter()
+    indexed = indexed_remove_duplicates(events)
+    indexed_seconds = time.perf_counter() - start
+    print(f"{'dedup index':28} {num_events} events -> {len(indexed)} kept in {indexed_seconds * 1000:8.1f} ms")
+
+    legacy_events = events[:legacy_limit]
+    start = time.perf_counter()
+    legacy = legacy_remove_duplicates(legacy_events)
+    legacy_seconds = time.perf_counter() - start
+    print(f"{'pairwise (original)':28} {len(legacy_events)} events -> {len(legacy)} kept in {legacy_seconds * 1000:8.1f} ms")
+
+    matches = [id(e) for e in legacy] == [id(e) for e in indexed_remove_duplicates(legacy_events)]
+    print("✅ Dedup results match the pairwise rule" if matches else "❌ Dedup results differ from the pairwise rule")
+    return matches
+
+
+def bench_parse(num_cards: int) -> bool:
+    """Time field extraction before and after and check the outputs match."""
+    html = build_listing(num_cards)
+    compiled = get_field_extractor('benchmark')
+
+    before = time_extraction("before (html.parser, select)", html, 'html.parser', legacy_extract)
+    after = time_extraction(f"after ({HTML_PARSER}, compiled)", html, HTML_PARSER, compiled.extract)
+
+    if before == after:
+        print("✅ Extracted fields are identical")
+        return True
+
+    mismatches = sum(1 for old, new in zip(before, after) if old != new)
+    print(f"❌ {mismatches} cards extracted differently")
+    return False
+
+
+def load_corpus() -> list:
+    """Load the saved listing pages described by the fixture manifest."""
+    with open(FIXTURE_DIR / 'manifest.json', 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    return [
+        dict(entry, name=name, html=(FIXTURE_DIR / name).read_text(encoding='utf-8'))
+        for name, entry in manifest.items()
+    ]
+
+
+def record_fixtures(cache_dir: str) -> None:
+    """Refresh the corpus from snapshots in a page cache left by a live run."""
+    from blog_automation.modules.page_cache import PageCache
+
+    page_cache = PageCache(cache_dir=cache_dir, mode='on')
+    manifest_path = FIXTURE_DIR / 'manifest.json'
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    for name, entry in manifest.items():
+        cached = page_cache.get_stale(entry['url'])
+        if cached is None:
+            print(f"⏭️  No cached snapshot of {entry['url']} - keeping {name}")
+            continue
+        (FIXTURE_DIR / name).write_text(cached.html, encoding='utf-8')
+        print(f"💾 Saved {entry['url']} to {name}")
+
+    # Expected counts follow the new pages
+    scraper = make_scraper()
+    for entry in load_corpus():
+        soup = BeautifulSoup(entry['html'], HTML_PARSER)
+        manifest[entry['name']]['events'] = len(scraper._extract_listing_events(soup, get_source(entry['source']), None))
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+
+def make_scraper():
+    """Scraper whose caches live in the benchmark's temporary directory."""
+    from blog_automation.modules.houston_events_scraper import HoustonEventsScraper
+    from blog_automation.modules.scraper_metrics import ScraperMetrics
+    return HoustonEventsScraper(metrics=ScraperMetrics(enabled=False))
+
+
+def select_cards(soup: BeautifulSoup, source) -> list:
+    """Event cards on a listing page, chosen the way the scraper chooses them."""
+    for selector in source.event_selectors:
+        elements = soup.select(selector)
+        if len(elements) >= source.min_event_matches:
+            return elements
+    return []
+
+
+def scale_listing(html: str, source, num_cards: int) -> str:
+    """Grow a saved listing page to num_cards cards, numbering the copied titles."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    cards = select_cards(soup, source)
+    if not cards:
+        return html
+
+    container = cards[0].parent
+    for card in cards:
+        card.extract()
+
+    for i in range(num_cards):
+        card = copy.copy(cards[i % len(cards)])
+        heading = card.find(['h1', 'h2', 'h3', 'h4']) or card
+        title = heading.find(string=True)
+        if title is not None and i >= len(cards):
+            title.replace_with(f"{title} #{i}")
+        container.append(card)
+
+    # Scaled pages exercise the card heuristics, not structured data
+    for script in soup.select('script[type="application/ld+json"]'):
+        script.decompose()
+    return str(soup)
+
+
+def bench_corpus(scraper, corpus: list) -> bool:
+    """Check each saved page still parses to its expected number of events."""
+    ok = True
+    for entry in corpus:
+        soup = BeautifulSoup(entry['html'], HTML_PARSER)
+        events = scraper._extract_listing_events(soup, get_source(entry['source']), None)
+        matches = len(events) == entry['events']
+        ok = ok and matches
+        print(f"{'✅' if matches else '❌'} {entry['name']:32} {len(events):4d} events (expected {entry['events']})")
+    return ok
+
+
+def measure(label: str, run, items: list, repeat: int) -> dict:
+    """
+    Time a per-item function and trace its memory use.
+
+    Args:
+        label: Benchmark name
+        run: Function called once over all items
+        items: Inputs; throughput is reported per item
+        repeat: Timed repetitions, the best is kept
+
+    Returns:
+        Throughput in items per second and traced peak memory in KiB
+    """
+    run(items)  # Warm caches and lazily compiled selectors
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(items)
+        best = min(best, time.perf_counter() - start)
+
+    # Tracing slows everything down, so memory is measured on a separate pass
+    tracemalloc.start()
+    run(items)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {'items': len(items), 'ops_per_sec': round(len(items) / best, 1), 'peak_kib': round(peak / 1024, 1)}
+    print(f"{label:24} {len(items):6d} items | {result['ops_per_sec']:12,.0f} ops/s | "
+          f"{best * 1000:8.1f} ms | peak {result['peak_kib']:8.1f} KiB")
+    return result
+
+
+def bench_micro(num_cards: int, repeat: int) -> tuple:
+    """Run the scraper's parsing steps over the scaled corpus."""
+    scraper = make_scraper()
+    corpus = load_corpus()
+    ok = bench_corpus(scraper, corpus)
+    print()
+
+    elements = []
+    for entry in corpus:
+        source = get_source(entry['source'])
+        scaled = scale_listing(entry['html'], source, num_cards)
+        elements += [(card, source.name) for card in select_cards(BeautifulSoup(scaled, HTML_PARSER), source)]
+
+    events = [event for event in (scraper.parse_event_data(card, source) for card, source in elements) if event]
+    extractor = get_field_extractor('benchmark')
+    date_texts = [fields['date'].get_text().strip() for fields in (extractor.extract(card) for card, _ in elements)
+                  if 'date' in fields]
+    texts = [(event.title, event.description) for event in events]
+
+    results = {
+        'parse_event_data': measure('parse_event_data', lambda items: [scraper.parse_event_data(card, source) for card, source in items], elements, repeat),
+        '_parse_date': measure('_parse_date', lambda items: [scraper._parse_date(text) for text in items], date_texts, repeat),
+        '_determine_category': measure('_determine_category', lambda items: [scraper._determine_category(*text) for text in items], texts, repeat),
+        '_remove_duplicates': measure('_remove_duplicates', scraper._remove_duplicates, events, repeat),
+        '_calculate_event_score': measure('_calculate_event_score', lambda items: [scraper._calculate_event_score(event, BENCH_NOW) for event in items], events, repeat),
+    }
+    scraper.close()
+    return results, ok
+
+
+def compare_baseline(results: dict, baseline: dict, max_regression: float = None) -> bool:
+    """
+    Print throughput and memory changes against the stored baseline.
+
+    Returns:
+        False if max_regression is given and any throughput dropped by more than it
+    """
+    ok = True
+    print(f"\n{'benchmark':24} {'ops/s':>12} {'baseline':>12} {'change':>8} {'peak KiB':>10} {'baseline':>10}")
+    print("-" * 82)
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            print(f"{name:24} {result['ops_per_sec']:12,.0f} {'-':>12}")
+            continue
+        change = (result['ops_per_sec'] - base['ops_per_sec']) / base['ops_per_sec'] * 100
+        regressed = max_regression is not None and change < -max_regression
+        ok = ok and not regressed
+        print(f"{name:24} {result['ops_per_sec']:12,.0f} {base['ops_per_sec']:12,.0f} {change:+7.1f}% "
+              f"{result['peak_kib']:10.1f} {base['peak_kib']:10.1f}{'  ❌' if regressed else ''}")
+    return ok
+
+
+POST_SENTENCES = [
+    "Houston's {area} comes alive this weekend with {event}.",
+    "Grab tickets early: the {event} at {venue} sold out last year.",
+    "Families will love the kids' activities, food trucks and local art vendors near {venue}.",
+    "Parking in {area} fills up fast, so consider METRORail or a rideshare.",
+    "The lineup mixes live music, a short theatre performance and a chef demo.",
+    "Whether you're after a concert, a festival or a quiet gallery night, {area} has you covered.",
+    "Doors open at 7 PM and the show starts at 8 PM; the party continues on the patio.",
+    "Check the venue's website for accessibility information and the latest start times.",
+]
+
+
+def build_post_bodies(num_posts: int, seed: int = 13) -> list:
+    """Build synthetic event posts of roughly 1,200 words each."""
+    rng = random.Random(seed)
+    areas = [phrases[-1].title() for phrases in HOUSTON_AREAS.values()]
+    posts = []
+    for i in range(num_posts):
+        paragraphs = []
+        for _ in range(24):
+            sentences = [rng.choice(POST_SENTENCES).format(area=rng.choice(areas), event=rng.choice(TITLES),
+                                                           venue=rng.choice(VENUES)) for _ in range(rng.randint(4, 7))]
+            paragraphs.append(" ".join(sentences))
+        posts.append(f"# Houston Weekend Guide {i}\n\n" + "\n\n".join(paragraphs))
+    return posts
+
+
+def load_post_bodies(posts_dir: Path) -> list:
+    """Read the Markdown posts in a directory."""
+    return [path.read_text(encoding='utf-8') for path in sorted(posts_dir.glob('*.md'))]
+
+
+def legacy_keywords(text: str) -> dict:
+    """Original substring scans for categories, event types and areas."""
+    text = text.lower()
+    return {
+        'category': [category for category, keywords in EVENT_CATEGORIES.items() if any(k in text for k in keywords)],
+        'event_type': [event_type for event_type in EVENT_TYPES if event_type in text],
+        'area': [area for area in HOUSTON_AREAS if area in text],
+    }
+
+
+def build_gazetteer(num_terms: int, seed: int = 17) -> dict:
+    """Synthetic venue gazetteer of one- to three-word names."""
+    rng = random.Random(seed)
+    syllables = ["bel", "mor", "tan", "vi", "ros", "quen", "dal", "ter", "lio", "sar", "nev", "co"]
+    names = set()
+    while len(names) < num_terms:
+        words = ["".join(rng.sample(syllables, rng.randint(2, 3))) for _ in range(rng.randint(1, 3))]
+        names.add(" ".join(words))
+    return {name: [name] for name in sorted(names)}
+
+
+def time_scans(label: str, posts: list, scan, total_kb: float) -> list:
+    """Run a scan over every post and print its throughput."""
+    start = time.perf_counter()
+    results = [scan(post) for post in posts]
+    seconds = time.perf_counter() - start
+    print(f"{label:32} {len(posts)} posts ({total_kb:,.0f} KB) in {seconds * 1000:8.1f} ms | "
+          f"{total_kb / 1024 / seconds:6.1f} MB/s")
+    return results
+
+
+def bench_keywords(num_posts: int, posts_dir: str = None, gazetteer_terms: int = 1000) -> bool:
+    """Time keyword scans over full post bodies."""
+    posts = load_post_bodies(Path(posts_dir)) if posts_dir else build_post_bodies(num_posts)
+    if not posts:
+        print(f"❌ No posts found in {posts_dir}")
+        return False
+    total_kb = sum(len(post) for post in posts) / 1024
+
+    legacy = time_scans("substring scans (original)", posts, legacy_keywords, total_kb)
+    matched = time_scans("compiled matcher", posts, get_keyword_matcher().match, total_kb)
+
+    # Word boundaries change results by design; show how often
+    differing = sum(1 for old, new in zip(legacy, matched)
+                    if any(set(old[kind]) != set(new.get(kind, [])) for kind in old))
+    print(f"ℹ️  {differing} of {len(posts)} posts match differently once word boundaries apply")
+
+    # Substring scans cost one pass per term; the matcher's cost doesn't grow with the vocabulary
+    gazetteer = build_gazetteer(gazetteer_terms)
+    venues = KeywordMatcher({'venue': gazetteer})
+    print(f"\nWith a {gazetteer_terms}-term venue gazetteer:")
+    time_scans("substring scans", posts, lambda post: [name for name in gazetteer if name in post.lower()], total_kb)
+    time_scans("compiled matcher", posts, venues.match, total_kb)
+    return True
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark event parsing and deduplication")
+    parser.add_argument('--suite', choices=['parse', 'dedup', 'micro', 'keywords', 'all'], default='all',
+                        help='Benchmarks to run (default: all)')
+    parser.add_argument('--cards', type=int, default=2000, help='Number of synthetic cards (default: 2000)')
+    parser.add_argument('--events', type=int, default=10000, help='Number of synthetic events to dedup (default: 10000)')
+    parser.add_argument('--legacy-limit', type=int, default=3000,
+                        help='Events fed to the quadratic original dedup (default: 3000)')
+    parser.add_argument('--posts', type=int, default=200, help='Number of synthetic posts to scan (default: 200)')
+    parser.add_argument('--posts-dir', help='Scan the Markdown posts in this directory instead of synthetic ones')
+    parser.add_argument('--gazetteer', type=int, default=1000,
+                        help='Terms in the synthetic venue gazetteer (default: 1000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed repetitions per micro benchmark (default: 5)')
+    parser.add_argument('--save-baseline', action='store_true', help='Store the micro results as the new baseline')
+    parser.add_argument('--max-regression', type=float,
+                        help='Fail if any micro benchmark is more than this many percent slower than the baseline')
+    parser.add_argument('--record-fixtures', metavar='CACHE_DIR',
+                        help='Refresh the saved listing pages from a page cache directory, then exit')
+    args = parser.parse_args()
+
+    if args.record_fixtures:
+        record_fixtures(args.record_fixtures)
+        return
+
+    ok = True
+    if args.suite in ('parse', 'all'):
+        print(f"📊 Event parsing benchmark ({args.cards} cards)")
+        print("=" * 50)
+        ok = bench_parse(args.cards) and ok
+
+    if args.suite in ('dedup', 'all'):
+        print(f"\n📊 Event dedup benchmark ({args.events} events)")
+        print("=" * 50)
+        ok = bench_dedup(args.events, args.legacy_limit) and ok
+
+    if args.suite in ('keywords', 'all'):
+        print("\n📊 Keyword matching benchmark")
+        print("=" * 50)
+        ok = bench_keywords(args.posts, args.posts_dir, args.gazetteer) and ok
+
+    if args.suite in ('micro', 'all'):
+        print(f"\n📊 Scraper micro benchmarks ({args.cards} cards per saved page)")
+        print("=" * 50)
+        results, corpus_ok = bench_micro(args.cards, args.repeat)
+        ok = corpus_ok and ok
+
+        if args.save_baseline:
+            baseline = {'cards': args.cards, 'python': sys.version.split()[0], 'results': results}
+            with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(baseline, f, indent=2)
+                f.write('\n')
+            print(f"\n💾 Baseline saved to {BASELINE_PATH}")
+        elif BASELINE_PATH.exists():
+            with open(BASELINE_PATH, 'r', encoding='utf-8') as f:
+                ok = compare_baseline(results, json.load(f), args.max_regression) and ok
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Provides commands to generate blog posts, manage content, and configure the syst
 
 import asyncio
 import argparse
+import json
 import logging
 import sys
 from datetime import datetime
@@ -13,6 +14,7 @@ from pathlib import Path
 
 from .orchestrator import BlogAutomationOrchestrator
 from .config import config
+from .modules.scraper_metrics import load_metrics, summarize_metrics
 
 # Configure logging
 logging.basicConfig(
@@ -149,6 +151,33 @@ def show_status():
     print("\n" + "=" * 50)
 
 
+def show_metrics(runs: int = 1, source: str = None, stage: str = None, raw: bool = False):
+    """Show per-source, per-stage scraper timings from recent runs."""
+    records = load_metrics(runs=runs or None, source=source, stage=stage)
+    
+    if raw:
+        for record in records:
+            print(json.dumps(record))
+        return
+    
+    if not records:
+        print("No scraper metrics recorded yet")
+        return
+    
+    run_ids = list(dict.fromkeys(record.get('run_id') for record in records))
+    print(f"\n⏱️  Scraper Metrics ({len(run_ids)} run{'s' if len(run_ids) != 1 else ''}, latest {run_ids[-1]})")
+    print("=" * 96)
+    print(f"{'source':16} {'stage':15} {'count':>5} {'total s':>9} {'mean s':>8} {'p95 s':>8} {'max s':>8}  counters")
+    print("-" * 96)
+    
+    for row in summarize_metrics(records):
+        counters = ", ".join(f"{key}={value:g}" for key, value in sorted(row['counters'].items()))
+        print(f"{str(row['source']):16} {str(row['stage']):15} {row['count']:5d} {row['total']:9.3f} "
+              f"{row['mean']:8.3f} {row['p95']:8.3f} {row['max']:8.3f}  {counters}")
+    
+    print("\n" + "=" * 96)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -162,6 +191,7 @@ Examples:
   python -m blog_automation.cli generate --test                    # Generate and save test copy
   python -m blog_automation.cli config                             # Show configuration
   python -m blog_automation.cli status                             # Show system status
+  python -m blog_automation.cli metrics --runs 5                   # Show scraper stage timings
         """
     )
     
@@ -187,6 +217,22 @@ Examples:
     # Status command
     status_parser = subparsers.add_parser('status', help='Show system status')
     
+    # Metrics command
+    metrics_parser = subparsers.add_parser('metrics', help='Show Houston events scraper stage timings')
+    metrics_parser.add_argument(
+        '--runs',
+        type=int,
+        default=1,
+        help='Number of most recent runs to include, 0 for all (default: 1)'
+    )
+    metrics_parser.add_argument('--source', help='Only show this source (e.g. visit_houston)')
+    metrics_parser.add_argument('--stage', help='Only show this stage (e.g. navigate, wait, parse)')
+    metrics_parser.add_argument(
+        '--raw',
+        action='store_true',
+        help='Print the matching records as JSON lines'
+    )
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -204,6 +250,9 @@ Examples:
         elif args.command == 'status':
             show_status()
             
+        elif args.command == 'metrics':
+            show_metrics(runs=args.runs, source=args.source, stage=args.stage, raw=args.raw)
+            
     except KeyboardInterrupt:
         print("\n\n⏹️  Operation cancelled by user")
         sys.exit(1)
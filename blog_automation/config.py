@@ -91,7 +91,39 @@ class Config:
                 'enabled': os.getenv('HOUSTON_EVENTS_ENABLED', 'false').lower() == 'true',
                 'sources': os.getenv('HOUSTON_EVENTS_SOURCES', '').split(','),
                 'selenium_headless': os.getenv('SELENIUM_HEADLESS', 'true').lower() == 'true',
+                'lean_browser': os.getenv('SELENIUM_LEAN_BROWSER', 'true').lower() == 'true',
+                'driver_pool_size': int(os.getenv('SELENIUM_POOL_SIZE', '2')),
+                'session_max_navigations': int(os.getenv('SELENIUM_SESSION_MAX_NAVIGATIONS', '50')),
+                'session_max_rss_mb': int(os.getenv('SELENIUM_SESSION_MAX_RSS_MB', '1024')),
+                'reap_orphans': os.getenv('SELENIUM_REAP_ORPHANS', 'true').lower() == 'true',
+                'cache_dir': os.getenv('HOUSTON_EVENTS_CACHE_DIR', '.cache/houston_events'),
+                'max_concurrent_sources': int(os.getenv('HOUSTON_EVENTS_MAX_CONCURRENT_SOURCES', '4')),
+                'host_min_interval': float(os.getenv('HOUSTON_EVENTS_HOST_MIN_INTERVAL', '2.0')),
+                'host_max_concurrent': int(os.getenv('HOUSTON_EVENTS_HOST_MAX_CONCURRENT', '1')),
+                'http_timeout': float(os.getenv('HOUSTON_EVENTS_HTTP_TIMEOUT', '20')),
+                'tier_recheck_hours': float(os.getenv('HOUSTON_EVENTS_TIER_RECHECK_HOURS', '24')),
+                'feed_recheck_hours': float(os.getenv('HOUSTON_EVENTS_FEED_RECHECK_HOURS', '168')),
+                'enrich_details': os.getenv('HOUSTON_EVENTS_ENRICH_DETAILS', 'true').lower() == 'true',
+                'detail_max_concurrent': int(os.getenv('HOUSTON_EVENTS_DETAIL_CONCURRENCY', '6')),
+                'detail_host_min_interval': float(os.getenv('HOUSTON_EVENTS_DETAIL_HOST_MIN_INTERVAL', '0.5')),
+                'detail_host_max_concurrent': int(os.getenv('HOUSTON_EVENTS_DETAIL_HOST_MAX_CONCURRENT', '2')),
+                'detail_cache_ttl_hours': float(os.getenv('HOUSTON_EVENTS_DETAIL_CACHE_TTL_HOURS', '24')),
+                'source_time_budget': float(os.getenv('HOUSTON_EVENTS_SOURCE_TIME_BUDGET', '120')),
+                'source_max_events': int(os.getenv('HOUSTON_EVENTS_SOURCE_MAX_EVENTS', '50')),
+                'readiness_quiet_ms': int(os.getenv('HOUSTON_EVENTS_READINESS_QUIET_MS', '500')),
+                'readiness_poll_interval': float(os.getenv('HOUSTON_EVENTS_READINESS_POLL_INTERVAL', '0.1')),
+                'max_pages': int(os.getenv('HOUSTON_EVENTS_MAX_PAGES', '3')),
+                'page_cache_mode': os.getenv('HOUSTON_EVENTS_PAGE_CACHE', 'on').lower(),
+                'page_cache_ttl': int(os.getenv('HOUSTON_EVENTS_PAGE_CACHE_TTL', '1800')),
+                'page_cache_max_bytes': int(os.getenv('HOUSTON_EVENTS_PAGE_CACHE_MAX_MB', '100')) * 1024 * 1024,
+                'skip_seen_events': os.getenv('HOUSTON_EVENTS_SKIP_SEEN', 'true').lower() == 'true',
+                'seen_event_retention_days': int(os.getenv('HOUSTON_EVENTS_SEEN_RETENTION_DAYS', '60')),
+                'seen_event_max_rows': int(os.getenv('HOUSTON_EVENTS_SEEN_MAX_ROWS', '50000')),
+                'metrics_enabled': os.getenv('HOUSTON_EVENTS_METRICS', 'true').lower() == 'true',
+                'metrics_file': os.getenv('HOUSTON_EVENTS_METRICS_FILE', ''),
+                'metrics_max_bytes': int(os.getenv('HOUSTON_EVENTS_METRICS_MAX_MB', '10')) * 1024 * 1024,
                 'duplicate_check_days': int(os.getenv('EVENT_DUPLICATE_CHECK_DAYS', '30')),
+                'post_index_enabled': os.getenv('HOUSTON_EVENTS_POST_INDEX', 'true').lower() == 'true',
                 'min_event_score': float(os.getenv('EVENT_MIN_SCORE', '0.4')),
                 'categories': ['concerts', 'festivals', 'theatre', 'family', 'food', 'sports']
             }
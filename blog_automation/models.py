@@ -42,12 +42,14 @@ class HoustonEvent:
     description: str
     date: datetime
     time: Optional[str] = None
+    end_date: Optional[datetime] = None  # Last day of multi-day events
     venue: Optional[str] = None
     address: Optional[str] = None
     category: Optional[str] = None
     price: Optional[str] = None
     url: Optional[str] = None
     image_url: Optional[str] = None
+    score: Optional[float] = None  # Set once by the scraper's ranking stage
 
 
 @dataclass
@@ -0,0 +1,271 @@
+"""
+Browser Processes Module
+
+Process-level bookkeeping for pooled Chrome sessions: resident memory of a
+session's process tree (browser, renderers, GPU), and reaping of Chrome and
+ChromeDriver processes left behind by runs that crashed or were killed.
+Uses psutil when it is installed and falls back to /proc on Linux.
+"""
+
+import logging
+import os
+import re
+import shutil
+import signal
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+_PROC = Path('/proc')
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# Profile directories are named "<owner pid>-<suffix>" so orphans can be traced to their run
+_PROFILE_NAME_RE = re.compile(r'^(\d+)-[0-9a-f]+$')
+
+
+@dataclass
+class SessionMemory:
+    """Resident memory of one Chrome session's processes."""
+    total_rss: int      # Bytes across chromedriver, browser and child processes
+    renderer_rss: int   # Bytes in renderer processes only
+    processes: int
+
+    def to_dict(self) -> Dict:
+        """Convert memory stats to a plain dictionary."""
+        return asdict(self)
+
+
+def process_inspection_available() -> bool:
+    """Whether process memory and command lines can be read on this system."""
+    return psutil is not None or _PROC.is_dir()
+
+
+def _pids() -> Iterator[int]:
+    """Every process id on the system."""
+    if psutil is not None:
+        yield from psutil.pids()
+        return
+    for entry in _PROC.iterdir():
+        if entry.name.isdigit():
+            yield int(entry.name)
+
+
+def _parent(pid: int) -> Optional[int]:
+    """Parent process id, or None if the process is gone."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).ppid()
+        except psutil.Error:
+            return None
+    try:
+        stat = (_PROC / str(pid) / 'stat').read_text()
+        # The command name may contain spaces, so fields are counted after its closing parenthesis
+        return int(stat[stat.rindex(')') + 2:].split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _rss(pid: int) -> int:
+    """Resident set size of a process in bytes, 0 if unknown."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+    try:
+        return int((_PROC / str(pid) / 'statm').read_text().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _cmdline(pid: int) -> List[str]:
+    """Command line of a process, empty if unreadable."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).cmdline()
+        except psutil.Error:
+            return []
+    try:
+        return [arg for arg in (_PROC / str(pid) / 'cmdline').read_bytes().decode(errors='replace').split('\0') if arg]
+    except OSError:
+        return []
+
+
+def _is_zombie(pid: int) -> bool:
+    """Whether a process has exited but not yet been collected by its parent."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+    try:
+        stat = (_PROC / str(pid) / 'stat').read_text()
+        return stat[stat.rindex(')') + 2:].startswith('Z')
+    except (OSError, ValueError):
+        return False
+
+
+def is_alive(pid: int) -> bool:
+    """Whether a process exists and is still running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    except OSError:
+        return False
+    return not _is_zombie(pid)
+
+
+def process_tree(pid: int) -> List[int]:
+    """A process and all of its descendants."""
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            return [pid] + [child.pid for child in root.children(recursive=True)]
+        except psutil.Error:
+            return []
+
+    children: Dict[int, List[int]] = {}
+    for candidate in _pids():
+        parent = _parent(candidate)
+        if parent is not None:
+            children.setdefault(parent, []).append(candidate)
+
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, []))
+    return tree if any(is_alive(member) for member in tree) else []
+
+
+def session_memory(root_pid: int) -> SessionMemory:
+    """
+    Measure a session's memory from the ChromeDriver (or browser) process down.
+
+    Args:
+        root_pid: Process id at the top of the session's tree
+
+    Returns:
+        Total and renderer resident memory of the tree
+    """
+    total = renderer = 0
+    tree = process_tree(root_pid)
+    for pid in tree:
+        rss = _rss(pid)
+        total += rss
+        if '--type=renderer' in _cmdline(pid):
+            renderer += rss
+    return SessionMemory(total_rss=total, renderer_rss=renderer, processes=len(tree))
+
+
+def kill_processes(pids: List[int], grace: float = 3.0) -> int:
+    """
+    Terminate processes, killing any still alive after a grace period.
+
+    Returns:
+        Number of processes that were signalled
+    """
+    signalled = []
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            signalled.append(pid)
+        except OSError:
+            continue
+
+    deadline = time.monotonic() + grace
+    while signalled and time.monotonic() < deadline and any(is_alive(pid) for pid in signalled):
+        time.sleep(0.1)
+
+    for pid in signalled:
+        if is_alive(pid):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+    return len(signalled)
+
+
+def _find(predicate: Callable[[int, List[str]], bool]) -> List[int]:
+    """Process ids whose command line satisfies a predicate."""
+    own = os.getpid()
+    return [pid for pid in _pids() if pid != own and predicate(pid, _cmdline(pid))]
+
+
+def _profile_owner(cmdline: List[str], profile_root: str) -> Optional[int]:
+    """Owner pid encoded in a Chrome command line's profile directory directly in profile_root."""
+    for arg in cmdline:
+        if not arg.startswith('--user-data-dir='):
+            continue
+        profile_dir = Path(arg.split('=', 1)[1])
+        # Directly inside profile_root; a sibling such as "chrome-profiles-old" must not match
+        if profile_dir.parent == Path(profile_root):
+            match = _PROFILE_NAME_RE.match(profile_dir.name)
+            if match:
+                return int(match.group(1))
+    return None
+
+
+def _is_chromedriver(cmdline: List[str]) -> bool:
+    """Whether a command line runs a ChromeDriver binary."""
+    return bool(cmdline) and 'chromedriver' in Path(cmdline[0]).name.lower()
+
+
+def reap_orphans(profile_root: Path) -> int:
+    """
+    Kill browsers and drivers left behind by runs that are no longer alive.
+
+    Only processes traced to the pool are touched. A Chrome process is
+    orphaned when its profile directory under profile_root names an owner
+    process that has exited; a ChromeDriver process only when it is the
+    parent of such a browser. Drivers are never matched by binary path or
+    by having been re-parented, since other tools may run the same
+    chromedriver. Stale profile directories are removed as well.
+
+    Args:
+        profile_root: Directory holding the pool's per-session profiles
+
+    Returns:
+        Number of processes reaped
+    """
+    if not process_inspection_available():
+        return 0
+
+    root = str(Path(profile_root).resolve())
+
+    def orphaned_browser(pid: int, cmdline: List[str]) -> bool:
+        owner = _profile_owner(cmdline, root)
+        return owner is not None and owner != os.getpid() and not is_alive(owner)
+
+    browsers = _find(orphaned_browser)
+    drivers = set()
+    for pid in browsers:
+        parent = _parent(pid)
+        if parent is not None and parent not in browsers and _is_chromedriver(_cmdline(parent)):
+            drivers.add(parent)
+
+    orphans = sorted(drivers) + browsers
+    reaped = kill_processes(orphans) if orphans else 0
+
+    try:
+        for profile in Path(root).iterdir():
+            match = _PROFILE_NAME_RE.match(profile.name)
+            if match and int(match.group(1)) != os.getpid() and not is_alive(int(match.group(1))):
+                shutil.rmtree(profile, ignore_errors=True)
+    except OSError:
+        pass
+
+    if reaped:
+        logger.warning(f"Reaped {reaped} orphaned Chrome/ChromeDriver processes from earlier runs")
+    return reaped
@@ -0,0 +1,175 @@
+"""
+Browser Profile Module
+
+Lean Chrome profile for scraping listing pages. We only ever read the
+rendered DOM, so images, media, fonts and ad/analytics requests are blocked
+through the DevTools protocol, and each page load's transfer size, request
+count and load time is read back from Chrome's performance log.
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+# Resource types the DOM never needs; matched as URL patterns by Chrome
+BLOCKED_EXTENSIONS = [
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp',
+    'mp4', 'webm', 'mp3', 'm4a', 'ogg', 'wav', 'mov',
+    'woff', 'woff2', 'ttf', 'otf', 'eot',
+]
+
+# Ad, analytics and tag-manager hosts seen on the listing sites
+BLOCKED_HOSTS = [
+    'google-analytics.com', 'googletagmanager.com', 'googlesyndication.com', 'doubleclick.net',
+    'googleadservices.com', 'facebook.net', 'connect.facebook.net', 'hotjar.com', 'newrelic.com',
+    'nr-data.net', 'scorecardresearch.com', 'quantserve.com', 'adsrvr.org', 'criteo.com',
+    'taboola.com', 'outbrain.com', 'segment.io', 'cdn.segment.com', 'clarity.ms', 'tiktok.com',
+]
+
+BLOCKED_URL_PATTERNS = (
+    [f"*.{extension}" for extension in BLOCKED_EXTENSIONS]
+    + [f"*.{extension}?*" for extension in BLOCKED_EXTENSIONS]
+    + [f"*://*.{host}/*" for host in BLOCKED_HOSTS]
+    + [f"*://{host}/*" for host in BLOCKED_HOSTS]
+)
+
+_NAVIGATION_TIME_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+return nav ? (nav.loadEventEnd || nav.domContentLoadedEventEnd || null) : null;
+"""
+
+
+@dataclass
+class PageLoadStats:
+    """Transfer accounting for one page render."""
+    source: str
+    url: str
+    bytes_transferred: int
+    requests: int
+    blocked_requests: int
+    load_time: float  # Seconds until the load event, or wall time if unavailable
+
+    def to_dict(self) -> Dict:
+        """Convert stats to a plain dictionary."""
+        return asdict(self)
+
+
+def enable_performance_log(chrome_options: Options) -> None:
+    """Record DevTools network events for page accounting and feed discovery."""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def apply_lean_options(chrome_options: Options) -> None:
+    """Turn off image loading in a Chrome profile."""
+    chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--mute-audio")
+
+
+def enable_resource_blocking(driver: webdriver.Chrome) -> bool:
+    """
+    Block heavy resources and trackers for a session.
+
+    Uses Network.setBlockedURLs: Selenium's CDP bridge can't answer
+    Fetch.requestPaused events, and blocked URLs cost nothing per request.
+
+    Args:
+        driver: Chrome session
+
+    Returns:
+        True if blocking is active
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        return True
+    except WebDriverException as e:
+        logger.warning(f"Could not enable resource blocking: {e}")
+        return False
+
+
+def start_page_accounting(driver: webdriver.Chrome) -> float:
+    """Discard buffered performance log entries and return the start time."""
+    try:
+        driver.get_log('performance')
+    except WebDriverException:
+        pass
+    return time.monotonic()
+
+
+def read_network_events(driver: webdriver.Chrome) -> List[Dict]:
+    """
+    Drain the performance log into DevTools messages.
+
+    Args:
+        driver: Chrome session
+
+    Returns:
+        Messages with "method" and "params", oldest first
+    """
+    try:
+        entries = driver.get_log('performance')
+    except WebDriverException:
+        return []
+
+    messages = []
+    for entry in entries:
+        try:
+            messages.append(json.loads(entry['message'])['message'])
+        except (KeyError, ValueError):
+            continue
+    return messages
+
+
+def collect_page_stats(driver: webdriver.Chrome, source: str, url: str, started: float,
+                       messages: List[Dict]) -> PageLoadStats:
+    """
+    Summarize the network activity since start_page_accounting.
+
+    Args:
+        driver: Chrome session that rendered the page
+        source: Source identifier
+        url: Page URL
+        started: Value returned by start_page_accounting
+        messages: DevTools messages from read_network_events
+
+    Returns:
+        Transfer accounting for the page
+    """
+    bytes_transferred = requests = blocked = 0
+
+    for message in messages:
+        method = message.get('method')
+        params = message.get('params', {})
+        if method == 'Network.requestWillBeSent':
+            if not params.get('request', {}).get('url', '').startswith('data:'):
+                requests += 1
+        elif method == 'Network.loadingFinished':
+            bytes_transferred += int(params.get('encodedDataLength') or 0)
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            blocked += 1
+
+    load_time = time.monotonic() - started
+    try:
+        navigation_ms = driver.execute_script(_NAVIGATION_TIME_JS)
+        if navigation_ms:
+            load_time = navigation_ms / 1000
+    except WebDriverException:
+        pass
+
+    return PageLoadStats(
+        source=source,
+        url=url,
+        bytes_transferred=bytes_transferred,
+        requests=requests,
+        blocked_requests=blocked,
+        load_time=round(load_time, 3)
+    )
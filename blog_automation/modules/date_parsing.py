@@ -0,0 +1,214 @@
+"""
+Date Parsing Module
+
+Parses the event date strings our listing sources emit. The formats seen in
+practice (ISO timestamps, "Dec 5, 2026 7:30 PM", "12/05/2026", ranges such
+as "Oct 3 - Oct 5") are matched by precompiled patterns; dateutil's fuzzy
+parser is only used for anything else. Results are memoized by the
+normalized string, since listing pages repeat the same dates many times.
+Every result is a naive datetime in Houston local time.
+"""
+
+import logging
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+from dateutil import parser as date_parser
+from dateutil import tz
+
+logger = logging.getLogger(__name__)
+
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+_WEEKDAY = r'(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?,?\s+'
+_MONTH = r'(?P<month>jan|feb|mar|apr|may|jun|jul|aug|sept?|oct|nov|dec)[a-z]*\.?'
+_DAY = r'(?P<day>\d{1,2})(?:st|nd|rd|th)?'
+_YEAR = r'(?:,?\s+(?P<year>\d{4}))?'
+_TIME = r'(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<meridiem>[ap])\.?m\.?'
+_TIME_SEP = r'(?:\s*(?:,|@|at|-|\|)?\s*' + _TIME + r')?'
+
+_ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[t ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?(?:z|[+-]\d{2}:?\d{2})?')
+_MONTH_DAY_RE = re.compile(rf'(?:{_WEEKDAY})?{_MONTH}\s+{_DAY}{_YEAR}{_TIME_SEP}')
+_NUMERIC_RE = re.compile(rf'(?:{_WEEKDAY})?(?P<month>\d{{1,2}})/(?P<day>\d{{1,2}})(?:/(?P<year>\d{{4}}))?{_TIME_SEP}')
+_DAY_ONLY_RE = re.compile(rf'(?:{_WEEKDAY})?{_DAY}{_YEAR}{_TIME_SEP}')
+_TIME_ONLY_RE = re.compile(_TIME)
+_ISO_RANGE_RE = re.compile(rf'(?P<start>{_ISO_RE.pattern})\s*(?:[–—/]|-|to|through|until)\s*(?P<end>{_ISO_RE.pattern})')
+
+# Listings are for Houston events; offset timestamps are shown in Houston time
+HOUSTON_TZ = tz.gettz('America/Chicago')
+
+# En/em dashes and words always separate a range; a bare hyphen only when spaced or between day numbers
+_RANGE_SPLIT_RE = re.compile(r'\s*(?:[–—]|\s-\s|\s(?:to|through|thru|until)\s|(?<=\d)-(?=\d{1,2}\b))\s*')
+
+
+class ParsedDate(NamedTuple):
+    """A parsed event date, with the end of the range for multi-day events."""
+    start: datetime
+    end: Optional[datetime] = None
+    has_time: bool = False
+
+
+def to_houston_time(value: datetime) -> datetime:
+    """
+    Convert a datetime to naive Houston wall-clock time.
+
+    Naive values are taken to be Houston time already; aware values
+    (UTC "Z" timestamps, explicit offsets) are converted before their
+    timezone is dropped.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(HOUSTON_TZ).replace(tzinfo=None)
+
+
+def _time_of(match: re.Match) -> Optional[Tuple[int, int]]:
+    """24-hour (hour, minute) from a match's time groups, if it has a time."""
+    if not match.group('hour'):
+        return None
+    hour = int(match.group('hour')) % 12
+    if match.group('meridiem') == 'p':
+        hour += 12
+    return hour, int(match.group('minute') or 0)
+
+
+def _build(year: int, month: int, day: int, time_of_day: Optional[Tuple[int, int]]) -> datetime:
+    """Build a datetime, raising ValueError for impossible dates."""
+    hour, minute = time_of_day or (0, 0)
+    return datetime(year, month, day, hour, minute)
+
+
+def _parse_single(text: str, today: date) -> Optional[Tuple[datetime, bool]]:
+    """
+    Parse one date with the fast-path patterns.
+
+    Args:
+        text: Normalized date string
+        today: Date supplying the year when the string has none
+
+    Returns:
+        Tuple of (datetime, whether a time was given), or None if no pattern matched
+    """
+    if _ISO_RE.fullmatch(text):
+        parsed = datetime.fromisoformat(text.upper().replace('Z', '+00:00'))
+        return to_houston_time(parsed), len(text) > 10
+
+    match = _MONTH_DAY_RE.fullmatch(text)
+    if match:
+        month = _MONTHS[match.group('month')[:3]]
+    else:
+        match = _NUMERIC_RE.fullmatch(text)
+        if not match:
+            return None
+        month = int(match.group('month'))
+
+    time_of_day = _time_of(match)
+    year = int(match.group('year') or today.year)
+    return _build(year, month, int(match.group('day')), time_of_day), time_of_day is not None
+
+
+def _parse_range(start_text: str, end_text: str, today: date) -> Optional[ParsedDate]:
+    """Parse the two sides of a date range, letting each side borrow what the other omits."""
+    start = _parse_single(start_text, today)
+    if start is None:
+        return None
+    start_date, has_time = start
+
+    start_match = _MONTH_DAY_RE.fullmatch(start_text) or _NUMERIC_RE.fullmatch(start_text)
+    start_has_year = start_match is None or bool(start_match.group('year'))
+
+    full_match = _MONTH_DAY_RE.fullmatch(end_text) or _NUMERIC_RE.fullmatch(end_text)
+    # A bare time is checked before a bare day, or the "10" of "10:00 PM" reads as a day of the month
+    time_match = None if full_match else _TIME_ONLY_RE.fullmatch(end_text)
+    day_match = None if full_match or time_match else _DAY_ONLY_RE.fullmatch(end_text)
+
+    if full_match:
+        end_date = _parse_single(end_text, today)[0]
+        end_has_year = bool(full_match.group('year'))
+    elif time_match:
+        # "Dec 5, 7 PM - 9 PM": the same day, at a later time
+        end_date = _build(start_date.year, start_date.month, start_date.day, _time_of(time_match))
+        if end_date < start_date:
+            end_date += timedelta(days=1)
+        return ParsedDate(start_date, end_date, has_time)
+    elif day_match:
+        # "Dec 5-7, 2026": the end borrows the start's month
+        end_has_year = bool(day_match.group('year'))
+        end_date = _build(int(day_match.group('year') or start_date.year), start_date.month,
+                          int(day_match.group('day')), _time_of(day_match))
+    else:
+        return None
+
+    if end_has_year and not start_has_year:
+        # "Oct 3 - Oct 5, 2026": the trailing year applies to both sides
+        start_date = start_date.replace(year=end_date.year)
+    elif start_has_year and not end_has_year:
+        end_date = end_date.replace(year=start_date.year)
+
+    if end_date < start_date:
+        # "Dec 28 - Jan 3" crosses into the next year
+        if end_has_year and not start_has_year:
+            start_date = start_date.replace(year=start_date.year - 1)
+        elif not end_has_year:
+            end_date = end_date.replace(year=end_date.year + 1)
+
+    return ParsedDate(start_date, end_date, has_time)
+
+
+def normalize_date_text(text: str) -> str:
+    """Normalize a date string for matching and memoization."""
+    return re.sub(r'\s+', ' ', text.strip()).lower()
+
+
+@lru_cache(maxsize=4096)
+def _parse_normalized(text: str, today: date) -> Optional[ParsedDate]:
+    """Memoized parse of a normalized date string; today is part of the key."""
+    try:
+        parsed = _parse_single(text, today)
+        if parsed:
+            return ParsedDate(parsed[0], None, parsed[1])
+
+        # "2026-10-03 - 2026-10-05", "2026-10-03/2026-10-05": the hyphen rule below would split inside a date
+        iso_range = _ISO_RANGE_RE.fullmatch(text)
+        if iso_range:
+            start, has_time = _parse_single(iso_range.group('start'), today)
+            end = _parse_single(iso_range.group('end'), today)[0]
+            return ParsedDate(start, end, has_time)
+
+        parts = _RANGE_SPLIT_RE.split(text, maxsplit=1)
+        if len(parts) == 2 and parts[0] and parts[1]:
+            parsed_range = _parse_range(parts[0], parts[1], today)
+            if parsed_range:
+                return parsed_range
+    except ValueError:
+        # Impossible fast-path dates fall through to dateutil
+        pass
+
+    try:
+        # Last resort; same defaults the scraper has always used
+        default = datetime.combine(today, datetime.min.time())
+        return ParsedDate(to_houston_time(date_parser.parse(text, fuzzy=True, default=default)), None, False)
+    except (ValueError, OverflowError) as e:
+        logger.debug(f"Unparseable date '{text}': {e}")
+        return None
+
+
+def parse_event_date(text: str, now: Optional[datetime] = None) -> Optional[ParsedDate]:
+    """
+    Parse an event date or date range.
+
+    Args:
+        text: Date string as scraped
+        now: Reference time supplying the year when the string has none
+
+    Returns:
+        The parsed date, or None if the string could not be parsed
+    """
+    if not text or not text.strip():
+        return None
+    today = (now or datetime.now()).date()
+    return _parse_normalized(normalize_date_text(text), today)
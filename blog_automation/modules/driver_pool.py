@@ -0,0 +1,371 @@
+"""
+Driver Pool Module
+
+Keeps headless Chrome sessions warm across scraping runs so scheduled jobs
+don't pay the browser cold start and driver resolution cost on every run.
+Sessions are recycled after a number of navigations or once their renderer
+memory passes a ceiling, and processes orphaned by crashed runs are reaped.
+"""
+
+import atexit
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from ..config import config
+from .browser_processes import is_alive, kill_processes, process_tree, reap_orphans, session_memory
+from .browser_profile import apply_lean_options, enable_performance_log, enable_resource_blocking
+from .readiness import install_readiness_probe
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Memory readings younger than this are reused when deciding whether to recycle
+_MEMORY_STALE_SECONDS = 1.0
+
+
+@dataclass
+class SessionStats:
+    """Lifecycle and memory accounting for one pooled session."""
+    session_id: str
+    root_pid: Optional[int]
+    profile_dir: str
+    created: float
+    navigations: int = 0
+    leases: int = 0
+    current_rss: int = 0
+    peak_rss: int = 0
+    renderer_rss: int = 0
+    peak_renderer_rss: int = 0
+    measured_at: float = 0.0
+
+    def to_dict(self) -> Dict:
+        """Convert stats to a plain dictionary."""
+        return asdict(self)
+
+
+class DriverPool:
+    """Pool of reusable Chrome WebDriver sessions."""
+
+    def __init__(self, headless: bool = True, max_idle: int = None, cache_dir: str = None, lean: bool = None,
+                 max_navigations: int = None, max_rss_mb: int = None, reap: bool = None):
+        """
+        Initialize the driver pool.
+
+        Args:
+            headless: Whether to launch Chrome in headless mode
+            max_idle: Maximum number of idle sessions kept warm
+            cache_dir: Directory used to cache the resolved ChromeDriver path and session profiles
+            lean: Whether sessions block images, media, fonts and trackers
+            max_navigations: Navigations after which a session is replaced
+            max_rss_mb: Renderer memory in MB after which a session is replaced
+            reap: Whether to kill processes orphaned by earlier runs
+        """
+        self.headless = headless
+        self.lean = lean if lean is not None else config.get('houston_events.lean_browser', True)
+        self.max_idle = max_idle if max_idle is not None else config.get('houston_events.driver_pool_size', 2)
+        self.cache_dir = Path(cache_dir or config.get('houston_events.cache_dir', '.cache/houston_events'))
+        self.max_navigations = max_navigations or config.get('houston_events.session_max_navigations', 50)
+        self.max_rss = (max_rss_mb or config.get('houston_events.session_max_rss_mb', 1024)) * 1024 * 1024
+        self.reap = reap if reap is not None else config.get('houston_events.reap_orphans', True)
+        self.profile_root = self.cache_dir / 'chrome-profiles'
+        self.page_load_timeout = 60
+        self._idle: List[webdriver.Chrome] = []
+        self._sessions: Dict[int, SessionStats] = {}
+        self._driver_path: Optional[str] = None
+        self._lock = threading.Lock()
+        # Resolving ChromeDriver may download it, so it doesn't hold the pool lock
+        self._resolve_lock = threading.Lock()
+        self._closed = False
+        self._reaped = False
+
+    def driver_path(self) -> str:
+        """Resolve the ChromeDriver binary once and cache its path on disk."""
+        with self._lock:
+            if self._driver_path:
+                return self._driver_path
+
+        # Concurrent callers wait for one resolution; release and stats calls don't
+        with self._resolve_lock:
+            with self._lock:
+                if self._driver_path:
+                    return self._driver_path
+
+            driver_path = self._resolve_driver_path()
+            with self._lock:
+                self._driver_path = driver_path
+            return driver_path
+
+    def _resolve_driver_path(self) -> str:
+        """Find the ChromeDriver binary, downloading it if needed."""
+        cache_file = self.cache_dir / 'chromedriver_path'
+        if cache_file.exists():
+            cached_path = cache_file.read_text(encoding='utf-8').strip()
+            if cached_path and Path(cached_path).exists():
+                logger.info(f"Using cached ChromeDriver: {cached_path}")
+                return cached_path
+
+        # Resolve (and download if needed) ChromeDriver automatically
+        driver_path = ChromeDriverManager().install()
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(driver_path, encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not cache ChromeDriver path: {e}")
+
+        return driver_path
+
+    def _build_options(self, profile_dir: Path) -> Options:
+        """Build Chrome options for a scraping session."""
+        chrome_options = Options()
+
+        # A profile per session ties every Chrome process to this run, for orphan reaping
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+
+        if self.headless:
+            chrome_options.add_argument("--headless=new")  # Use new headless mode
+
+        # Anti-detection measures
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+
+        # More realistic user agent
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+
+        # Network events drive per-page accounting and JSON feed discovery
+        enable_performance_log(chrome_options)
+
+        if self.lean:
+            apply_lean_options(chrome_options)
+
+        return chrome_options
+
+    def reap_orphans(self) -> int:
+        """Kill Chrome and ChromeDriver processes left behind by crashed runs, once per pool."""
+        with self._lock:
+            if self._reaped or not self.reap:
+                return 0
+            self._reaped = True
+        return reap_orphans(self.profile_root)
+
+    def create_driver(self) -> webdriver.Chrome:
+        """Launch a new Chrome WebDriver session."""
+        session_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        profile_dir = (self.profile_root / session_id).resolve()
+        try:
+            driver_path = self.driver_path()
+            self.reap_orphans()
+            profile_dir.mkdir(parents=True, exist_ok=True)
+
+            service = Service(driver_path)
+            driver = webdriver.Chrome(service=service, options=self._build_options(profile_dir))
+            driver.set_page_load_timeout(self.page_load_timeout)
+
+            process = getattr(driver.service, 'process', None)
+            with self._lock:
+                self._sessions[id(driver)] = SessionStats(
+                    session_id=session_id,
+                    root_pid=process.pid if process else None,
+                    profile_dir=str(profile_dir),
+                    created=time.time()
+                )
+
+            # Execute script to hide automation indicators
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+            # Track in-flight requests and DOM mutations so renders can stop waiting early
+            install_readiness_probe(driver)
+
+            # Only the DOM is read, so skip downloading anything that doesn't affect it
+            if self.lean:
+                enable_resource_blocking(driver)
+
+            logger.info("Chrome WebDriver initialized successfully")
+            return driver
+
+        except Exception as e:
+            logger.error(f"Failed to setup Chrome WebDriver: {e}")
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+
+    def _is_healthy(self, driver: webdriver.Chrome) -> bool:
+        """Check that a pooled session still responds before reusing it."""
+        try:
+            driver.execute_script("return document.readyState")
+            return True
+        except WebDriverException:
+            return False
+
+    def _quit(self, driver: webdriver.Chrome) -> None:
+        """Quit a session, making sure none of its processes outlive it."""
+        with self._lock:
+            stats = self._sessions.pop(id(driver), None)
+        tree = process_tree(stats.root_pid) if stats and stats.root_pid else []
+
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting WebDriver: {e}")
+
+        # A hung or crashed browser can survive quit(); kill whatever is left of its tree
+        survivors = [pid for pid in tree if is_alive(pid)]
+        if survivors:
+            logger.warning(f"Killing {len(survivors)} Chrome processes that survived quit")
+            kill_processes(survivors)
+
+        if stats:
+            shutil.rmtree(stats.profile_dir, ignore_errors=True)
+
+    def navigated(self, driver: webdriver.Chrome) -> None:
+        """Count a page navigation against a pooled session."""
+        stats = self._sessions.get(id(driver))
+        if stats is not None:
+            stats.navigations += 1
+
+    def measure(self, driver: webdriver.Chrome) -> Optional[SessionStats]:
+        """
+        Refresh a session's current and peak memory.
+
+        Args:
+            driver: Pooled session
+
+        Returns:
+            The session's stats, or None for sessions the pool didn't create
+        """
+        stats = self._sessions.get(id(driver))
+        if stats is None or not stats.root_pid:
+            return stats
+
+        memory = session_memory(stats.root_pid)
+        stats.current_rss = memory.total_rss
+        stats.renderer_rss = memory.renderer_rss
+        stats.peak_rss = max(stats.peak_rss, memory.total_rss)
+        stats.peak_renderer_rss = max(stats.peak_renderer_rss, memory.renderer_rss)
+        stats.measured_at = time.monotonic()
+        return stats
+
+    def session_stats(self) -> List[SessionStats]:
+        """Stats of every live session created by the pool."""
+        with self._lock:
+            return list(self._sessions.values())
+
+    def _should_recycle(self, driver: webdriver.Chrome) -> bool:
+        """Whether a session has done enough work or grown enough to be replaced."""
+        stats = self._sessions.get(id(driver))
+        if stats is None:
+            return False
+
+        if stats.navigations >= self.max_navigations:
+            logger.info(f"Recycling WebDriver session {stats.session_id} after {stats.navigations} navigations")
+            return True
+
+        if time.monotonic() - stats.measured_at > _MEMORY_STALE_SECONDS:
+            self.measure(driver)
+        if stats.renderer_rss >= self.max_rss:
+            logger.info(f"Recycling WebDriver session {stats.session_id}: renderers use "
+                        f"{stats.renderer_rss / 1024 / 1024:.0f} MB")
+            return True
+
+        return False
+
+    def acquire(self) -> webdriver.Chrome:
+        """Lease a healthy warm session, launching a new one if none is idle."""
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+
+            if driver is None:
+                return self.create_driver()
+
+            if self._is_healthy(driver):
+                logger.debug("Reusing warm WebDriver session")
+                return driver
+
+            logger.info("Discarding unhealthy WebDriver session")
+            self._quit(driver)
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """Return a session to the pool, or quit it if the pool is full or it is due for recycling."""
+        stats = self._sessions.get(id(driver))
+        if stats is not None:
+            stats.leases += 1
+        if self._should_recycle(driver):
+            self._quit(driver)
+            return
+
+        try:
+            # Drop the previous page so idle sessions don't hold its memory
+            driver.get("about:blank")
+            driver.delete_all_cookies()
+        except WebDriverException:
+            self._quit(driver)
+            return
+
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(driver)
+                return
+
+        self._quit(driver)
+
+    @contextmanager
+    def lease(self):
+        """Context manager that acquires a session and releases it afterwards."""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """Quit every idle session held by the pool."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._closed = True
+
+        for driver in idle:
+            self._quit(driver)
+
+        if idle:
+            logger.info(f"Closed {len(idle)} pooled WebDriver sessions")
+
+
+_pools: Dict[bool, DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(headless: bool = True) -> DriverPool:
+    """Get the process-wide driver pool for the given headless mode."""
+    with _pools_lock:
+        pool = _pools.get(headless)
+        if pool is None or pool._closed:
+            pool = DriverPool(headless=headless)
+            _pools[headless] = pool
+        return pool
+
+
+@atexit.register
+def _close_pools() -> None:
+    """Quit pooled sessions when the interpreter exits."""
+    for pool in list(_pools.values()):
+        pool.close()
@@ -9,15 +9,67 @@ import asyncio
 import logging
 import time
 import random
+import re
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from .content_generator import ContentGenerator
 from ..models import TrendingTopic, EventTrendingTopic, HoustonEvent, BlogPost, ContentGenerationRequest, GenerationResult, ContentType
 from ..config import config
+from .keyword_matcher import HOUSTON_AREA_NAMES, KIND_AREA, get_keyword_matcher
 
 logger = logging.getLogger(__name__)
 
+_AMOUNT_RE = re.compile(r'\d[\d,]*(?:\.\d+)?')
+# Currency code written after an amount, as structured data prices are formatted ("25-40 USD")
+_CURRENCY_RE = re.compile(r'\d\s*([A-Z]{3})\b')
+# "1500 McKinney St, Houston, TX 77010" and the like, with an optional trailing country
+_US_ADDRESS_RE = re.compile(
+    r'^(?P<street>.+?),\s*(?P<locality>[^,]+?),\s*(?P<region>[A-Z]{2})\.?\s*(?P<postal>\d{5}(?:-\d{4})?)?'
+    r'(?:,?\s*(?:US|USA|United States))?$'
+)
+
+
+def _schema_offer(price: str) -> Optional[Dict[str, Any]]:
+    """
+    schema.org offer for a price string such as "Free", "$25" or "$25 - $50".
+
+    Returns:
+        An Offer with a numeric price, an AggregateOffer for a range, or None
+        if the string has no usable amount
+    """
+    match = _CURRENCY_RE.search(price)
+    currency = match.group(1) if match else 'USD'
+    amounts = [float(amount.replace(',', '')) for amount in _AMOUNT_RE.findall(price)]
+    if 'free' in price.lower():
+        amounts.append(0)
+
+    if not amounts:
+        return None
+    if min(amounts) == max(amounts):
+        return {"@type": "Offer", "price": amounts[0], "priceCurrency": currency}
+    return {"@type": "AggregateOffer", "lowPrice": min(amounts), "highPrice": max(amounts), "priceCurrency": currency}
+
+
+def _schema_address_fields(address: str) -> Dict[str, str]:
+    """
+    PostalAddress fields for a one-line address.
+
+    A US-style "street, city, ST zip" address is split into its components;
+    anything else is kept whole as the address name.
+    """
+    match = _US_ADDRESS_RE.match(address.strip())
+    if not match:
+        return {"name": address}
+    fields = {
+        "streetAddress": match.group('street'),
+        "addressLocality": match.group('locality'),
+        "addressRegion": match.group('region'),
+    }
+    if match.group('postal'):
+        fields["postalCode"] = match.group('postal')
+    return fields
+
 
 class EventContentGenerator(ContentGenerator):
     """Generates engaging blog content specifically for Houston events."""
@@ -117,7 +169,7 @@ Write like a Houston insider who loves helping people discover the best of what
 Write an engaging blog post about this Houston event:
 
 Event Title: {event.title}
-Date: {event.date.strftime('%A, %B %d, %Y')}
+Date: {event.date.strftime('%A, %B %d, %Y')}{' - ' + event.end_date.strftime('%A, %B %d, %Y') if event.end_date else ''}
 Venue: {event.venue or 'TBD'}
 Category: {event.category or 'General Event'}
 Description: {event.description or 'No description available'}
@@ -219,18 +271,10 @@ Target word count: {request.target_word_count} words
                 f"{event.venue} Houston"
             ])
         
-        # Add neighborhood keywords if we can identify them
-        houston_areas = [
-            'downtown Houston', 'Museum District', 'Heights', 'Montrose',
-            'Midtown Houston', 'River Oaks', 'Memorial', 'Galleria',
-            'Sugar Land', 'The Woodlands', 'Katy', 'Pearland'
-        ]
-        
-        # Check if venue or description mentions any Houston areas
-        search_text = f"{event.venue or ''} {event.description or ''}".lower()
-        for area in houston_areas:
-            if area.lower() in search_text:
-                keywords.append(f"{event.category} {area}")
+        # Add neighborhood keywords if the venue or description mentions any Houston areas
+        search_text = f"{event.venue or ''} {event.description or ''}"
+        for area in get_keyword_matcher().labels(search_text, KIND_AREA):
+            keywords.append(f"{event.category} {HOUSTON_AREA_NAMES[area]}")
         
         return keywords[:10]  # Limit to top 10 keywords
     
@@ -260,18 +304,21 @@ Target word count: {request.target_word_count} words
         }
         
         # Add optional fields if available
+        if event.end_date:
+            schema["endDate"] = event.end_date.isoformat()
+        
+        if event.address:
+            schema["location"]["address"].update(_schema_address_fields(event.address))
+        
         if event.url:
             schema["url"] = event.url
         
         if event.image_url:
             schema["image"] = event.image_url
         
-        if event.price:
-            schema["offers"] = {
-                "@type": "Offer",
-                "price": event.price,
-                "priceCurrency": "USD"
-            }
+        offer = _schema_offer(event.price) if event.price else None
+        if offer:
+            schema["offers"] = offer
         
         return schema
     
@@ -307,12 +354,10 @@ Target word count: {request.target_word_count} words
         }
         
         # Check venue location context
-        venue_text = (event.venue or '').lower()
-        description_text = (event.description or '').lower()
-        search_text = f"{venue_text} {description_text}"
+        areas = get_keyword_matcher().labels(f"{event.venue or ''} {event.description or ''}", KIND_AREA)
         
         for area, businesses in venue_context.items():
-            if area in search_text:
+            if area in areas:
                 business_mentions.extend(businesses[:2])  # Add up to 2 mentions per area
                 break
         
@@ -0,0 +1,142 @@
+"""
+Event Dedup Module
+
+Sub-quadratic duplicate detection for scraped events. Kept events are
+indexed by calendar day and by a prefix of their title tokens, so each new
+event is only compared against plausible candidates. Candidates are then
+verified with the same rule the scraper has always used: word Jaccard
+similarity above the threshold and dates at most one day apart.
+"""
+
+import math
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models import HoustonEvent
+
+# Pairs whose dates are at most a day apart can span up to two calendar days
+_DAY_WINDOW = 2
+
+
+class _Entry:
+    """Precomputed title data for an indexed event."""
+
+    __slots__ = ('event', 'normalized', 'tokens')
+
+    def __init__(self, event: HoustonEvent):
+        self.event = event
+        self.normalized = event.title.lower().strip()
+        self.tokens: Set[str] = set(self.normalized.split())
+
+
+class EventDedupIndex:
+    """Index of kept events used to reject near-duplicates."""
+
+    def __init__(self, threshold: float = 0.8, max_day_diff: int = 1,
+                 token_rank: Optional[Dict[str, int]] = None):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Title similarity above which events are duplicates
+            max_day_diff: Maximum day difference for events to be duplicates
+            token_rank: Global token order, rarest first; any fixed order is
+                correct, but rare-first keeps candidate lists short
+        """
+        self.threshold = threshold
+        self.max_day_diff = max_day_diff
+        self.token_rank = token_rank or {}
+        self._by_day_token: Dict[int, Dict[str, List[_Entry]]] = defaultdict(lambda: defaultdict(list))
+        self._empty_by_day: Dict[int, List[_Entry]] = defaultdict(list)
+
+    @classmethod
+    def for_events(cls, events: Iterable[HoustonEvent], **kwargs) -> 'EventDedupIndex':
+        """Build an empty index whose token order is tuned to a batch of events."""
+        frequencies = Counter()
+        for event in events:
+            frequencies.update(set(event.title.lower().split()))
+
+        ordered = sorted(frequencies.items(), key=lambda item: (item[1], item[0]))
+        token_rank = {token: rank for rank, (token, _) in enumerate(ordered)}
+        return cls(token_rank=token_rank, **kwargs)
+
+    def _prefix(self, tokens: Set[str]) -> List[str]:
+        """Title tokens that any sufficiently similar title must share at least one of."""
+        ordered = sorted(tokens, key=lambda token: (self.token_rank.get(token, len(self.token_rank)), token))
+        size = len(ordered)
+        prefix_length = size - math.ceil(self.threshold * size - 1e-9) + 1
+        return ordered[:max(prefix_length, 1)]
+
+    def _similarity(self, entry: _Entry, other: _Entry) -> float:
+        """Word Jaccard similarity, matching HoustonEventsScraper._calculate_similarity."""
+        if entry.normalized == other.normalized:
+            return 1.0
+        if not entry.tokens or not other.tokens:
+            return 0.0
+        intersection = len(entry.tokens & other.tokens)
+        return intersection / (len(entry.tokens) + len(other.tokens) - intersection)
+
+    def _candidates(self, entry: _Entry, prefix: List[str]) -> Iterable[_Entry]:
+        """Kept events on nearby days sharing a prefix token (or an empty title)."""
+        day = entry.event.date.toordinal()
+        seen: Set[int] = set()
+
+        for candidate_day in range(day - _DAY_WINDOW, day + _DAY_WINDOW + 1):
+            if not entry.tokens:
+                yield from self._empty_by_day.get(candidate_day, ())
+                continue
+
+            tokens = self._by_day_token.get(candidate_day)
+            if not tokens:
+                continue
+
+            for token in prefix:
+                for candidate in tokens.get(token, ()):
+                    if id(candidate) not in seen:
+                        seen.add(id(candidate))
+                        yield candidate
+
+    def find_duplicate(self, event: HoustonEvent) -> Optional[HoustonEvent]:
+        """Find an indexed event that the given event duplicates."""
+        return self._find(_Entry(event))[0]
+
+    def _find(self, entry: _Entry) -> Tuple[Optional[HoustonEvent], List[str]]:
+        """Look up a duplicate for an entry, returning its prefix for indexing."""
+        prefix = self._prefix(entry.tokens) if entry.tokens else []
+        size = len(entry.tokens)
+
+        for candidate in self._candidates(entry, prefix):
+            # Jaccard can't exceed the ratio of the smaller set to the larger
+            other_size = len(candidate.tokens)
+            if size and other_size and min(size, other_size) / max(size, other_size) <= self.threshold:
+                continue
+
+            date_diff = abs((entry.event.date - candidate.event.date).days)
+            if date_diff <= self.max_day_diff and self._similarity(entry, candidate) > self.threshold:
+                return candidate.event, prefix
+
+        return None, prefix
+
+    def add_if_unique(self, event: HoustonEvent) -> bool:
+        """
+        Index an event unless it duplicates one already indexed.
+
+        Args:
+            event: Event to add
+
+        Returns:
+            True if the event was unique and has been indexed
+        """
+        entry = _Entry(event)
+        duplicate, prefix = self._find(entry)
+        if duplicate is not None:
+            return False
+
+        day = event.date.toordinal()
+        if not entry.tokens:
+            self._empty_by_day[day].append(entry)
+        else:
+            day_tokens = self._by_day_token[day]
+            for token in prefix:
+                day_tokens[token].append(entry)
+        return True
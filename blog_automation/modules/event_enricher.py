@@ -0,0 +1,278 @@
+"""
+Event Enricher Module
+
+Fills in event details that listing cards don't carry (start time, street
+address, price) by fetching each event's detail page. Pages are fetched
+concurrently over plain HTTP with a global cap and a per-host limit, and
+the extracted fields are cached by URL so reruns don't refetch them.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from ..config import config
+from ..models import HoustonEvent
+from .date_parsing import parse_event_date
+from .event_extractor import HTML_PARSER, FieldExtractor
+from .host_limiter import HostRateLimiter
+from .page_cache import PageCache
+from .page_fetcher import HttpFetcher
+from .structured_data import extract_structured_events
+
+logger = logging.getLogger(__name__)
+
+# Fields an enrichment pass can fill
+ENRICHED_FIELDS = ('time', 'address', 'price')
+
+# Heuristic selectors for detail pages without structured data
+DETAIL_FIELD_SELECTORS: Dict[str, List[str]] = {
+    'time': ['.event-time', '.time', '[class*="time"]', 'time'],
+    'address': ['address', '[itemprop="address"]', '.address', '[class*="address"]', '[class*="location"]'],
+    'price': ['[itemprop="price"]', '.price', '.cost', '.admission', '[class*="price"]', '[class*="ticket"]'],
+}
+
+_TIME_RE = re.compile(r'\b(\d{1,2})(?::(\d{2}))?\s*([ap])\.?m\.?(?![a-z])', re.I)
+_PRICE_RE = re.compile(r'\$\s?\d+(?:\.\d{2})?(?:\s*[-–]\s*\$?\s?\d+(?:\.\d{2})?)?|\bfree\b', re.I)
+_MAX_ADDRESS_LENGTH = 200
+
+
+def _format_time(text: str) -> Optional[str]:
+    """First clock time in a string, formatted like the scraper's other times."""
+    match = _TIME_RE.search(text)
+    if not match:
+        return None
+    hour = int(match.group(1))
+    if not 1 <= hour <= 12:
+        return None
+    return f"{hour}:{match.group(2) or '00'} {match.group(3).upper()}M"
+
+
+def _format_date_time(value: str) -> Optional[str]:
+    """Clock time of a machine-readable date, such as an ISO <time datetime> value."""
+    parsed = parse_event_date(value)
+    if parsed and parsed.has_time:
+        return parsed.start.strftime('%I:%M %p').lstrip('0')
+    return None
+
+
+def _format_price(text: str) -> Optional[str]:
+    """Price or price range in a string, or "Free"."""
+    match = _PRICE_RE.search(text)
+    if not match:
+        return None
+    price = match.group(0)
+    return 'Free' if price.lower() == 'free' else re.sub(r'\s+', '', price).replace('-', ' - ').replace('–', ' - ')
+
+
+class DetailCache:
+    """Persisted detail fields keyed by event URL."""
+
+    def __init__(self, path: Path = None, ttl_hours: float = None):
+        """
+        Initialize the detail cache.
+
+        Args:
+            path: JSON file the cached fields are persisted to
+            ttl_hours: How long cached fields are reused
+        """
+        cache_dir = Path(config.get('houston_events.cache_dir', '.cache/houston_events'))
+        self.path = path or cache_dir / 'event_details.json'
+        self.ttl_hours = ttl_hours if ttl_hours is not None else config.get('houston_events.detail_cache_ttl_hours', 24)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load cached fields, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, url: str) -> Optional[Dict[str, str]]:
+        """Get fresh cached fields for a URL."""
+        entry = self.entries.get(url)
+        if not entry or time.time() - entry.get('fetched_at', 0) > self.ttl_hours * 3600:
+            return None
+        return entry['fields']
+
+    def put(self, url: str, fields: Dict[str, str]) -> None:
+        """Cache the fields extracted for a URL."""
+        with self._lock:
+            self.entries[url] = {'fields': fields, 'fetched_at': time.time()}
+
+    def save(self) -> None:
+        """Persist the cache, dropping expired entries."""
+        cutoff = time.time() - self.ttl_hours * 3600
+        with self._lock:
+            self.entries = {url: entry for url, entry in self.entries.items() if entry.get('fetched_at', 0) >= cutoff}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f)
+            except OSError as e:
+                logger.warning(f"Could not persist event details: {e}")
+
+
+class EventEnricher:
+    """Fetches event detail pages concurrently to fill missing fields."""
+
+    def __init__(self, max_concurrent: int = None, rate_limiter: HostRateLimiter = None,
+                 detail_cache: DetailCache = None, executor: Executor = None, page_cache: PageCache = None):
+        """
+        Initialize the enricher.
+
+        Args:
+            max_concurrent: Maximum detail pages fetched at once across all hosts
+            rate_limiter: Per-host limiter for detail page requests
+            detail_cache: Cache of extracted fields by URL
+            executor: Executor used for parsing detail pages
+            page_cache: Page cache shared with the scraper; in replay mode detail pages come only from it
+        """
+        self.max_concurrent = max_concurrent or config.get('houston_events.detail_max_concurrent', 6)
+        self.rate_limiter = rate_limiter or HostRateLimiter(
+            min_interval=config.get('houston_events.detail_host_min_interval', 0.5),
+            max_concurrent=config.get('houston_events.detail_host_max_concurrent', 2)
+        )
+        self.detail_cache = detail_cache or DetailCache()
+        self.executor = executor
+        self.page_cache = page_cache
+        # Fetched detail pages are recorded in the page cache so replay runs can read them offline
+        self.http_fetcher = HttpFetcher(limit_per_host=self.rate_limiter.max_concurrent, page_cache=page_cache)
+        self._extractor = FieldExtractor(DETAIL_FIELD_SELECTORS)
+
+    def _extract_details(self, html: str, event: HoustonEvent) -> Dict[str, str]:
+        """
+        Extract time, address and price from a detail page.
+
+        Args:
+            html: Detail page HTML
+            event: Event the page belongs to
+
+        Returns:
+            Extracted fields; missing ones are omitted
+        """
+        soup = BeautifulSoup(html, HTML_PARSER)
+        fields: Dict[str, str] = {}
+
+        # Structured data is exact; prefer the record for this event
+        records = extract_structured_events(soup)
+        title = event.title.lower().strip()
+        record = next((r for r in records if r['title'].lower().strip() == title), None)
+        if record is None and len(records) == 1:
+            record = records[0]
+
+        if record:
+            event_time = _format_date_time(record['start_date']) if record.get('start_date') else None
+            if event_time:
+                fields['time'] = event_time
+            if record.get('address'):
+                fields['address'] = record['address']
+            if record.get('price'):
+                fields['price'] = record['price']
+
+        missing = [field for field in ENRICHED_FIELDS if field not in fields]
+        if missing and soup.body:
+            found = self._extractor.extract(soup.body)
+
+            if 'time' in missing and 'time' in found:
+                tag = found['time']
+                # The datetime attribute is ISO (24-hour); fall back to the visible text when it has no time
+                event_time = _format_date_time(tag['datetime']) if tag.get('datetime') else None
+                event_time = event_time or _format_time(tag.get_text(' ', strip=True))
+                if event_time:
+                    fields['time'] = event_time
+
+            if 'address' in missing and 'address' in found:
+                address = found['address'].get_text(' ', strip=True)
+                if address and len(address) <= _MAX_ADDRESS_LENGTH:
+                    fields['address'] = address
+
+            if 'price' in missing and 'price' in found:
+                price = _format_price(found['price'].get('content') or found['price'].get_text(' ', strip=True))
+                if price:
+                    fields['price'] = price
+
+        return fields
+
+    async def _details_for(self, event: HoustonEvent, semaphore: asyncio.Semaphore) -> Optional[Dict[str, str]]:
+        """Cached or freshly fetched detail fields for an event."""
+        if self.page_cache is not None and self.page_cache.replay:
+            # Replay is offline and deterministic: recorded pages only, no live requests or field cache
+            recorded = self.page_cache.get(event.url)
+            if recorded is None:
+                logger.debug(f"No cached snapshot of {event.url} in replay mode")
+                return None
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self._extract_details, recorded.html, event)
+
+        cached = self.detail_cache.get(event.url)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            async with self.rate_limiter.limit(event.url):
+                html = await self.http_fetcher.fetch(event.url)
+
+        if not html:
+            return None
+
+        loop = asyncio.get_running_loop()
+        fields = await loop.run_in_executor(self.executor, self._extract_details, html, event)
+        self.detail_cache.put(event.url, fields)
+        return fields
+
+    async def enrich(self, events: List[HoustonEvent]) -> List[HoustonEvent]:
+        """
+        Fill missing time, address and price fields from detail pages.
+
+        Args:
+            events: Events to enrich in place
+
+        Returns:
+            The same events
+        """
+        pending = [
+            event for event in events
+            if event.url and event.url.startswith('http')
+            and any(getattr(event, field) is None for field in ENRICHED_FIELDS)
+        ]
+        if not pending:
+            return events
+
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        try:
+            results = await asyncio.gather(
+                *(self._details_for(event, semaphore) for event in pending),
+                return_exceptions=True
+            )
+        finally:
+            await self.http_fetcher.close()
+            self.detail_cache.save()
+
+        enriched = 0
+        for event, fields in zip(pending, results):
+            if isinstance(fields, Exception):
+                logger.warning(f"Error enriching {event.url}: {fields}")
+                continue
+            if not fields:
+                continue
+
+            filled = False
+            for field in ENRICHED_FIELDS:
+                if getattr(event, field) is None and fields.get(field):
+                    setattr(event, field, fields[field])
+                    filled = True
+            enriched += filled
+
+        logger.info(f"Enriched {enriched} of {len(pending)} events from detail pages")
+        return events
@@ -0,0 +1,144 @@
+"""
+Event Extractor Module
+
+Compiled, single-pass field extraction for event cards. Each source's field
+selectors are compiled once into cheap tag predicates, and every card's
+subtree is walked a single time to resolve all fields together instead of
+running one CSS query per selector per field.
+"""
+
+import logging
+import re
+from typing import Callable, Dict, List, Optional
+
+import soupsieve
+from bs4 import Tag
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Field selectors in priority order; the first selector that matches wins
+DEFAULT_FIELD_SELECTORS: Dict[str, List[str]] = {
+    'title': ['h1', 'h2', 'h3', '.title', '.event-title', '.name', '[class*="title"]', '[class*="name"]'],
+    'description': ['.description', '.summary', '.excerpt', 'p', '.content', '[class*="desc"]'],
+    'date': ['.date', '.datetime', '.when', '[class*="date"]', '[class*="time"]', 'time'],
+    'venue': ['.venue', '.location', '.where', '[class*="venue"]', '[class*="location"]'],
+    'link': ['a'],
+    'image': ['img'],
+}
+
+# Per-source overrides of DEFAULT_FIELD_SELECTORS
+SOURCE_FIELD_SELECTORS: Dict[str, Dict[str, List[str]]] = {}
+
+_TAG_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9]*$')
+_CLASS_RE = re.compile(r'^\.([-_a-zA-Z0-9]+)$')
+_CLASS_CONTAINS_RE = re.compile(r'''^\[class\*=["']([^"']+)["']\]$''')
+
+
+def compile_selector(selector: str) -> Callable[[Tag], bool]:
+    """
+    Compile a CSS selector into a predicate that matches a single tag.
+
+    Tag, class and class-substring selectors get dedicated fast predicates;
+    anything else falls back to a compiled soupsieve matcher.
+
+    Args:
+        selector: CSS selector
+
+    Returns:
+        Predicate taking a tag and returning whether it matches
+    """
+    selector = selector.strip()
+
+    if _TAG_RE.match(selector):
+        name = selector.lower()
+        return lambda tag: tag.name == name
+
+    class_match = _CLASS_RE.match(selector)
+    if class_match:
+        class_name = class_match.group(1)
+        return lambda tag: class_name in (tag.get('class') or ())
+
+    contains_match = _CLASS_CONTAINS_RE.match(selector)
+    if contains_match:
+        fragment = contains_match.group(1)
+        return lambda tag: fragment in ' '.join(tag.get('class') or ())
+
+    return soupsieve.compile(selector).match
+
+
+class FieldExtractor:
+    """Resolves every event field from a card in one subtree walk."""
+
+    def __init__(self, field_selectors: Dict[str, List[str]]):
+        """
+        Compile the field selectors.
+
+        Args:
+            field_selectors: Field name to selectors in priority order
+        """
+        self.fields = list(field_selectors)
+        self._matchers = [
+            [compile_selector(selector) for selector in field_selectors[field]]
+            for field in self.fields
+        ]
+
+    def extract(self, element: Tag) -> Dict[str, Tag]:
+        """
+        Find the element for each field within a card.
+
+        Matches `select_one` semantics per field: the highest-priority
+        selector with any match wins, and among its matches the first in
+        document order.
+
+        Args:
+            element: Event card element
+
+        Returns:
+            Field name to matched tag, for fields that matched
+        """
+        best: List[Optional[int]] = [None] * len(self.fields)
+        found: List[Optional[Tag]] = [None] * len(self.fields)
+        remaining = len(self.fields)
+
+        for tag in element.descendants:
+            if not isinstance(tag, Tag):
+                continue
+
+            for index, matchers in enumerate(self._matchers):
+                limit = best[index]
+                if limit == 0:
+                    continue
+
+                for priority, matches in enumerate(matchers if limit is None else matchers[:limit]):
+                    if matches(tag):
+                        best[index] = priority
+                        found[index] = tag
+                        if priority == 0:
+                            remaining -= 1
+                        break
+
+            # Every field already has its top-priority match
+            if remaining == 0:
+                break
+
+        return {field: tag for field, tag in zip(self.fields, found) if tag is not None}
+
+
+_extractors: Dict[str, FieldExtractor] = {}
+
+
+def get_field_extractor(source: str) -> FieldExtractor:
+    """Get the compiled field extractor for a source."""
+    extractor = _extractors.get(source)
+    if extractor is None:
+        field_selectors = dict(DEFAULT_FIELD_SELECTORS)
+        field_selectors.update(SOURCE_FIELD_SELECTORS.get(source, {}))
+        extractor = FieldExtractor(field_selectors)
+        _extractors[source] = extractor
+    return extractor
@@ -0,0 +1,135 @@
+"""
+Event Sources Module
+
+Registry of the event listing sites the Houston scraper knows how to read.
+Each source is a plugin describing where its listing lives, how to fetch
+and recognise it, and how much of a run it may use: a concurrency limit,
+a time budget and a quota of events.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+# Fetch strategies
+FETCH_AUTO = "auto"          # JSON feed, then plain HTTP, then Selenium
+FETCH_HTTP = "http"          # Never start a browser
+FETCH_SELENIUM = "selenium"  # Always render listing pages in a browser
+
+
+@dataclass
+class EventSource:
+    """A listing site the scraper can read events from."""
+    name: str
+    label: str
+    listing_url: str
+    base_url: str
+    container_selectors: List[str]
+    event_selectors: List[str]
+    hosts: List[str] = field(default_factory=list)
+    fetch_strategy: str = FETCH_AUTO
+    min_event_matches: int = 1          # Matches a card selector needs, to skip header/footer hits
+    keyword_fallback: bool = False      # Fall back to keyword search when no card selector matches
+    require_containers: bool = True     # Give up on a render when no container appears
+    min_interval: Optional[float] = None  # Seconds between requests to the host; None uses the limiter default
+    max_concurrent: Optional[int] = None
+    time_budget: Optional[float] = None
+    max_events: Optional[int] = None
+
+    def __post_init__(self):
+        """Fill limits left unset from configuration."""
+        if not self.hosts:
+            host = urlparse(self.listing_url).netloc.lower()
+            self.hosts = [host[4:] if host.startswith('www.') else host]
+        if self.max_concurrent is None:
+            self.max_concurrent = config.get('houston_events.host_max_concurrent', 1)
+        if self.time_budget is None:
+            self.time_budget = config.get('houston_events.source_time_budget', 120.0)
+        if self.max_events is None:
+            self.max_events = config.get('houston_events.source_max_events', 50)
+
+    def matches(self, source_url: str) -> bool:
+        """Whether a configured source URL refers to this source."""
+        return any(host in source_url.lower() for host in self.hosts)
+
+    def absolute_url(self, url: str) -> str:
+        """Resolve a site-relative link or image path against the source's base URL."""
+        return self.base_url + url if url.startswith('/') else url
+
+
+_sources: Dict[str, EventSource] = {}
+
+
+def register_source(source: EventSource) -> EventSource:
+    """Register (or replace) a source plugin."""
+    _sources[source.name] = source
+    return source
+
+
+def get_source(name: str) -> Optional[EventSource]:
+    """Get a registered source by name."""
+    return _sources.get(name)
+
+
+def source_for_url(source_url: str) -> Optional[EventSource]:
+    """Find the registered source a configured source URL belongs to."""
+    for source in _sources.values():
+        if source.matches(source_url):
+            return source
+    return None
+
+
+def registered_sources() -> List[EventSource]:
+    """All registered sources, in registration order."""
+    return list(_sources.values())
+
+
+VISIT_HOUSTON = register_source(EventSource(
+    name='visit_houston',
+    label="Visit Houston",
+    listing_url="https://www.visithoustontexas.com/events/events-this-weekend/",
+    base_url="https://www.visithoustontexas.com",
+    container_selectors=[
+        "[data-testid='event-card']",
+        ".event-item",
+        ".event-listing",
+        ".event-card",
+        ".card",
+        "[class*='event']",
+        "[class*='Event']",
+        ".listing",
+        ".item"
+    ],
+    event_selectors=[
+        "[data-testid='event-card']",
+        ".event-item",
+        ".event-listing",
+        ".event-card",
+        ".card",
+        "[class*='event']",
+        "[class*='Event']",
+        ".listing",
+        ".item",
+        "article",
+        ".post",
+        ".entry"
+    ],
+    min_event_matches=2,
+    keyword_fallback=True,
+    require_containers=False,
+    min_interval=3.5,
+))
+
+HOU_CALENDAR = register_source(EventSource(
+    name='hou_calendar',
+    label="HouCalendar",
+    listing_url="https://www.houcalendar.com/",
+    base_url="https://www.houcalendar.com",
+    container_selectors=[".event", ".event-item", "[class*='event']"],
+    event_selectors=[".event", ".event-item", "[class*='event']", ".listing"],
+))
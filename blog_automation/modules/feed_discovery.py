@@ -0,0 +1,311 @@
+"""
+Feed Discovery Module
+
+Many listing pages are filled in by the browser from a JSON endpoint after
+load. While a page renders in Selenium, the JSON responses it received are
+inspected for arrays of event-like objects; the best match is remembered
+per source so later runs can call the endpoint directly over HTTP and skip
+both the browser and the DOM heuristics.
+"""
+
+import base64
+import html
+import json
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from ..config import config
+from .date_parsing import HOUSTON_TZ
+
+logger = logging.getLogger(__name__)
+
+# Candidate keys for each event field, matched case-insensitively
+FEED_FIELD_KEYS: Dict[str, List[str]] = {
+    'title': ['title', 'name', 'eventname', 'event_name', 'headline'],
+    'start_date': ['startdate', 'start_date', 'start', 'starttime', 'start_time', 'startdatetime',
+                   'date', 'eventdate', 'event_date', 'datestart', 'nextdate', 'dates'],
+    'end_date': ['enddate', 'end_date', 'end', 'endtime', 'end_time', 'enddatetime', 'dateend'],
+    'description': ['description', 'summary', 'excerpt', 'teaser', 'shortdescription', 'short_description'],
+    'venue': ['venue', 'venuename', 'venue_name', 'location', 'locationname', 'location_name', 'place'],
+    'address': ['address', 'streetaddress', 'street_address', 'fulladdress'],
+    'price': ['price', 'cost', 'admission', 'pricerange', 'price_range'],
+    'url': ['url', 'link', 'permalink', 'detailurl', 'detail_url', 'absoluteurl', 'href'],
+    'image_url': ['image', 'imageurl', 'image_url', 'thumbnail', 'photo', 'media'],
+}
+
+_MIN_FEED_ITEMS = 2
+_MAX_DEPTH = 6
+_TAG_RE = re.compile(r'<[^>]+>')
+
+JsonPath = List[Union[str, int]]
+
+
+def _clean(value: Any) -> Optional[str]:
+    """Plain text for a feed value, with markup and entities removed."""
+    if value is None or isinstance(value, (dict, list, bool)):
+        return None
+    text = html.unescape(_TAG_RE.sub(' ', str(value)))
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text or None
+
+
+def _lookup(item: Dict, field: str) -> Any:
+    """Value of the first candidate key for a field present in an item."""
+    keys = {key.lower(): key for key in item}
+    for candidate in FEED_FIELD_KEYS[field]:
+        if candidate in keys:
+            value = item[keys[candidate]]
+            if value not in (None, '', [], {}):
+                return value
+    return None
+
+
+def _date_text(value: Any) -> Optional[str]:
+    """ISO date text from a string, epoch timestamp or nested date object."""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = _lookup(value, 'start_date') or value.get('value')
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Epoch seconds or milliseconds
+        seconds = value / 1000 if value > 1e11 else value
+        # Epochs are absolute; show them in Houston time whatever the machine's timezone
+        return datetime.fromtimestamp(seconds, HOUSTON_TZ).replace(tzinfo=None).isoformat()
+    return _clean(value)
+
+
+def _named_text(value: Any, *keys: str) -> Optional[str]:
+    """Text of a value that may be an object carrying the text under one of keys."""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        for key in keys:
+            if value.get(key):
+                return _clean(value[key])
+        return None
+    return _clean(value)
+
+
+def _address_text(item: Dict, venue: Any) -> Optional[str]:
+    """Address from the item or from a nested venue object."""
+    address = _lookup(item, 'address')
+    if address is None and isinstance(venue, dict):
+        address = _lookup(venue, 'address')
+    if isinstance(address, dict):
+        parts = [_clean(address.get(key)) for key in
+                 ('streetAddress', 'street', 'address1', 'addressLocality', 'city', 'addressRegion', 'state', 'postalCode', 'zip')]
+        return ', '.join(part for part in parts if part) or None
+    return _clean(address)
+
+
+def feed_item_record(item: Dict) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Flatten a feed item into the record shape used for structured data.
+
+    Args:
+        item: One object from an event feed
+
+    Returns:
+        Record with title, dates, venue, address, price, url and image_url,
+        or None if the item has no title
+    """
+    title = _named_text(_lookup(item, 'title'), 'rendered', 'text', 'value')
+    if not title:
+        return None
+
+    venue = _lookup(item, 'venue')
+    price = _lookup(item, 'price')
+    if isinstance(price, (int, float)) and not isinstance(price, bool):
+        price = 'Free' if price == 0 else f"${price:g}"
+
+    return {
+        'title': title,
+        'description': _named_text(_lookup(item, 'description'), 'rendered', 'text', 'value') or "",
+        'start_date': _date_text(_lookup(item, 'start_date')),
+        'end_date': _date_text(_lookup(item, 'end_date')),
+        'venue': _named_text(venue, 'name', 'title'),
+        'address': _address_text(item, venue),
+        'price': _clean(price),
+        'url': _named_text(_lookup(item, 'url'), 'href', 'url'),
+        'image_url': _named_text(_lookup(item, 'image_url'), 'url', 'src', 'href'),
+    }
+
+
+def _looks_like_event(item: Any) -> bool:
+    """Whether an object has both a title-like and a date-like key."""
+    return isinstance(item, dict) and _lookup(item, 'title') is not None and _lookup(item, 'start_date') is not None
+
+
+def find_event_list(payload: Any) -> Optional[Tuple[JsonPath, int]]:
+    """
+    Find the array of event-like objects in a JSON payload.
+
+    Args:
+        payload: Decoded JSON
+
+    Returns:
+        Tuple of (path of keys and indices to the array, number of events), or None
+    """
+    best: Optional[Tuple[JsonPath, int]] = None
+    stack: List[Tuple[Any, JsonPath]] = [(payload, [])]
+
+    while stack:
+        node, path = stack.pop()
+        if len(path) > _MAX_DEPTH:
+            continue
+
+        if isinstance(node, list):
+            count = sum(1 for item in node if _looks_like_event(item))
+            if count >= _MIN_FEED_ITEMS and count * 2 >= len(node) and (best is None or count > best[1]):
+                best = (path, count)
+            # Arrays of wrappers (e.g. search hits) may hold the events one level down
+            for index, item in enumerate(node[:1]):
+                stack.append((item, path + [index]))
+        elif isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, (dict, list)):
+                    stack.append((value, path + [key]))
+
+    return best
+
+
+def parse_feed(body: str, feed: Dict) -> Optional[List[Dict[str, Optional[str]]]]:
+    """
+    Map a feed response into event records.
+
+    Args:
+        body: Response body
+        feed: Feed spec recorded by discovery
+
+    Returns:
+        Event records, or None if the response no longer has the recorded shape
+    """
+    try:
+        node = json.loads(body)
+        for key in feed['items_path']:
+            node = node[key]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
+
+    if not isinstance(node, list):
+        return None
+
+    records = [record for record in (feed_item_record(item) for item in node if isinstance(item, dict)) if record]
+    return records or None
+
+
+def discover_event_feed(driver: webdriver.Chrome, messages: List[Dict], page_url: str) -> Optional[Dict]:
+    """
+    Find the JSON endpoint a rendered page loaded its events from.
+
+    Args:
+        driver: Chrome session still showing the page
+        messages: DevTools messages recorded while the page rendered
+        page_url: Listing page URL
+
+    Returns:
+        Feed spec with the endpoint URL and the path to its event array, or None
+    """
+    methods: Dict[str, str] = {}
+    candidates: List[Tuple[str, str]] = []
+
+    for message in messages:
+        params = message.get('params', {})
+        if message.get('method') == 'Network.requestWillBeSent':
+            methods[params.get('requestId')] = params.get('request', {}).get('method', 'GET')
+        elif message.get('method') == 'Network.responseReceived':
+            response = params.get('response', {})
+            if 'json' in response.get('mimeType', '') and response.get('status') == 200:
+                candidates.append((params.get('requestId'), response.get('url')))
+
+    best: Optional[Dict] = None
+    for request_id, url in candidates:
+        # Only GET endpoints can be replayed without the page's request body
+        if methods.get(request_id, 'GET') != 'GET':
+            continue
+
+        try:
+            response = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            body = response.get('body', '')
+            if response.get('base64Encoded'):
+                body = base64.b64decode(body).decode('utf-8', errors='replace')
+            found = find_event_list(json.loads(body))
+        except (WebDriverException, ValueError) as e:
+            logger.debug(f"Skipping response from {url}: {e}")
+            continue
+
+        if found and (best is None or found[1] > best['events']):
+            best = {'url': url, 'page_url': page_url, 'items_path': found[0], 'events': found[1]}
+
+    if best:
+        logger.info(f"Discovered event feed {best['url']} with {best['events']} events")
+    return best
+
+
+class FeedRegistry:
+    """Persisted per-source record of discovered event feeds."""
+
+    def __init__(self, path: Path = None, recheck_hours: float = None):
+        """
+        Initialize the feed registry.
+
+        Args:
+            path: JSON file the feeds are persisted to
+            recheck_hours: How long to wait before looking for a feed again after finding none
+        """
+        cache_dir = Path(config.get('houston_events.cache_dir', '.cache/houston_events'))
+        self.path = path or cache_dir / 'event_feeds.json'
+        self.recheck_hours = recheck_hours if recheck_hours is not None else config.get('houston_events.feed_recheck_hours', 168)
+        self._lock = threading.Lock()
+        self.feeds: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load discovered feeds, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self) -> None:
+        """Persist the registry."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.feeds, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not persist event feeds: {e}")
+
+    def get(self, source: str) -> Optional[Dict]:
+        """Get the working feed for a source."""
+        return self.feeds.get(source, {}).get('feed')
+
+    def should_discover(self, source: str) -> bool:
+        """Whether a render of this source should look for a feed."""
+        entry = self.feeds.get(source)
+        if not entry:
+            return True
+        if entry.get('feed'):
+            return False
+        return time.time() - entry.get('checked', 0) > self.recheck_hours * 3600
+
+    def record(self, source: str, feed: Optional[Dict]) -> None:
+        """Record the outcome of discovery for a source."""
+        with self._lock:
+            self.feeds[source] = {'feed': feed, 'checked': time.time()}
+            self._save()
+
+    def invalidate(self, source: str) -> None:
+        """Forget a feed that stopped working so the browser rediscovers it."""
+        with self._lock:
+            if self.feeds.pop(source, None) is not None:
+                logger.warning(f"Event feed for {source} stopped working - will rediscover")
+                self._save()
@@ -0,0 +1,95 @@
+"""
+Host Limiter Module
+
+Per-host politeness limiting for the scrapers: caps concurrent requests to
+each host and spaces out request starts, while requests to different hosts
+proceed in parallel.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+
+class HostRateLimiter:
+    """Limits request rate and concurrency per host."""
+
+    def __init__(self, min_interval: float = None, max_concurrent: int = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            min_interval: Minimum seconds between request starts to the same host
+            max_concurrent: Maximum in-flight requests per host
+        """
+        self.min_interval = min_interval if min_interval is not None else config.get('houston_events.host_min_interval', 2.0)
+        self.max_concurrent = max_concurrent if max_concurrent is not None else config.get('houston_events.host_max_concurrent', 1)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_start: Dict[str, float] = {}
+        self._host_limits: Dict[str, Dict[str, float]] = {}
+
+    def configure_host(self, url: str, max_concurrent: int = None, min_interval: float = None) -> None:
+        """
+        Override the limits for one host.
+
+        Args:
+            url: Any URL on the host
+            max_concurrent: Maximum in-flight requests to the host
+            min_interval: Minimum seconds between request starts to the host
+        """
+        limits = self._host_limits.setdefault(self.host_for(url), {})
+        if max_concurrent is not None:
+            limits['max_concurrent'] = max_concurrent
+        if min_interval is not None:
+            limits['min_interval'] = min_interval
+
+    @staticmethod
+    def host_for(url: str) -> str:
+        """Get the normalized host name for a URL."""
+        host = urlparse(url).netloc.lower()
+        return host[4:] if host.startswith('www.') else host
+
+    def _reset_for_loop(self) -> None:
+        """Recreate asyncio primitives when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphores = {}
+            self._locks = {}
+
+    async def wait(self, url: str) -> None:
+        """Wait until a new request to the URL's host may start."""
+        self._reset_for_loop()
+        host = self.host_for(url)
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with lock:
+            elapsed = time.monotonic() - self._last_start.get(host, float('-inf'))
+            delay = self._host_limits.get(host, {}).get('min_interval', self.min_interval) - elapsed
+            if delay > 0:
+                logger.debug(f"Politeness delay of {delay:.2f}s for {host}")
+                await asyncio.sleep(delay)
+            self._last_start[host] = time.monotonic()
+
+    @asynccontextmanager
+    async def limit(self, url: str):
+        """Hold a per-host slot for the duration of a request."""
+        self._reset_for_loop()
+        host = self.host_for(url)
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            max_concurrent = self._host_limits.get(host, {}).get('max_concurrent', self.max_concurrent)
+            semaphore = self._semaphores[host] = asyncio.Semaphore(int(max_concurrent))
+
+        async with semaphore:
+            await self.wait(url)
+            yield
@@ -6,338 +6,855 @@ to handle JavaScript-heavy sites and dynamic content loading.
 """
 
 import asyncio
+import heapq
 import logging
 import time
-import random
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import AsyncIterator, Callable, Iterable, List, Dict, Optional, Tuple
+from urllib.parse import urljoin
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 import re
-from dateutil import parser as date_parser
 
 from ..models import HoustonEvent, EventTrendingTopic
 from ..config import config
+from .date_parsing import ParsedDate, parse_event_date
+from .browser_profile import PageLoadStats, collect_page_stats, read_network_events, start_page_accounting
+from .driver_pool import get_driver_pool
+from .event_enricher import EventEnricher
+from .feed_discovery import FeedRegistry, discover_event_feed, parse_feed
+from .host_limiter import HostRateLimiter
+from .page_fetcher import HttpFetcher, FetchTierLog, TIER_FEED, TIER_HTTP, TIER_SELENIUM
+from .page_cache import PageCache
+from .readiness import LatencyProfiles, wait_until_ready
+from .scraper_metrics import ScraperMetrics
+from .seen_event_store import SeenEventStore, SeenObservation, SEEN_NEW, SEEN_CHANGED, SEEN_UNCHANGED
+from .selector_cache import SelectorCache
+from .event_extractor import get_field_extractor, HTML_PARSER
+from .event_sources import EventSource, FETCH_HTTP, FETCH_SELENIUM, get_source, registered_sources, source_for_url
+from .event_dedup import EventDedupIndex
+from .keyword_matcher import KIND_CATEGORY, get_keyword_matcher
+from .structured_data import extract_structured_events, STRUCTURED_DATA_SELECTORS
 
 logger = logging.getLogger(__name__)
 
+# Pagination and "load more" links followed when crawling deeper than one page
+NEXT_PAGE_SELECTORS = [
+    "link[rel='next']",
+    "a[rel='next']",
+    ".pagination a.next",
+    "a.next",
+    "a[aria-label*='Next']",
+    "a[class*='load-more']",
+    "a[class*='loadMore']"
+]
+NEXT_PAGE_TEXT_RE = re.compile(r'^(next( page)?|load more|more events|show more)\s*[›»>]*$', re.I)
+
+# Script-driven "load more" buttons clicked in the Selenium tier
+LOAD_MORE_SELECTORS = ["button[class*='load-more']", "button[class*='loadMore']", "[data-action*='load-more']"]
+LOAD_MORE_XPATH = ("//button[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+                   "'abcdefghijklmnopqrstuvwxyz'), 'load more')]")
+
 
 class HoustonEventsScraper:
     """Scrapes Houston events from multiple sources using Selenium."""
     
-    def __init__(self):
-        """Initialize the Houston events scraper with Selenium configuration."""
-        self.driver = None
+    def __init__(self, page_cache: Optional[PageCache] = None, seen_events: Optional[SeenEventStore] = None,
+                 metrics: Optional[ScraperMetrics] = None):
+        """
+        Initialize the Houston events scraper with Selenium configuration.
+        
+        Args:
+            page_cache: Page cache to use; pass one in replay mode to scrape offline
+            seen_events: Store of events seen by earlier runs
+            metrics: Recorder for per-stage timings
+        """
         self.wait_timeout = 30
         self.sources = config.get('houston_events.sources', [])
         self.headless = config.get('houston_events.selenium_headless', True)
         self.categories = config.get('houston_events.categories', [])
+        self.driver_pool = get_driver_pool(self.headless)
+        self.rate_limiter = HostRateLimiter()
+        self.page_cache = page_cache or PageCache()
+        self.http_fetcher = HttpFetcher(page_cache=self.page_cache)
+        self.fetch_tiers = FetchTierLog()
+        self.selector_cache = SelectorCache()
+        self.latency_profiles = LatencyProfiles()
+        self.feed_registry = FeedRegistry()
+        self.seen_events = seen_events or SeenEventStore()
+        # Events of the last stream and how the seen-event store saw them, until the caller commits them
+        self._pending_seen: Dict[int, Tuple[HoustonEvent, SeenObservation]] = {}
+        # Blocking Selenium work runs here so sources don't stall the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.get('houston_events.max_concurrent_sources', 4),
+            thread_name_prefix="houston-scraper"
+        )
+        self.event_enricher = EventEnricher(executor=self._executor, page_cache=self.page_cache)
+        self.page_stats: List[PageLoadStats] = []
+        self.metrics = metrics or ScraperMetrics()
+        
+        # Each source's concurrency limit and politeness interval apply to its host
+        for source in registered_sources():
+            self.rate_limiter.configure_host(source.listing_url, max_concurrent=source.max_concurrent,
+                                             min_interval=source.min_interval)
+        
         logger.info("Houston Events Scraper initialized")
     
     def _setup_driver(self) -> webdriver.Chrome:
-        """Setup Chrome WebDriver with appropriate options."""
-        try:
-            chrome_options = Options()
-            
-            if self.headless:
-                chrome_options.add_argument("--headless=new")  # Use new headless mode
-            
-            # Anti-detection measures
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # More realistic user agent
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
-            # Install ChromeDriver automatically
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+        """Lease a warm Chrome WebDriver session from the shared pool."""
+        return self.driver_pool.acquire()
+    
+    def close(self) -> None:
+        """Quit the warm WebDriver sessions held for this scraper."""
+        self.driver_pool.close()
+        self._executor.shutdown(wait=False)
+        self.seen_events.close()
+        logger.info("WebDriver pool closed")
+    
+    async def _run_with_driver(self, source: str, scrape_fn: Callable[[webdriver.Chrome], List[HoustonEvent]],
+                               driver: Optional[webdriver.Chrome] = None) -> List[HoustonEvent]:
+        """Run a blocking Selenium scrape in the executor on its own driver."""
+        def run() -> List[HoustonEvent]:
+            if driver is not None:
+                return scrape_fn(driver)
+            
+            # Lease a warm session per source; it goes back to the pool afterwards
+            started = time.monotonic()
+            with self.driver_pool.lease() as leased_driver:
+                self.metrics.record(source, 'driver', time.monotonic() - started)
+                try:
+                    return scrape_fn(leased_driver)
+                finally:
+                    # Measured before release, which may recycle the session
+                    stats = self.driver_pool.measure(leased_driver)
+                    if stats is not None:
+                        self.metrics.record(source, 'browser_memory', 0.0,
+                                            session=stats.session_id,
+                                            navigations=stats.navigations,
+                                            rss_mb=round(stats.current_rss / 1024 / 1024, 1),
+                                            peak_rss_mb=round(stats.peak_rss / 1024 / 1024, 1),
+                                            renderer_rss_mb=round(stats.renderer_rss / 1024 / 1024, 1))
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, run)
+    
+    @asynccontextmanager
+    async def _host_slot(self, source: EventSource, url: str):
+        """Hold the host limiter for a request, recording how long the slot took to get."""
+        started = time.monotonic()
+        async with self.rate_limiter.limit(url):
+            self.metrics.record(source.name, 'host_wait', time.monotonic() - started)
+            yield
+    
+    async def _crawl_source(self, source: EventSource, max_pages: int) -> AsyncIterator[HoustonEvent]:
+        """
+        Crawl a source's listing pages, following pagination.
+        
+        Args:
+            source: Source plugin
+            max_pages: Maximum number of listing pages to visit
             
-            # Execute script to hide automation indicators
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        Yields:
+            Events as each page is parsed
+        """
+        url = source.listing_url
+        visited = set()
+        total = 0
+        
+        for page_number in range(max_pages):
+            if url in visited:
+                break
+            visited.add(url)
+            
+            # Script-driven "load more" buttons are clicked within the first render
+            events, next_url = await self._scrape_page(
+                source, url, limit=None, load_more_clicks=max_pages - 1 if page_number == 0 else 0
+            )
             
-            logger.info("Chrome WebDriver initialized successfully")
-            return driver
+            total += len(events)
+            for event in events:
+                yield event
             
-        except Exception as e:
-            logger.error(f"Failed to setup Chrome WebDriver: {e}")
-            raise
+            if not next_url:
+                break
+            url = next_url
+        
+        logger.info(f"Scraped {total} events from {source.label}")
     
-    async def scrape_houston_events(self, max_events: int = 20) -> List[HoustonEvent]:
+    async def stream_houston_events(self, max_events: Optional[int] = 20, max_pages: Optional[int] = None,
+                                    skip_seen: Optional[bool] = None) -> AsyncIterator[HoustonEvent]:
         """
-        Scrape Houston events from all configured sources.
+        Stream unique, qualifying events from all sources as they are parsed.
+        
+        Sources are crawled concurrently and paginated. Each event is deduplicated
+        and scored on arrival and yielded in arrival order, not by score. When
+        max_events is set, crawling stops once that many events at or above the
+        minimum score have been yielded; use scrape_houston_events for the
+        highest-scoring events of a full crawl.
         
         Args:
-            max_events: Maximum number of events to return
+            max_events: Number of qualifying events after which crawling stops; None crawls every source
+            max_pages: Maximum listing pages per source (defaults to configuration)
+            skip_seen: Drop events unchanged since an earlier run (defaults to configuration)
             
-        Returns:
-            List of Houston events
+        Yields:
+            Unique Houston events with their score set
         """
+        max_pages = max_pages or config.get('houston_events.max_pages', 3)
+        min_score = config.get('houston_events.min_event_score', 0.4)
+        if skip_seen is None:
+            skip_seen = config.get('houston_events.skip_seen_events', True)
         logger.info(f"Starting Houston events scraping for {len(self.sources)} sources")
         
-        all_events = []
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        self.page_stats = []
+        self._pending_seen = {}
+        self.metrics.start_run()
+        
+        async def produce(source: EventSource) -> None:
+            collected = 0
+            
+            async def crawl() -> None:
+                nonlocal collected
+                async for event in self._crawl_source(source, max_pages):
+                    await queue.put((source.name, event))
+                    collected += 1
+                    if collected >= source.max_events:
+                        logger.info(f"{source.label} reached its quota of {source.max_events} events")
+                        break
+            
+            with self.metrics.stage(source.name, 'crawl', budget_exceeded=0) as stage:
+                try:
+                    # A slow source is cancelled at its deadline; queued events are kept
+                    await asyncio.wait_for(crawl(), timeout=source.time_budget)
+                except asyncio.TimeoutError:
+                    stage['budget_exceeded'] = 1
+                    logger.warning(f"{source.label} ran out of its {source.time_budget:.0f}s budget "
+                                   f"after {collected} events")
+                except Exception as e:
+                    logger.error(f"Error scraping {source.label}: {e}")
+                finally:
+                    stage['events'] = collected
+                    await queue.put(finished)
+        
+        sources = []
+        for source_url in self.sources:
+            source = source_for_url(source_url)
+            if source is None:
+                logger.warning(f"Unknown source URL: {source_url}")
+            elif source not in sources:
+                sources.append(source)
+        
+        # Crawl all sources concurrently; politeness is enforced per host
+        producers = [asyncio.create_task(produce(source)) for source in sources]
+        dedup_index = EventDedupIndex()
+        now = datetime.now()
+        running = len(producers)
+        yielded = 0
+        seen_counts = {SEEN_NEW: 0, SEEN_CHANGED: 0, SEEN_UNCHANGED: 0}
+        # Per-source dedup and scoring cost, recorded once at the end of the run
+        filtering: Dict[str, Dict[str, float]] = {}
         
         try:
-            self.driver = self._setup_driver()
-            
-            for source_url in self.sources:
+            while running and (max_events is None or yielded < max_events):
+                entry = await queue.get()
+                if entry is finished:
+                    running -= 1
+                    continue
+                
+                source, item = entry
+                totals = filtering.setdefault(source, {
+                    'dedup_time': 0.0, 'score_time': 0.0, 'received': 0, 'duplicates': 0,
+                    'unchanged': 0, 'scored': 0, 'below_min_score': 0, 'score_errors': 0
+                })
+                totals['received'] += 1
+                started = time.perf_counter()
+                
+                if not dedup_index.add_if_unique(item):
+                    totals['duplicates'] += 1
+                    totals['dedup_time'] += time.perf_counter() - started
+                    continue
+                
+                # Listings handled by an earlier run skip scoring and duplicate checks
+                observation = self.seen_events.observe(item, source)
+                self._pending_seen[id(item)] = (item, observation)
+                status = observation.status
+                seen_counts[status] += 1
+                scoring = time.perf_counter()
+                totals['dedup_time'] += scoring - started
+                if skip_seen and status == SEEN_UNCHANGED:
+                    totals['unchanged'] += 1
+                    continue
+                
                 try:
-                    if 'visithoustontexas.com' in source_url:
-                        events = await self.scrape_visit_houston()
-                    elif 'houcalendar.com' in source_url:
-                        events = await self.scrape_hou_calendar()
-                    else:
-                        logger.warning(f"Unknown source URL: {source_url}")
-                        continue
-                    
-                    all_events.extend(events)
-                    logger.info(f"Scraped {len(events)} events from {source_url}")
-                    
-                    # Rate limiting between sources
-                    await asyncio.sleep(2)
-                    
+                    item.score = self._calculate_event_score(item, now)
                 except Exception as e:
-                    logger.error(f"Error scraping {source_url}: {e}")
+                    # One malformed event must not end the run
+                    logger.warning(f"Could not score event '{item.title}' from {source}: {e}")
+                    totals['score_time'] += time.perf_counter() - scoring
+                    totals['score_errors'] += 1
                     continue
+                totals['score_time'] += time.perf_counter() - scoring
+                totals['scored'] += 1
+                if item.score < min_score:
+                    totals['below_min_score'] += 1
+                    continue
+                
+                yielded += 1
+                yield item
+        
+        finally:
+            # Stop crawling early once enough events have been seen
+            for producer in producers:
+                producer.cancel()
+            await asyncio.gather(*producers, return_exceptions=True)
+            await self.http_fetcher.close()
+            
+            self.seen_events.compact()
+            self._log_page_stats()
+            logger.info(f"Seen-event store: {seen_counts[SEEN_NEW]} new, {seen_counts[SEEN_CHANGED]} changed, "
+                        f"{seen_counts[SEEN_UNCHANGED]} unchanged")
+            
+            for source, totals in filtering.items():
+                self.metrics.record(source, 'dedup', totals['dedup_time'], events=totals['received'],
+                                    duplicates=totals['duplicates'], unchanged=totals['unchanged'])
+                self.metrics.record(source, 'score', totals['score_time'], events=totals['scored'],
+                                    below_min_score=totals['below_min_score'], errors=totals['score_errors'])
+            self.metrics.flush()
+    
+    def commit_seen_events(self, events: Iterable[HoustonEvent]) -> int:
+        """
+        Record events from the last scrape as seen, once the run has used them.
+        
+        Call this only after a run succeeds; until then nothing from the scrape is
+        stored, so a failed or unpublished run doesn't hide its events from the
+        next one. Events are recorded as they were scraped, before enrichment, and
+        unchanged events the scrape skipped are refreshed as well.
+        
+        Args:
+            events: Events the run consumed or published
             
-            # Remove duplicates and score events
-            unique_events = self._remove_duplicates(all_events)
-            scored_events = [event for event in unique_events if self._calculate_event_score(event) >= config.get('houston_events.min_event_score', 0.4)]
-            
-            # Sort by score and limit results
-            scored_events.sort(key=lambda e: self._calculate_event_score(e), reverse=True)
-            final_events = scored_events[:max_events]
+        Returns:
+            Number of events recorded
+        """
+        used = {id(event) for event in events}
+        observations = [
+            observation for key, (_, observation) in self._pending_seen.items()
+            if key in used or observation.status == SEEN_UNCHANGED
+        ]
+        self._pending_seen = {}
+        recorded = self.seen_events.record(observations)
+        logger.info(f"Recorded {recorded} events in the seen-event store")
+        return recorded
+    
+    async def scrape_houston_events(self, max_events: int = 20) -> List[HoustonEvent]:
+        """
+        Scrape Houston events from all configured sources.
+        
+        Every source is crawled within its page, event and time limits, and the
+        highest-scoring events are kept.
+        
+        Args:
+            max_events: Maximum number of events to return
             
-            logger.info(f"Scraped {len(final_events)} unique Houston events")
-            return final_events
+        Returns:
+            List of Houston events, highest score first
+        """
+        try:
+            # Dedup and scoring happen on the stream; a bounded min-heap keeps the top events.
+            # Ties keep arrival order, like a stable sort by score.
+            top: List[Tuple[float, int, HoustonEvent]] = []
+            arrival = 0
+            async for event in self.stream_houston_events(max_events=None):
+                entry = (event.score, -arrival, event)
+                arrival += 1
+                if len(top) < max_events:
+                    heapq.heappush(top, entry)
+                elif entry[:2] > top[0][:2]:
+                    heapq.heapreplace(top, entry)
+            events = [event for _, _, event in sorted(top, key=lambda entry: entry[:2], reverse=True)]
+            
+            # Fill time, address and price from detail pages concurrently
+            if config.get('houston_events.enrich_details', True):
+                with self.metrics.stage('all', 'enrich', events=len(events)):
+                    await self.event_enricher.enrich(events)
+                self.metrics.flush()
+            
+            logger.info(f"Scraped {len(events)} unique Houston events")
+            return events
             
         except Exception as e:
             logger.error(f"Error in Houston events scraping: {e}")
             return []
-        
-        finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("WebDriver closed")
     
-    async def scrape_visit_houston(self) -> List[HoustonEvent]:
+    async def scrape_visit_houston(self, driver: Optional[webdriver.Chrome] = None) -> List[HoustonEvent]:
         """Scrape events from visithoustontexas.com"""
-        events = []
+        events, _ = await self._scrape_page(get_source('visit_houston'), get_source('visit_houston').listing_url, driver)
+        return events
+    
+    async def scrape_hou_calendar(self, driver: Optional[webdriver.Chrome] = None) -> List[HoustonEvent]:
+        """Scrape events from houcalendar.com"""
+        events, _ = await self._scrape_page(get_source('hou_calendar'), get_source('hou_calendar').listing_url, driver)
+        return events
+    
+    async def _scrape_page(self, source: EventSource, url: str, driver: Optional[webdriver.Chrome] = None,
+                           limit: Optional[int] = 10, load_more_clicks: int = 0) -> Tuple[List[HoustonEvent], Optional[str]]:
+        """
+        Scrape one listing page with the source's fetch strategy.
         
-        try:
-            url = "https://www.visithoustontexas.com/events/events-this-weekend/"
-            logger.info(f"Scraping Visit Houston: {url}")
-            
-            self.driver.get(url)
-            
-            # Add random delay to simulate human behavior
-            await asyncio.sleep(random.uniform(2, 5))
-            
-            # Wait for dynamic content to load
-            wait = WebDriverWait(self.driver, self.wait_timeout)
-            
-            # Look for event containers with multiple fallback selectors
-            event_found = False
-            selectors_to_try = [
-                "[data-testid='event-card']",
-                ".event-item",
-                ".event-listing", 
-                ".event-card",
-                ".card",
-                "[class*='event']",
-                "[class*='Event']",
-                ".listing",
-                ".item"
-            ]
-            
-            for selector in selectors_to_try:
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    event_found = True
-                    logger.info(f"Found elements with selector: {selector}")
-                    break
-                except TimeoutException:
-                    continue
+        By default a discovered JSON feed is used first, then plain HTTP, and
+        Selenium only when needed.
+        
+        Args:
+            source: Source plugin
+            url: Listing page URL
+            driver: Explicit WebDriver to use; skips the HTTP tier when given
+            limit: Maximum number of event cards parsed from the page
+            load_more_clicks: How many "load more" buttons to click when rendering
             
-            if not event_found:
-                logger.warning("Timeout waiting for event elements on Visit Houston - trying page source parsing")
-                # Continue anyway and try to parse what we can from the page source
+        Returns:
+            Tuple of (events, next page URL or None)
+        """
+        # A discovered JSON feed replaces the listing page entirely
+        feed = self.feed_registry.get(source.name) if driver is None else None
+        if feed and feed.get('page_url') == url:
+            events = await self._scrape_feed(source, feed)
+            if events is not None:
+                return events[:limit] if limit else events, None
+        
+        cached = self.page_cache.get(url)
+        if cached:
+            logger.info(f"Using cached snapshot of {url}")
+            return await self._parse_listing(cached.html, url, source, limit)
+        
+        if self.page_cache.replay:
+            logger.warning(f"No cached snapshot of {url} in replay mode")
+            return [], None
+        
+        try_http = source.fetch_strategy == FETCH_HTTP or (
+            source.fetch_strategy != FETCH_SELENIUM and self.fetch_tiers.should_try_http(source.name)
+        )
+        
+        if driver is None and try_http:
+            async with self._host_slot(source, url):
+                with self.metrics.stage(source.name, 'http_fetch', url=url) as stage:
+                    page = await self.http_fetcher.fetch_page(url)
+                    stage['bytes'] = len(page.html) if page else 0
+            
+            if page:
+                parsed = await self._parse_listing(page.html, url, source, limit, source.container_selectors)
+                if parsed and parsed[0]:
+                    # Only cached once it has events, so a JavaScript shell isn't served from the cache later
+                    self.http_fetcher.store(url, page)
+                    self.fetch_tiers.record(source.name, TIER_HTTP)
+                    return parsed
+            
+            if source.fetch_strategy == FETCH_HTTP:
+                logger.warning(f"No events in HTTP response from {url}")
+                return [], None
+            
+            logger.info(f"No event containers in HTTP response from {url} - escalating to Selenium")
+        
+        # Feed discovery rides on renders that are needed anyway; it never forces one
+        discover = self.feed_registry.should_discover(source.name)
+        
+        async with self._host_slot(source, url):
+            html = await self._run_with_driver(
+                source.name, lambda d: self._render_with_stats(d, source, url, load_more_clicks, discover), driver
+            )
+        
+        if not html:
+            return [], None
+        self.fetch_tiers.record(source.name, TIER_SELENIUM)
+        return await self._parse_listing(html, url, source, limit)
+    
+    async def _scrape_feed(self, source: EventSource, feed: Dict) -> Optional[List[HoustonEvent]]:
+        """
+        Read events straight from a discovered JSON feed.
+        
+        Args:
+            source: Source plugin
+            feed: Feed spec recorded by discovery
+            
+        Returns:
+            Events, or None if the feed is unavailable or no longer has events
+        """
+        feed_url = feed['url']
+        cached = self.page_cache.get(feed_url)
+        if cached:
+            body = cached.html
+        elif self.page_cache.replay:
+            return None
+        else:
+            async with self._host_slot(source, feed_url):
+                with self.metrics.stage(source.name, 'http_fetch', url=feed_url) as stage:
+                    body = await self.http_fetcher.fetch(feed_url)
+                    stage['bytes'] = len(body or '')
+        
+        with self.metrics.stage(source.name, 'parse', url=feed_url, bytes=len(body or '')) as stage:
+            records = parse_feed(body, feed) if body else None
+            if not records:
+                self.feed_registry.invalidate(source.name)
+                return None
             
-            # Get page source and parse with BeautifulSoup for easier extraction
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # Extract events from common selectors with more comprehensive list
-            event_selectors = [
-                "[data-testid='event-card']",
-                ".event-item",
-                ".event-listing",
-                ".event-card",
-                ".card",
-                "[class*='event']",
-                "[class*='Event']",
-                ".listing",
-                ".item",
-                "article",
-                ".post",
-                ".entry"
-            ]
-            
-            event_elements = []
-            for selector in event_selectors:
-                elements = soup.select(selector)
-                if elements and len(elements) > 1:  # Need more than 1 to avoid header/footer elements
-                    event_elements = elements
-                    logger.info(f"Found {len(event_elements)} events using selector: {selector}")
-                    break
-            
-            # If no events found with specific selectors, try to find any content with event-related keywords
-            if not event_elements:
-                logger.info("No events found with standard selectors, trying keyword-based search")
-                all_elements = soup.find_all(['div', 'article', 'section'], string=re.compile(r'event|concert|festival|show', re.I))
-                if all_elements:
-                    event_elements = all_elements[:10]  # Limit to 10
-                    logger.info(f"Found {len(event_elements)} potential events using keyword search")
-            
-            for element in event_elements[:10]:  # Limit to first 10 events
+            events = []
+            for record in records:
                 try:
-                    event = self.parse_event_data(element, 'visit_houston')
+                    event = self._event_from_structured_data(record, source.name)
                     if event:
                         events.append(event)
                 except Exception as e:
-                    logger.warning(f"Error parsing event element: {e}")
-                    continue
-            
-        except Exception as e:
-            logger.error(f"Error scraping Visit Houston: {e}")
+                    logger.warning(f"Error parsing feed item: {e}")
+            stage.update(elements=len(records), events=len(events))
         
+        logger.info(f"Read {len(events)} events from the {source.label} feed")
+        self.fetch_tiers.record(source.name, TIER_FEED)
         return events
     
-    async def scrape_hou_calendar(self) -> List[HoustonEvent]:
-        """Scrape events from houcalendar.com"""
-        events = []
+    def _render_with_stats(self, driver: webdriver.Chrome, source: EventSource, url: str,
+                           load_more_clicks: int, discover: bool = False) -> Optional[str]:
+        """Render a page in Selenium and record its transfer size, request count and load time."""
+        started = start_page_accounting(driver)
+        html = self._render_listing(driver, source, url, load_more_clicks)
+        messages = read_network_events(driver)
         
-        try:
-            url = "https://www.houcalendar.com/"
-            logger.info(f"Scraping HouCalendar: {url}")
-            
-            self.driver.get(url)
+        if discover:
+            # Responses must be read before the session navigates away
+            with self.metrics.stage(source.name, 'feed_discovery', url=url):
+                self.feed_registry.record(source.name, discover_event_feed(driver, messages, url))
+        
+        stats = collect_page_stats(driver, source.name, url, started, messages)
+        self.page_stats.append(stats)
+        self.metrics.record(source.name, 'transfer', stats.load_time, url=url, bytes=stats.bytes_transferred,
+                            requests=stats.requests, blocked_requests=stats.blocked_requests)
+        logger.info(f"Rendered {url}: {stats.bytes_transferred / 1024:.0f} KB in {stats.requests} requests "
+                    f"({stats.blocked_requests} blocked), loaded in {stats.load_time:.2f}s")
+        return html
+    
+    def _log_page_stats(self) -> None:
+        """Log Selenium transfer totals per source for this run."""
+        totals: Dict[str, List[float]] = {}
+        for stats in self.page_stats:
+            total = totals.setdefault(stats.source, [0, 0, 0, 0, 0.0])
+            total[0] += 1
+            total[1] += stats.bytes_transferred
+            total[2] += stats.requests
+            total[3] += stats.blocked_requests
+            total[4] += stats.load_time
+        
+        for source, (pages, size, requests, blocked, load_time) in totals.items():
+            logger.info(f"Browser transfer for {source}: {pages} pages, {size / 1024:.0f} KB, "
+                        f"{requests} requests ({blocked} blocked), {load_time / pages:.2f}s average load")
+    
+    async def _parse_listing(self, html: str, url: str, source: EventSource, limit: Optional[int],
+                             container_selectors: Optional[List[str]] = None) -> Optional[Tuple[List[HoustonEvent], Optional[str]]]:
+        """
+        Parse a listing page off the event loop.
+        
+        Returns:
+            Tuple of (events, next page URL), or None when container_selectors
+            are given and the page has neither containers nor structured data
+        """
+        def parse():
+            with self.metrics.stage(source.name, 'parse', url=url, bytes=len(html), elements=0, events=0) as stage:
+                soup = BeautifulSoup(html, HTML_PARSER)
+                if container_selectors and not soup.select_one(", ".join(container_selectors + STRUCTURED_DATA_SELECTORS)):
+                    return None
+                events = self._extract_listing_events(soup, source, limit, stage)
+                stage['events'] = len(events)
+                return events, self._find_next_page_url(soup, url)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, parse)
+    
+    def _find_next_page_url(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+        """Find the next listing page from pagination or "load more" links."""
+        candidates = soup.select(", ".join(NEXT_PAGE_SELECTORS))
+        candidates += [link for link in soup.find_all('a', href=True) if NEXT_PAGE_TEXT_RE.match(link.get_text().strip())]
+        
+        for link in candidates:
+            href = (link.get('href') or '').strip()
+            if not href or href.startswith(('#', 'javascript:')):
+                continue
+            next_url = urljoin(url, href)
+            if next_url != url:
+                return next_url
+        
+        return None
+    
+    def _click_load_more(self, driver: webdriver.Chrome, container_selectors: List[str], clicks: int) -> None:
+        """Click script-driven "load more" buttons, waiting for new cards each time."""
+        combined = ", ".join(container_selectors)
+        
+        for _ in range(clicks):
+            buttons = driver.find_elements(By.CSS_SELECTOR, ", ".join(LOAD_MORE_SELECTORS))
+            buttons += driver.find_elements(By.XPATH, LOAD_MORE_XPATH)
+            button = next((b for b in buttons if b.is_displayed() and b.is_enabled()), None)
+            if button is None:
+                return
+            
+            before = len(driver.find_elements(By.CSS_SELECTOR, combined))
+            driver.execute_script("arguments[0].click();", button)
+            try:
+                WebDriverWait(driver, 10).until(lambda d: len(d.find_elements(By.CSS_SELECTOR, combined)) > before)
+            except TimeoutException:
+                return
+    
+    def _wait_for_containers(self, driver: webdriver.Chrome, source: str, selectors: List[str]) -> Optional[str]:
+        """
+        Wait until the page is ready and find which container selector matched.
+        
+        Args:
+            driver: WebDriver showing the listing page
+            source: Source identifier
+            selectors: Candidate container selectors in priority order
             
-            # Add random delay to simulate human behavior
-            await asyncio.sleep(random.uniform(1, 3))
+        Returns:
+            The selector that matched, or None if no containers appeared
+        """
+        ordered = self.selector_cache.ordered(source, 'containers', selectors)
+        
+        # Readiness polls every candidate at once and returns as soon as the page settles
+        timeout = self.latency_profiles.timeout_for(source, self.wait_timeout)
+        result = wait_until_ready(driver, ordered, timeout)
+        self.metrics.record(source, 'wait', result.elapsed, elements=result.element_count,
+                            timeouts=int(result.timed_out))
+        if result.timed_out:
+            self.latency_profiles.record_timeout(source, result.elapsed)
+        if result.element_count == 0:
+            return None
+        
+        if result.timed_out:
+            logger.info(f"{source} still changing after {result.elapsed:.1f}s - reading it anyway")
+        else:
+            self.latency_profiles.record(source, result.elapsed)
+            logger.info(f"{source} ready in {result.elapsed:.2f}s with {result.element_count} containers")
+        
+        for selector in ordered:
+            if driver.find_elements(By.CSS_SELECTOR, selector):
+                self.selector_cache.record(source, 'containers', selector)
+                logger.info(f"Found elements with selector: {selector}")
+                return selector
+        
+        return None
+    
+    def _select_event_elements(self, soup: BeautifulSoup, source: str,
+                               selectors: List[str], min_count: int = 1) -> List:
+        """
+        Select event cards, trying the selector that worked last time first.
+        
+        Args:
+            soup: Parsed listing page
+            source: Source identifier
+            selectors: Candidate event selectors in priority order
+            min_count: Minimum number of matches for a selector to be accepted
             
-            # Wait for dynamic content to load
-            wait = WebDriverWait(self.driver, self.wait_timeout)
+        Returns:
+            Matching elements, or an empty list
+        """
+        for selector in self.selector_cache.ordered(source, 'events', selectors):
+            elements = soup.select(selector)
+            if len(elements) >= min_count:
+                self.selector_cache.record(source, 'events', selector)
+                logger.info(f"Found {len(elements)} events using selector: {selector}")
+                return elements
+        
+        return []
+    
+    def _render_listing(self, driver: webdriver.Chrome, source: EventSource, url: str,
+                        load_more_clicks: int = 0) -> Optional[str]:
+        """Blocking Selenium render of a listing page, run off the event loop."""
+        try:
+            logger.info(f"Scraping {source.label}: {url}")
+            
+            # Politeness spacing is applied by the host limiter before this render starts
+            with self.metrics.stage(source.name, 'navigate', url=url):
+                driver.get(url)
+            self.driver_pool.navigated(driver)
+            
+            # Wait for dynamic content to load and settle
+            if not self._wait_for_containers(driver, source.name, source.container_selectors):
+                if source.require_containers:
+                    logger.warning(f"Timeout waiting for event elements on {source.label}")
+                    return None
+                logger.warning(f"Timeout waiting for event elements on {source.label} - trying page source parsing")
+                # Continue anyway and try to parse what we can from the page source
+            elif load_more_clicks:
+                with self.metrics.stage(source.name, 'load_more', clicks=load_more_clicks):
+                    self._click_load_more(driver, source.container_selectors, load_more_clicks)
             
-            try:
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".event, .event-item, [class*='event']")))
-            except TimeoutException:
-                logger.warning("Timeout waiting for event elements on HouCalendar")
-                return events
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            
-            # Extract events
-            event_selectors = [
-                ".event",
-                ".event-item",
-                "[class*='event']",
-                ".listing"
-            ]
-            
-            for selector in event_selectors:
-                event_elements = soup.select(selector)
-                if event_elements:
-                    logger.info(f"Found {len(event_elements)} events using selector: {selector}")
-                    break
-            
-            for element in event_elements[:10]:  # Limit to first 10 events
-                try:
-                    event = self.parse_event_data(element, 'hou_calendar')
-                    if event:
-                        events.append(event)
-                except Exception as e:
-                    logger.warning(f"Error parsing event element: {e}")
-                    continue
+            # Get page source for BeautifulSoup extraction
+            with self.metrics.stage(source.name, 'page_source', url=url) as stage:
+                page_source = driver.page_source
+                stage['bytes'] = len(page_source)
+            self.page_cache.put(url, page_source)
+            return page_source
             
         except Exception as e:
-            logger.error(f"Error scraping HouCalendar: {e}")
+            logger.error(f"Error scraping {source.label}: {e}")
+            return None
+    
+    def _extract_listing_events(self, soup: BeautifulSoup, source: EventSource,
+                                limit: Optional[int] = 10, stage: Optional[Dict] = None) -> List[HoustonEvent]:
+        """
+        Extract events from a parsed listing page.
+        
+        Args:
+            soup: Parsed listing page
+            source: Source plugin
+            limit: Maximum number of event cards parsed
+            stage: Metrics fields of the parse stage; receives the number of candidate elements
+            
+        Returns:
+            Parsed events
+        """
+        stage = stage if stage is not None else {}
+        
+        # Structured data is exact; only fall back to heuristics without it
+        events = self._extract_structured_events(soup, source.name)
+        if events:
+            stage['elements'] = len(events)
+            return events
+        
+        # Extract events from the source's card selectors
+        event_elements = self._select_event_elements(
+            soup, source.name, source.event_selectors, min_count=source.min_event_matches
+        )
+        
+        # If no events found with specific selectors, try to find any content with event-related keywords
+        if not event_elements and source.keyword_fallback:
+            logger.info("No events found with standard selectors, trying keyword-based search")
+            all_elements = soup.find_all(['div', 'article', 'section'], string=re.compile(r'event|concert|festival|show', re.I))
+            if all_elements:
+                event_elements = all_elements[:10]  # Limit to 10
+                logger.info(f"Found {len(event_elements)} potential events using keyword search")
+        
+        stage['elements'] = len(event_elements[:limit])
+        for element in event_elements[:limit]:
+            try:
+                event = self.parse_event_data(element, source.name)
+                if event:
+                    events.append(event)
+            except Exception as e:
+                logger.warning(f"Error parsing event element: {e}")
+                continue
+        
+        return events
+    
+    def _extract_structured_events(self, soup: BeautifulSoup, source: str) -> List[HoustonEvent]:
+        """Build events from schema.org JSON-LD or microdata on the page."""
+        events = []
+        
+        for record in extract_structured_events(soup):
+            try:
+                event = self._event_from_structured_data(record, source)
+                if event:
+                    events.append(event)
+            except Exception as e:
+                logger.warning(f"Error parsing structured event data: {e}")
+                continue
+        
+        if events:
+            logger.info(f"Found {len(events)} events in structured data for {source}")
         
         return events
     
+    def _event_from_structured_data(self, record: Dict[str, Optional[str]], source: str) -> Optional[HoustonEvent]:
+        """Convert a flattened schema.org event record into a HoustonEvent."""
+        event_date = None
+        event_time = None
+        end_date = None
+        start_date = record.get('start_date')
+        
+        if start_date:
+            parsed = parse_event_date(start_date)
+            if parsed:
+                # Keep the listed local wall-clock time, like the heuristic parser
+                event_date = parsed.start
+                if parsed.has_time:
+                    event_time = event_date.strftime('%I:%M %p').lstrip('0')
+        
+        if event_date is None:
+            event_date = datetime.now() + timedelta(days=1)
+        
+        if record.get('end_date'):
+            parsed_end = parse_event_date(record['end_date'])
+            if parsed_end and parsed_end.start.date() > event_date.date():
+                end_date = parsed_end.start
+        
+        plugin = get_source(source)
+        base_url = plugin.base_url if plugin else ""
+        url = urljoin(base_url, record['url']) if record.get('url') else None
+        image_url = urljoin(base_url, record['image_url']) if record.get('image_url') else None
+        description = record.get('description') or ""
+        
+        return HoustonEvent(
+            title=record['title'],
+            description=description[:500],  # Limit description length
+            date=event_date,
+            time=event_time,
+            end_date=end_date,
+            venue=record.get('venue'),
+            address=record.get('address'),
+            category=self._determine_category(record['title'], description),
+            price=record.get('price'),
+            url=url,
+            image_url=image_url
+        )
+    
     def parse_event_data(self, element, source: str) -> Optional[HoustonEvent]:
         """Extract structured event information from HTML element."""
         try:
+            # Resolve every field in a single walk of the element's subtree
+            fields = get_field_extractor(source).extract(element)
+            
             # Extract title
-            title_selectors = ['h1', 'h2', 'h3', '.title', '.event-title', '.name', '[class*="title"]', '[class*="name"]']
-            title = None
-            for selector in title_selectors:
-                title_element = element.select_one(selector)
-                if title_element:
-                    title = title_element.get_text().strip()
-                    break
+            title_element = fields.get('title')
+            title = title_element.get_text().strip() if title_element else None
             
             if not title:
                 return None
             
             # Extract description
-            desc_selectors = ['.description', '.summary', '.excerpt', 'p', '.content', '[class*="desc"]']
-            description = ""
-            for selector in desc_selectors:
-                desc_element = element.select_one(selector)
-                if desc_element:
-                    description = desc_element.get_text().strip()
-                    break
+            desc_element = fields.get('description')
+            description = desc_element.get_text().strip() if desc_element else ""
             
             # Extract date/time information
-            date_selectors = ['.date', '.datetime', '.when', '[class*="date"]', '[class*="time"]', 'time']
-            date_str = None
-            for selector in date_selectors:
-                date_element = element.select_one(selector)
-                if date_element:
-                    date_str = date_element.get_text().strip()
-                    break
-            
-            # Parse date
-            event_date = self._parse_date(date_str) if date_str else datetime.now() + timedelta(days=1)
+            date_element = fields.get('date')
+            date_str = date_element.get_text().strip() if date_element else None
+            
+            # Parse date, keeping the end of multi-day ranges
+            if date_str:
+                parsed_date = self._parse_date_range(date_str)
+                event_date = parsed_date.start
+                end_date = parsed_date.end if parsed_date.end and parsed_date.end.date() > event_date.date() else None
+            else:
+                event_date = datetime.now() + timedelta(days=1)
+                end_date = None
             
             # Extract venue
-            venue_selectors = ['.venue', '.location', '.where', '[class*="venue"]', '[class*="location"]']
-            venue = None
-            for selector in venue_selectors:
-                venue_element = element.select_one(selector)
-                if venue_element:
-                    venue = venue_element.get_text().strip()
-                    break
+            venue_element = fields.get('venue')
+            venue = venue_element.get_text().strip() if venue_element else None
+            
+            plugin = get_source(source)
             
             # Extract URL
             url = None
-            link_element = element.select_one('a')
+            link_element = fields.get('link')
             if link_element and link_element.get('href'):
-                url = link_element['href']
-                if url.startswith('/'):
-                    base_url = "https://www.visithoustontexas.com" if source == 'visit_houston' else "https://www.houcalendar.com"
-                    url = base_url + url
+                url = plugin.absolute_url(link_element['href']) if plugin else link_element['href']
             
             # Extract image
             image_url = None
-            img_element = element.select_one('img')
+            img_element = fields.get('image')
             if img_element and img_element.get('src'):
-                image_url = img_element['src']
-                if image_url.startswith('/'):
-                    base_url = "https://www.visithoustontexas.com" if source == 'visit_houston' else "https://www.houcalendar.com"
-                    image_url = base_url + image_url
+                image_url = plugin.absolute_url(img_element['src']) if plugin else img_element['src']
             
             # Determine category
             category = self._determine_category(title, description)
@@ -346,6 +863,7 @@ class HoustonEventsScraper:
                 title=title,
                 description=description[:500],  # Limit description length
                 date=event_date,
+                end_date=end_date,
                 venue=venue,
                 category=category,
                 url=url,
@@ -360,49 +878,45 @@ class HoustonEventsScraper:
     
     def _parse_date(self, date_str: str) -> datetime:
         """Parse date string into datetime object."""
-        try:
-            # Clean up the date string
-            date_str = re.sub(r'\s+', ' ', date_str.strip())
-            
-            # Try to parse with dateutil
-            parsed_date = date_parser.parse(date_str, fuzzy=True)
-            
-            # If parsed date is in the past, assume it's for next occurrence
-            if parsed_date < datetime.now():
-                if parsed_date.year == datetime.now().year:
-                    parsed_date = parsed_date.replace(year=datetime.now().year + 1)
-            
-            return parsed_date
-            
-        except Exception as e:
-            logger.warning(f"Error parsing date '{date_str}': {e}")
-            return datetime.now() + timedelta(days=1)
+        return self._parse_date_range(date_str).start
     
-    def _determine_category(self, title: str, description: str) -> str:
-        """Determine event category based on title and description."""
-        text = (title + " " + description).lower()
+    def _parse_date_range(self, date_str: str, now: Optional[datetime] = None) -> ParsedDate:
+        """
+        Parse a date or date range string, rolling past dates forward a year.
         
-        category_keywords = {
-            'concerts': ['concert', 'music', 'band', 'singer', 'performance', 'live music'],
-            'festivals': ['festival', 'fest', 'celebration', 'fair'],
-            'theatre': ['theatre', 'theater', 'play', 'musical', 'drama', 'show'],
-            'family': ['family', 'kids', 'children', 'child-friendly'],
-            'food': ['food', 'restaurant', 'dining', 'culinary', 'chef', 'cooking'],
-            'sports': ['sports', 'game', 'match', 'tournament', 'race', 'athletic']
-        }
+        Args:
+            date_str: Date string as scraped
+            now: Reference time (defaults to the current time)
+            
+        Returns:
+            Parsed start, end and whether a time was given; tomorrow if unparseable
+        """
+        now = now or datetime.now()
+        parsed = parse_event_date(date_str, now)
+        
+        if parsed is None:
+            logger.warning(f"Error parsing date '{date_str}'")
+            return ParsedDate(now + timedelta(days=1))
         
-        for category, keywords in category_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                return category
+        # If parsed date is in the past, assume it's for next occurrence
+        if parsed.start < now and parsed.start.year == now.year:
+            start = parsed.start.replace(year=now.year + 1)
+            end = parsed.end + (start - parsed.start) if parsed.end else None
+            parsed = parsed._replace(start=start, end=end)
         
-        return 'general'
+        return parsed
+    
+    def _determine_category(self, title: str, description: str) -> str:
+        """Determine event category based on title and description."""
+        # Categories are checked in priority order by the shared keyword matcher
+        return get_keyword_matcher().first(title + " " + description, KIND_CATEGORY) or 'general'
     
-    def _calculate_event_score(self, event: HoustonEvent) -> float:
+    def _calculate_event_score(self, event: HoustonEvent, now: Optional[datetime] = None) -> float:
         """Calculate a score for the event based on various factors."""
         score = 0.5  # Base score
         
         # Date proximity (events happening sooner get higher scores)
-        days_until_event = (event.date - datetime.now()).days
+        days_until_event = (event.date - (now or datetime.now())).days
         if days_until_event <= 7:
             score += 0.3
         elif days_until_event <= 14:
@@ -431,24 +945,9 @@ class HoustonEventsScraper:
     
     def _remove_duplicates(self, events: List[HoustonEvent]) -> List[HoustonEvent]:
         """Remove duplicate events based on title and date similarity."""
-        unique_events = []
-        
-        for event in events:
-            is_duplicate = False
-            
-            for existing_event in unique_events:
-                # Check if title is very similar and date is within 1 day
-                title_similarity = self._calculate_similarity(event.title, existing_event.title)
-                date_diff = abs((event.date - existing_event.date).days)
-                
-                if title_similarity > 0.8 and date_diff <= 1:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                unique_events.append(event)
-        
-        return unique_events
+        # Only events on nearby days sharing rare title tokens are compared
+        index = EventDedupIndex.for_events(events)
+        return [event for event in events if index.add_if_unique(event)]
     
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """Calculate similarity between two strings using simple approach."""
@@ -473,15 +972,16 @@ class HoustonEventsScraper:
     def normalize_event_data(self, events: List[HoustonEvent]) -> List[EventTrendingTopic]:
         """Convert Houston events to EventTrendingTopic format."""
         trending_topics = []
+        now = datetime.now()
         
         for event in events:
-            # Create trending topic from event
+            # Create trending topic from event, reusing the score from ranking
             topic = EventTrendingTopic(
                 keyword=event.title,
-                trend_score=self._calculate_event_score(event),
+                trend_score=event.score if event.score is not None else self._calculate_event_score(event, now),
                 search_volume=100,  # Placeholder value
                 related_terms=[event.category] if event.category else [],
-                timestamp=datetime.now(),
+                timestamp=now,
                 source="houston_events",
                 source_url=event.url,
                 event_data=event
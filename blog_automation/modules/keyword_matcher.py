@@ -0,0 +1,188 @@
+"""
+Keyword Matcher Module
+
+Shared gazetteer for event categories, event types and Houston
+neighborhoods. Every vocabulary is compiled once into a word-level lookup
+table: a text is split into words in a single pass and all vocabularies
+are matched against that word set at once, returning every hit with its
+type. Matches respect word boundaries and allow a plural "s"/"es", so
+"art" matches "arts" but not "party".
+
+Splitting a text into words costs more than a few substring tests: at the
+current vocabulary size the matcher is about 2-2.5x slower than the plain
+`in` scans it replaced (benchmark_event_parsing.py --suite keywords). That
+is the price of word-boundary matching, and it stays flat as vocabularies
+grow; with a 1000-term gazetteer the matcher is about 40x faster.
+"""
+
+import logging
+import string
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Vocabulary types
+KIND_CATEGORY = "category"
+KIND_EVENT_TYPE = "event_type"
+KIND_AREA = "area"
+
+# Event categories in priority order; the first category with a hit wins
+EVENT_CATEGORIES: Dict[str, List[str]] = {
+    'concerts': ['concert', 'music', 'band', 'singer', 'performance', 'live music'],
+    'festivals': ['festival', 'fest', 'celebration', 'fair'],
+    'theatre': ['theatre', 'theater', 'play', 'musical', 'drama', 'show'],
+    'family': ['family', 'kids', 'children', 'child-friendly'],
+    'food': ['food', 'restaurant', 'dining', 'culinary', 'chef', 'cooking'],
+    'sports': ['sports', 'game', 'match', 'tournament', 'race', 'athletic'],
+}
+
+# Event type keywords used to compare posts
+EVENT_TYPES: List[str] = [
+    'concert', 'festival', 'show', 'performance', 'theater', 'theatre',
+    'music', 'art', 'food', 'family', 'kids', 'sports', 'game'
+]
+
+# Houston neighborhoods keyed by their short name, with the phrases that mention them
+HOUSTON_AREAS: Dict[str, List[str]] = {
+    'downtown': ['downtown', 'downtown houston'],
+    'museum district': ['museum district'],
+    'heights': ['heights', 'houston heights'],
+    'montrose': ['montrose'],
+    'midtown': ['midtown', 'midtown houston'],
+    'river oaks': ['river oaks'],
+    'memorial': ['memorial'],
+    'galleria': ['galleria'],
+    'sugar land': ['sugar land'],
+    'woodlands': ['woodlands', 'the woodlands'],
+    'katy': ['katy'],
+    'pearland': ['pearland'],
+}
+
+# Display names for neighborhoods in generated copy
+HOUSTON_AREA_NAMES: Dict[str, str] = {
+    'downtown': 'downtown Houston',
+    'museum district': 'Museum District',
+    'heights': 'Heights',
+    'montrose': 'Montrose',
+    'midtown': 'Midtown Houston',
+    'river oaks': 'River Oaks',
+    'memorial': 'Memorial',
+    'galleria': 'Galleria',
+    'sugar land': 'Sugar Land',
+    'woodlands': 'The Woodlands',
+    'katy': 'Katy',
+    'pearland': 'Pearland',
+}
+
+# Punctuation splits words and hyphenated words count as separate words;
+# sentence punctuation also leaves a marker so phrases can't span it
+_SEPARATORS = str.maketrans({
+    char: '|' if char in '.,;:!?()[]{}|' else ' '
+    for char in string.punctuation + '‘’“”–—…'
+})
+
+Entry = Tuple[str, str]
+
+
+def _words(text: str) -> List[str]:
+    """Lowercase words of a text, split on whitespace and punctuation."""
+    # One-to-one translation keeps str.translate on its fast path
+    return text.lower().translate(_SEPARATORS).replace('|', ' | ').split()
+
+
+def _plurals(word: str) -> List[str]:
+    """A word with its "s" and "es" plural forms."""
+    return [word, word + 's', word + 'es']
+
+
+class KeywordMatcher:
+    """Finds every vocabulary term in a text with one pass over its words."""
+
+    def __init__(self, vocabularies: Dict[str, Dict[str, Iterable[str]]]):
+        """
+        Compile vocabularies into word lookup tables.
+
+        Args:
+            vocabularies: Mapping of kind to {label: phrases}; labels keep
+                their declared order as priority
+        """
+        self._order: Dict[str, Dict[str, int]] = {}
+        self._single: Dict[str, List[Entry]] = {}
+        multi: Dict[Tuple[str, ...], List[Entry]] = {}
+
+        for kind, labels in vocabularies.items():
+            self._order[kind] = {}
+            for label, phrases in labels.items():
+                self._order[kind].setdefault(label, len(self._order[kind]))
+                for phrase in phrases:
+                    words = tuple(_words(phrase))
+                    if len(words) == 1:
+                        for form in _plurals(words[0]):
+                            self._single.setdefault(form, []).append((kind, label))
+                    elif words:
+                        multi.setdefault(words, []).append((kind, label))
+
+        self._single_words = frozenset(self._single)
+        # Phrases are only looked for when all of their words occur in the text
+        self._multi: List[Tuple[FrozenSet[str], FrozenSet[str], List[str], List[Entry]]] = [
+            (
+                frozenset(words[:-1]),
+                frozenset(_plurals(words[-1])),
+                [f" {' '.join(words[:-1])} {form} " for form in _plurals(words[-1])],
+                entries
+            )
+            for words, entries in multi.items()
+        ]
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find every vocabulary hit in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Mapping of kind to the distinct labels found, in the vocabulary's declared order
+        """
+        words = _words(text)
+        word_set = set(words)
+        found: Dict[str, set] = {}
+
+        for word in self._single_words.intersection(word_set):
+            for kind, label in self._single[word]:
+                found.setdefault(kind, set()).add(label)
+
+        joined = None
+        for leading, last_forms, needles, entries in self._multi:
+            if leading <= word_set and not last_forms.isdisjoint(word_set):
+                # Words joined by single spaces make adjacency a plain substring test
+                joined = joined if joined is not None else f" {' '.join(words)} "
+                if any(needle in joined for needle in needles):
+                    for kind, label in entries:
+                        found.setdefault(kind, set()).add(label)
+
+        return {kind: sorted(labels, key=self._order[kind].__getitem__) for kind, labels in found.items()}
+
+    def labels(self, text: str, kind: str) -> List[str]:
+        """Distinct labels of one kind found in a text, in declared order."""
+        return self.match(text).get(kind, [])
+
+    def first(self, text: str, kind: str) -> Optional[str]:
+        """Highest-priority label of one kind found in a text, or None."""
+        found = self.labels(text, kind)
+        return found[0] if found else None
+
+
+_matcher: Optional[KeywordMatcher] = None
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """Get the shared matcher for categories, event types and Houston areas."""
+    global _matcher
+    if _matcher is None:
+        _matcher = KeywordMatcher({
+            KIND_CATEGORY: EVENT_CATEGORIES,
+            KIND_EVENT_TYPE: {event_type: [event_type] for event_type in EVENT_TYPES},
+            KIND_AREA: HOUSTON_AREAS,
+        })
+    return _matcher
@@ -0,0 +1,222 @@
+"""
+Page Cache Module
+
+Content-addressed on-disk cache of fetched listing pages. Entries are keyed
+by URL and expire after a TTL; stale entries keep their validators so the
+HTTP tier can revalidate them with a conditional request. In replay mode
+the cache is the only source of pages, which lets the scraper run fully
+offline from recorded snapshots.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODE_ON = "on"
+CACHE_MODE_OFF = "off"
+CACHE_MODE_REPLAY = "replay"
+
+
+@dataclass
+class CachedPage:
+    """A cached page body with its fetch metadata."""
+    url: str
+    html: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class PageCache:
+    """On-disk page cache with TTL, size-based eviction and replay mode."""
+
+    def __init__(self, cache_dir: str = None, ttl_seconds: float = None,
+                 max_bytes: int = None, mode: str = None):
+        """
+        Initialize the page cache.
+
+        Args:
+            cache_dir: Directory holding the index and page bodies
+            ttl_seconds: How long a cached page is served without revalidation
+            max_bytes: Total body size above which least recently used pages are evicted
+            mode: "on", "off" or "replay"
+        """
+        base_dir = Path(cache_dir or config.get('houston_events.cache_dir', '.cache/houston_events'))
+        self.cache_dir = base_dir / 'pages'
+        self.blob_dir = self.cache_dir / 'blobs'
+        self.index_path = self.cache_dir / 'index.json'
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else config.get('houston_events.page_cache_ttl', 1800)
+        self.max_bytes = max_bytes if max_bytes is not None else config.get('houston_events.page_cache_max_bytes', 100 * 1024 * 1024)
+        self.mode = mode or config.get('houston_events.page_cache_mode', CACHE_MODE_ON)
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict] = self._load_index() if self.enabled else {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is consulted at all."""
+        return self.mode != CACHE_MODE_OFF
+
+    @property
+    def replay(self) -> bool:
+        """Whether pages may only come from the cache."""
+        return self.mode == CACHE_MODE_REPLAY
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """Load the URL index, ignoring a missing or corrupt file."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self) -> None:
+        """Atomically persist the URL index."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not persist page cache index: {e}")
+
+    def _blob_path(self, digest: str) -> Path:
+        """Path of the body stored under a content digest."""
+        return self.blob_dir / f"{digest}.html"
+
+    def _read(self, url: str, entry: Dict) -> Optional[CachedPage]:
+        """Read a cached body and mark the entry as recently used."""
+        try:
+            html = self._blob_path(entry['digest']).read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+        entry['accessed_at'] = time.time()
+        return CachedPage(
+            url=url,
+            html=html,
+            fetched_at=entry['fetched_at'],
+            etag=entry.get('etag'),
+            last_modified=entry.get('last_modified')
+        )
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Get a fresh cached page.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Cached page within its TTL (any age in replay mode), or None
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._index.get(url)
+            if not entry:
+                return None
+            if not self.replay and time.time() - entry['fetched_at'] > self.ttl_seconds:
+                return None
+            return self._read(url, entry)
+
+    def get_stale(self, url: str) -> Optional[CachedPage]:
+        """Get a cached page regardless of age, for conditional revalidation."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._index.get(url)
+            return self._read(url, entry) if entry else None
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a cached page."""
+        with self._lock:
+            entry = self._index.get(url) or {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url: str, html: str, etag: str = None, last_modified: str = None) -> None:
+        """
+        Store a fetched page.
+
+        Args:
+            url: Page URL
+            html: Page body
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+        """
+        if not self.enabled or self.replay:
+            return
+
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            blob_path = self._blob_path(digest)
+            try:
+                if not blob_path.exists():
+                    self.blob_dir.mkdir(parents=True, exist_ok=True)
+                    blob_path.write_bytes(data)
+            except OSError as e:
+                logger.warning(f"Could not cache page {url}: {e}")
+                return
+
+            now = time.time()
+            self._index[url] = {
+                'digest': digest,
+                'size': len(data),
+                'fetched_at': now,
+                'accessed_at': now,
+                'etag': etag,
+                'last_modified': last_modified
+            }
+            self._evict()
+            self._save_index()
+
+    def touch(self, url: str) -> None:
+        """Mark a cached page as freshly revalidated."""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry:
+                entry['fetched_at'] = entry['accessed_at'] = time.time()
+                self._save_index()
+
+    def _evict(self) -> None:
+        """Drop least recently used pages until the cache fits its size limit."""
+        sizes = {entry['digest']: entry['size'] for entry in self._index.values()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        for url, entry in sorted(self._index.items(), key=lambda item: item[1]['accessed_at']):
+            if total <= self.max_bytes:
+                break
+
+            del self._index[url]
+            digest = entry['digest']
+            # Bodies are shared between URLs with identical content
+            if not any(other['digest'] == digest for other in self._index.values()):
+                total -= sizes[digest]
+                try:
+                    self._blob_path(digest).unlink()
+                except OSError:
+                    pass
+
+            logger.debug(f"Evicted cached page {url}")
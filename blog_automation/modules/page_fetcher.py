@@ -0,0 +1,188 @@
+"""
+Page Fetcher Module
+
+Plain HTTP fetch tier for event listing pages. Most listings are server
+rendered, so a pooled aiohttp client is tried before falling back to a
+full Selenium render. The tier that worked is recorded per source.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+import aiohttp
+
+from ..config import config
+from .driver_pool import USER_AGENT
+from .page_cache import PageCache
+
+logger = logging.getLogger(__name__)
+
+TIER_FEED = "feed"
+TIER_HTTP = "http"
+TIER_SELENIUM = "selenium"
+
+
+class FetchedPage(NamedTuple):
+    """A page fetched over HTTP, with the validators to cache it under."""
+    html: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    revalidated: bool = False  # Served from the page cache after a 304
+
+
+class HttpFetcher:
+    """Pooled async HTTP client for fetching listing pages."""
+
+    def __init__(self, timeout: float = None, limit_per_host: int = 4, page_cache: PageCache = None):
+        """
+        Initialize the HTTP fetcher.
+
+        Args:
+            timeout: Total request timeout in seconds
+            limit_per_host: Maximum pooled connections per host
+            page_cache: Cache used to revalidate and store fetched pages
+        """
+        self.page_cache = page_cache
+        self.timeout = timeout if timeout is not None else config.get('houston_events.http_timeout', 20.0)
+        self.limit_per_host = limit_per_host
+        self.headers = {
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(limit_per_host=self.limit_per_host, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._loop = loop
+        return self._session
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        Fetch a page over plain HTTP and store it in the page cache.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Response body, or None if the request failed
+        """
+        page = await self.fetch_page(url)
+        if page is None:
+            return None
+        self.store(url, page)
+        return page.html
+
+    async def fetch_page(self, url: str) -> Optional[FetchedPage]:
+        """
+        Fetch a page over plain HTTP without caching a new body.
+
+        Callers that need to check a page before trusting it, such as a
+        listing that may be an empty JavaScript shell, store it afterwards.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Fetched page, or None if the request failed
+        """
+        headers = self.page_cache.validators(url) if self.page_cache else {}
+
+        try:
+            session = await self._get_session()
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and self.page_cache:
+                    cached = self.page_cache.get_stale(url)
+                    if cached:
+                        logger.info(f"Cached copy of {url} is still valid")
+                        self.page_cache.touch(url)
+                        return FetchedPage(cached.html, revalidated=True)
+                    return None
+
+                if response.status != 200:
+                    logger.info(f"HTTP fetch of {url} returned status {response.status}")
+                    return None
+
+                return FetchedPage(
+                    await response.text(),
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"HTTP fetch of {url} failed: {e}")
+            return None
+
+    def store(self, url: str, page: FetchedPage) -> None:
+        """Store a fetched page in the page cache; revalidated pages are there already."""
+        if self.page_cache and not page.revalidated:
+            self.page_cache.put(url, page.html, etag=page.etag, last_modified=page.last_modified)
+
+    async def close(self) -> None:
+        """Close the pooled session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class FetchTierLog:
+    """Records which fetch tier worked for each source."""
+
+    def __init__(self, path: Path = None, recheck_hours: float = None):
+        """
+        Initialize the tier log.
+
+        Args:
+            path: JSON file the tiers are persisted to
+            recheck_hours: How long a Selenium-only source skips the HTTP tier
+        """
+        cache_dir = Path(config.get('houston_events.cache_dir', '.cache/houston_events'))
+        self.path = path or cache_dir / 'fetch_tiers.json'
+        self.recheck_hours = recheck_hours if recheck_hours is not None else config.get('houston_events.tier_recheck_hours', 24)
+        self.tiers: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load persisted tiers, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, source: str) -> Optional[str]:
+        """Get the tier that last worked for a source."""
+        return self.tiers.get(source, {}).get('tier')
+
+    def should_try_http(self, source: str) -> bool:
+        """Whether the HTTP tier is worth trying for a source."""
+        entry = self.tiers.get(source)
+        if not entry or entry.get('tier') != TIER_SELENIUM:
+            return True
+
+        # Periodically re-probe sources that previously needed a browser
+        return time.time() - entry.get('updated', 0) > self.recheck_hours * 3600
+
+    def record(self, source: str, tier: str) -> None:
+        """Record the tier that worked for a source and persist it."""
+        self.tiers[source] = {'tier': tier, 'updated': time.time()}
+        logger.info(f"Source {source} served by {tier} tier")
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.tiers, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not persist fetch tiers: {e}")
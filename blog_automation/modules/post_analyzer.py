@@ -8,16 +8,25 @@ strategies for the Houston events blog automation system.
 import os
 import logging
 import re
-from datetime import datetime, timedelta, date
+import sqlite3
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Mapping, Optional, Tuple
 from fuzzywuzzy import fuzz
-import frontmatter
 
 from ..config import config
+from .keyword_matcher import KIND_AREA, KIND_EVENT_TYPE, get_keyword_matcher
+from .post_index import PostIndex, PostSnapshot, as_datetime, filename_date, list_posts, select_posts
+from .post_record import PostRecord
 
 logger = logging.getLogger(__name__)
 
+# Coverage window used for content freshness
+FRESHNESS_WINDOW_DAYS = 60
+
+# Recent posts whose titles suggest a content angle
+ANGLE_RECENT_POSTS = 10
+
 
 class PostAnalyzer:
     """Analyzes existing posts for duplicate detection and content freshness."""
@@ -26,54 +35,100 @@ class PostAnalyzer:
         """Initialize the post analyzer."""
         self.posts_dir = Path(config.get('blog.output_dir', '_posts'))
         self.duplicate_check_days = config.get('houston_events.duplicate_check_days', 30)
+        self.index = self._open_index() if config.get('houston_events.post_index_enabled', True) else None
+        self._snapshot: Optional[PostSnapshot] = None
         logger.info(f"Post analyzer initialized for directory: {self.posts_dir}")
     
-    def scan_existing_posts(self) -> List[Dict]:
+    def _open_index(self) -> Optional[PostIndex]:
+        """Open the persisted post index, or None to parse every post on each scan."""
+        try:
+            return PostIndex(self.posts_dir)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Post index unavailable, posts will be fully parsed on each scan: {e}")
+            return None
+    
+    def scan_existing_posts(self, since: datetime = None, recent: int = 0) -> Iterator[PostRecord]:
         """
-        Read all existing blog posts and extract metadata.
+        Iterate over existing blog posts' metadata.
         
-        Returns:
-            List of post metadata dictionaries
-        """
-        posts = []
+        Args:
+            since: Skip posts whose file name dates them before this, without reading them
+            recent: Read this many of the most recently dated posts even if older than since
         
+        Yields:
+            Post records; bodies are only read when a record's content is used
+        """
         if not self.posts_dir.exists():
             logger.warning(f"Posts directory does not exist: {self.posts_dir}")
-            return posts
+            return
         
-        for post_file in self.posts_dir.glob("*.md"):
+        present = list_posts(self.posts_dir)
+        selected = select_posts(present, since, recent)
+        
+        # Only posts added or changed since the last scan are parsed
+        if self.index is not None:
+            try:
+                counts = self.index.refresh(self._extract_post_metadata, selected, present)
+                posts = self.index.posts(selected)
+            except sqlite3.Error as e:
+                logger.warning(f"Post index failed, reading every post: {e}")
+            else:
+                logger.info(f"Scanning {counts['parsed'] + counts['unchanged']} existing posts "
+                            f"({counts['parsed']} parsed, {counts['removed']} removed)")
+                yield from posts
+                return
+        
+        scanned = 0
+        for name in selected:
+            post_file = self.posts_dir / name
             try:
                 post_data = self._extract_post_metadata(post_file)
                 if post_data:
-                    posts.append(post_data)
+                    scanned += 1
+                    yield post_data
             except Exception as e:
                 logger.warning(f"Error reading post {post_file}: {e}")
                 continue
         
-        logger.info(f"Scanned {len(posts)} existing posts")
-        return posts
+        logger.info(f"Scanned {scanned} existing posts")
     
-    def _extract_post_metadata(self, post_file: Path) -> Optional[Dict]:
-        """Extract metadata from a blog post file."""
+    def _directory_signature(self) -> Optional[int]:
+        """Modification time of the posts directory, which changes when a post is added or removed."""
+        try:
+            return self.posts_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def snapshot(self) -> PostSnapshot:
+        """
+        Get the posts shared by every query of the current run.
+        
+        The corpus is scanned once and reused until invalidate_snapshot() is
+        called or a post is added to or removed from the posts directory.
+        
+        Returns:
+            Immutable snapshot of existing post metadata
+        """
+        signature = self._directory_signature()
+        if self._snapshot is None or self._snapshot.signature != signature:
+            # Only the widest query window and the latest posts are ever looked at
+            since = datetime.now() - timedelta(days=max(self.duplicate_check_days, FRESHNESS_WINDOW_DAYS))
+            posts = self.scan_existing_posts(since=since, recent=ANGLE_RECENT_POSTS)
+            self._snapshot = PostSnapshot(posts, signature)
+        return self._snapshot
+    
+    def invalidate_snapshot(self) -> None:
+        """Drop the shared snapshot so the next query rescans the posts."""
+        self._snapshot = None
+    
+    def _extract_post_metadata(self, post_file: Path) -> Optional[PostRecord]:
+        """Extract metadata from a blog post file, reading only its front matter."""
         try:
-            with open(post_file, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
-            
             # Extract date from filename if not in frontmatter
             filename_date = self._extract_date_from_filename(post_file.name)
             
-            metadata = {
-                'file_path': str(post_file),
-                'title': post.metadata.get('title', ''),
-                'content': post.content,
-                'category': post.metadata.get('category', ''),
-                'tags': post.metadata.get('tags', []),
-                'date': post.metadata.get('date', filename_date),
-                'excerpt': post.metadata.get('excerpt', ''),
-                'keywords': self.extract_event_keywords(post.content, post.metadata.get('title', ''))
-            }
-            
-            return metadata
+            # Keywords are extracted from the body the first time they are needed
+            return PostRecord.read(post_file, self.extract_event_keywords, default_date=filename_date)
             
         except Exception as e:
             logger.error(f"Error extracting metadata from {post_file}: {e}")
@@ -81,16 +136,8 @@ class PostAnalyzer:
     
     def _extract_date_from_filename(self, filename: str) -> Optional[datetime]:
         """Extract date from Jekyll-style filename."""
-        try:
-            # Pattern: YYYY-MM-DD-title.md
-            date_match = re.match(r'(\d{4})-(\d{2})-(\d{2})-', filename)
-            if date_match:
-                year, month, day = map(int, date_match.groups())
-                return datetime(year, month, day)
-        except Exception:
-            pass
-        
-        return None
+        # Pattern: YYYY-MM-DD-title.md
+        return filename_date(filename)
     
     def extract_event_keywords(self, content: str, title: str) -> List[str]:
         """Extract venue names, dates, event types from posts."""
@@ -109,31 +156,15 @@ class PostAnalyzer:
             matches = re.findall(pattern, text)
             keywords.extend([match.strip() for match in matches if len(match.strip()) > 2])
         
-        # Extract event type keywords
-        event_types = [
-            'concert', 'festival', 'show', 'performance', 'theater', 'theatre',
-            'music', 'art', 'food', 'family', 'kids', 'sports', 'game'
-        ]
-        
-        for event_type in event_types:
-            if event_type in text:
-                keywords.append(event_type)
-        
-        # Extract Houston neighborhoods
-        houston_areas = [
-            'downtown', 'heights', 'montrose', 'midtown', 'museum district',
-            'river oaks', 'galleria', 'memorial', 'sugar land', 'woodlands',
-            'katy', 'pearland'
-        ]
-        
-        for area in houston_areas:
-            if area in text:
-                keywords.append(area)
+        # Extract event types and Houston neighborhoods in one pass
+        found = get_keyword_matcher().match(text)
+        keywords.extend(found.get(KIND_EVENT_TYPE, []))
+        keywords.extend(found.get(KIND_AREA, []))
         
         return list(set(keywords))  # Remove duplicates
     
     def check_duplicate_event(self, event_title: str, event_date: datetime, 
-                             venue: str = None, category: str = None) -> Tuple[bool, Optional[Dict], float]:
+                             venue: str = None, category: str = None) -> Tuple[bool, Optional[Mapping], float]:
         """
         Check if an event is a duplicate of existing posts.
         
@@ -146,20 +177,9 @@ class PostAnalyzer:
         Returns:
             Tuple of (is_duplicate, matching_post, similarity_score)
         """
-        existing_posts = self.scan_existing_posts()
-        
-        # Filter posts from recent timeframe
+        # Posts from the recent timeframe, found by binary search over the date-ordered snapshot
         cutoff_date = datetime.now() - timedelta(days=self.duplicate_check_days)
-        recent_posts = []
-        
-        for post in existing_posts:
-            post_date = post.get('date')
-            if post_date:
-                # Convert date to datetime if needed for comparison
-                if isinstance(post_date, date) and not isinstance(post_date, datetime):
-                    post_date = datetime.combine(post_date, datetime.min.time())
-                if post_date > cutoff_date:
-                    recent_posts.append(post)
+        recent_posts = self.snapshot().since(cutoff_date)
         
         best_match = None
         highest_similarity = 0.0
@@ -180,7 +200,7 @@ class PostAnalyzer:
         return is_duplicate, best_match, highest_similarity
     
     def _calculate_event_similarity(self, event_title: str, event_date: datetime,
-                                  venue: str, category: str, existing_post: Dict) -> float:
+                                  venue: str, category: str, existing_post: Mapping) -> float:
         """Calculate similarity between event and existing post."""
         
         similarity_score = 0.0
@@ -193,7 +213,8 @@ class PostAnalyzer:
         similarity_score += title_similarity * 0.4
         
         # Date proximity (30% weight)
-        post_date = existing_post.get('date')
+        post_date = as_datetime(existing_post.get('date'))
+        event_date = as_datetime(event_date)
         if post_date and event_date:
             date_diff = abs((event_date - post_date).days)
             if date_diff <= 7:
@@ -231,20 +252,9 @@ class PostAnalyzer:
         Returns:
             Freshness score (0.0 = recently covered, 1.0 = fresh content)
         """
-        existing_posts = self.scan_existing_posts()
-        
         # Look at posts from last 60 days
-        cutoff_date = datetime.now() - timedelta(days=60)
-        recent_posts = []
-        
-        for post in existing_posts:
-            post_date = post.get('date')
-            if post_date:
-                # Convert date to datetime if needed for comparison
-                if isinstance(post_date, date) and not isinstance(post_date, datetime):
-                    post_date = datetime.combine(post_date, datetime.min.time())
-                if post_date > cutoff_date:
-                    recent_posts.append(post)
+        cutoff_date = datetime.now() - timedelta(days=FRESHNESS_WINDOW_DAYS)
+        recent_posts = self.snapshot().since(cutoff_date)
         
         if not recent_posts:
             return 1.0  # Very fresh if no recent posts
@@ -294,7 +304,7 @@ class PostAnalyzer:
             Suggested content angle
         """
         if existing_posts is None:
-            existing_posts = self.scan_existing_posts()
+            existing_posts = self.snapshot().latest(ANGLE_RECENT_POSTS)
         
         # Analyze existing coverage patterns
         venue_coverage = 0
@@ -302,9 +312,8 @@ class PostAnalyzer:
         preview_content = 0
         guide_content = 0
         
-        for post in existing_posts[-10:]:  # Look at last 10 posts
+        for post in existing_posts[-ANGLE_RECENT_POSTS:]:  # Look at last 10 posts
             title = post.get('title', '').lower()
-            content = post.get('content', '').lower()
             
             if venue and venue.lower() in title:
                 venue_coverage += 1
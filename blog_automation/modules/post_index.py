@@ -0,0 +1,313 @@
+"""
+Post Index Module
+
+Persisted metadata index of the blog's existing posts. Each post's title,
+date, category, tags, excerpt and extracted keywords are kept in SQLite,
+keyed by file name with the file's mtime and size, so a scan only parses
+posts that were added or changed since the last one and drops deleted ones.
+A scan can be frozen into a date-ordered snapshot that every query of a
+run shares. Jekyll file names carry the post date, so posts outside a
+query window are skipped before their files are touched.
+"""
+
+import bisect
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from dateutil import parser as date_parser
+
+from ..config import config
+from .date_parsing import to_houston_time
+from .post_record import PostRecord
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored metadata or keyword extraction changes, to rebuild existing indexes
+_INDEX_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    posts_dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    date TEXT,
+    date_type TEXT,
+    metadata TEXT NOT NULL,
+    PRIMARY KEY (posts_dir, name)
+);
+"""
+
+# Metadata fields stored per post; the body is not kept
+INDEXED_FIELDS = ('title', 'category', 'tags', 'excerpt', 'keywords')
+
+Signature = Tuple[int, int]
+
+_FILENAME_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})-')
+
+# Front matter may date a post a little after its file name (time zones, late publishing)
+_FILENAME_DATE_SLACK = timedelta(days=1)
+
+
+def filename_date(filename: str) -> Optional[datetime]:
+    """Date of a Jekyll-style post file name (YYYY-MM-DD-title.md), or None."""
+    match = _FILENAME_DATE_RE.match(filename)
+    if match:
+        try:
+            return datetime(*map(int, match.groups()))
+        except ValueError:
+            return None
+    return None
+
+
+def list_posts(posts_dir: Path) -> List[str]:
+    """File names of the posts in a directory, without reading or stat-ing them."""
+    with os.scandir(posts_dir) as entries:
+        return [entry.name for entry in entries if entry.name.endswith('.md')]
+
+
+def select_posts(names: Iterable[str], since: datetime = None, recent: int = 0) -> List[str]:
+    """
+    Pick the posts a time-window query needs, from file names alone.
+
+    Args:
+        names: Post file names
+        since: Keep posts dated on or after this; None keeps every post
+        recent: Also keep this many of the most recently dated posts
+
+    Returns:
+        Selected file names; posts whose name carries no date are always kept
+    """
+    names = list(names)
+    if since is None:
+        return names
+
+    dated = sorted(((filename_date(name), name) for name in names), key=lambda item: item[0] or datetime.min)
+    cutoff = since - _FILENAME_DATE_SLACK
+    newest = {name for _, name in dated[-recent:]} if recent else set()
+    return [name for when, name in dated if when is None or when >= cutoff or name in newest]
+
+
+def as_datetime(value: Any) -> Optional[datetime]:
+    """
+    A post date as a naive Houston-time datetime, or None if it isn't a date.
+
+    YAML only turns some timestamps into dates; Jekyll-style strings such as
+    "2026-10-15 10:00:00 -0600" are parsed here.
+    """
+    if isinstance(value, str):
+        try:
+            value = date_parser.parse(value)
+        except (ValueError, OverflowError):
+            return None
+    if isinstance(value, datetime):
+        return to_houston_time(value)
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    return None
+
+
+def post_datetime(post: Mapping) -> Optional[datetime]:
+    """A post's front matter date, falling back to the date in its file name."""
+    return as_datetime(post.get('date')) or filename_date(Path(post.get('file_path', '')).name)
+
+
+def _encode_date(value: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Store a frontmatter date with its type so it is restored as it was parsed."""
+    if isinstance(value, datetime):
+        return value.isoformat(), 'datetime'
+    if isinstance(value, date):
+        return value.isoformat(), 'date'
+    if value is None:
+        return None, None
+    return str(value), 'str'
+
+
+def _decode_date(value: Optional[str], date_type: Optional[str]) -> Any:
+    """Restore a date stored by _encode_date."""
+    if value is None:
+        return None
+    if date_type == 'datetime':
+        return datetime.fromisoformat(value)
+    if date_type == 'date':
+        return date.fromisoformat(value)
+    return value
+
+
+class PostIndex:
+    """SQLite index of post metadata that is refreshed incrementally from the posts directory."""
+
+    def __init__(self, posts_dir: Path, path: Path = None):
+        """
+        Open (or create) the index.
+
+        Args:
+            posts_dir: Directory holding the Jekyll posts
+            path: SQLite database file
+        """
+        cache_dir = Path(config.get('houston_events.cache_dir', '.cache/houston_events'))
+        self.posts_dir = Path(posts_dir)
+        self.path = path or cache_dir / 'post_index.sqlite3'
+        self._dir_key = str(self.posts_dir.resolve())
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != _INDEX_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS posts")
+            self._conn.execute(f"PRAGMA user_version = {_INDEX_VERSION}")
+        self._conn.executescript(_SCHEMA)
+
+    def _stat_posts(self, names: Iterable[str]) -> Dict[str, Signature]:
+        """Signature (mtime, size) of post files, by file name."""
+        signatures = {}
+        for name in names:
+            try:
+                stat = os.stat(self.posts_dir / name)
+            except OSError:
+                continue
+            signatures[name] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def refresh(self, parse: Callable[[Path], Optional[Dict]], names: Iterable[str] = None,
+                present: Iterable[str] = None) -> Dict[str, int]:
+        """
+        Re-parse added and changed posts and drop deleted ones.
+
+        Args:
+            parse: Reads a post file into a metadata dict, or None if it can't be read
+            names: Posts to bring up to date; defaults to every post in the directory
+            present: Every post in the directory, to drop deleted ones; defaults to names
+
+        Returns:
+            Counts of parsed, removed and unchanged posts
+        """
+        names = list(names) if names is not None else list_posts(self.posts_dir)
+        present = set(present) if present is not None else set(names)
+        current = self._stat_posts(names)
+
+        with self._lock:
+            indexed = {
+                name: (mtime_ns, size)
+                for name, mtime_ns, size in self._conn.execute(
+                    "SELECT name, mtime_ns, size FROM posts WHERE posts_dir = ?", (self._dir_key,)
+                )
+            }
+
+        changed = [name for name, signature in current.items() if indexed.get(name) != signature]
+        removed = [name for name in indexed if name not in present]
+
+        rows = []
+        for name in changed:
+            metadata = parse(self.posts_dir / name)
+            if metadata is None:
+                # Left out of the index so the next scan retries it
+                removed.append(name)
+                continue
+            stored_date, date_type = _encode_date(metadata.get('date'))
+            stored = {field: metadata.get(field) for field in INDEXED_FIELDS}
+            rows.append((self._dir_key, name, *current[name], stored_date, date_type, json.dumps(stored, default=str)))
+
+        if rows or removed:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO posts (posts_dir, name, mtime_ns, size, date, date_type, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                self._conn.executemany(
+                    "DELETE FROM posts WHERE posts_dir = ? AND name = ?", [(self._dir_key, name) for name in removed]
+                )
+                self._conn.commit()
+
+        return {'parsed': len(rows), 'removed': len(removed), 'unchanged': len(current) - len(changed)}
+
+    def posts(self, names: Iterable[str] = None) -> Iterator[PostRecord]:
+        """
+        Indexed posts, ordered by file name.
+
+        Args:
+            names: Only return these posts; defaults to every indexed post
+
+        Returns:
+            Iterator of records carrying the indexed keywords; bodies are read on demand
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, date, date_type, metadata FROM posts WHERE posts_dir = ? ORDER BY name",
+                (self._dir_key,)
+            ).fetchall()
+
+        wanted = set(names) if names is not None else None
+        return (
+            self._record(name, stored_date, date_type, metadata)
+            for name, stored_date, date_type, metadata in rows
+            if wanted is None or name in wanted
+        )
+
+    def _record(self, name: str, stored_date: Optional[str], date_type: Optional[str], metadata: str) -> PostRecord:
+        """Build a post record from an index row."""
+        fields = json.loads(metadata)
+        keywords = fields.pop('keywords', None) or []
+        fields['date'] = _decode_date(stored_date, date_type)
+        return PostRecord(self.posts_dir / name, fields, keywords=keywords)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+
+def _freeze(post: Mapping) -> Mapping:
+    """Read-only copy of a post's metadata, with lists turned into tuples."""
+    if isinstance(post, PostRecord):
+        return post
+    return MappingProxyType({key: tuple(value) if isinstance(value, list) else value for key, value in post.items()})
+
+
+class PostSnapshot:
+    """Immutable, date-ordered view of the post corpus, shared by the queries of one run."""
+
+    def __init__(self, posts: Iterable[Mapping], signature: Any = None):
+        """
+        Freeze scanned posts, oldest first; posts without a usable date come first.
+
+        Args:
+            posts: Post records or metadata dicts from a scan
+            signature: State of the posts directory the scan saw, to detect later changes
+        """
+        dated = sorted(
+            ((post_datetime(post), _freeze(post)) for post in posts),
+            key=lambda item: (item[0] is not None, item[0] or datetime.min, item[1]['file_path'])
+        )
+        self.posts: Tuple[Mapping, ...] = tuple(post for _, post in dated)
+        self._undated = sum(1 for when, _ in dated if when is None)
+        self._dates: List[datetime] = [when for when, _ in dated[self._undated:]]
+        self.signature = signature
+        self.taken_at = time.time()
+
+    def since(self, cutoff: datetime) -> Tuple[Mapping, ...]:
+        """Posts dated strictly after a cutoff, oldest first."""
+        start = bisect.bisect_right(self._dates, cutoff)
+        return self.posts[self._undated + start:]
+
+    def latest(self, count: int) -> Tuple[Mapping, ...]:
+        """The most recently dated posts, newest first."""
+        dated = self.posts[self._undated:]
+        return tuple(reversed(dated[-count:])) if count > 0 else ()
+
+    def __len__(self) -> int:
+        """Number of posts in the snapshot."""
+        return len(self.posts)
+
+    def __iter__(self) -> Iterator[Mapping]:
+        """Iterate over the snapshot's posts."""
+        return iter(self.posts)
@@ -0,0 +1,168 @@
+"""
+Post Record Module
+
+Lazy, read-only record of an existing blog post. Only the YAML front
+matter is read when a record is created; the body is streamed from disk
+when it is asked for and not kept, and the keywords extracted from it are
+computed once per record.
+"""
+
+import logging
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+import frontmatter
+
+logger = logging.getLogger(__name__)
+
+# Same boundary python-frontmatter's YAML handler splits on
+_YAML_BOUNDARY = re.compile(r'^-{3,}\s*$')
+
+# Front matter fields a record exposes, with their defaults
+RECORD_FIELDS: Dict[str, Any] = {
+    'title': '',
+    'category': '',
+    'tags': [],
+    'excerpt': '',
+}
+
+KeywordExtractor = Callable[[str, str], List[str]]
+
+
+def _read_yaml_header(f: TextIO) -> Optional[str]:
+    """
+    Read a YAML front matter block, leaving the file at the start of the body.
+
+    Returns:
+        The header text, or None if the file doesn't open with a YAML block
+    """
+    line = f.readline()
+    while line and not line.strip():
+        line = f.readline()
+    if not _YAML_BOUNDARY.match(line):
+        return None
+
+    header = []
+    line = f.readline()
+    while line:
+        if _YAML_BOUNDARY.match(line):
+            return ''.join(header)
+        header.append(line)
+        line = f.readline()
+    return None
+
+
+def read_front_matter(path: Path) -> Dict[str, Any]:
+    """Front matter of a post, read without loading its body when it is YAML."""
+    with open(path, 'r', encoding='utf-8') as f:
+        header = _read_yaml_header(f)
+    if header is None:
+        # Not a YAML block (TOML, JSON or none at all): let python-frontmatter decide
+        return frontmatter.load(str(path)).metadata
+    return frontmatter.loads(f"---\n{header}---\n").metadata
+
+
+def read_body(path: Path) -> str:
+    """Body of a post, streamed from after its front matter."""
+    with open(path, 'r', encoding='utf-8') as f:
+        if _read_yaml_header(f) is not None:
+            return f.read().strip()
+    return frontmatter.load(str(path)).content
+
+
+def _immutable(value: Any) -> Any:
+    """Lists become tuples so a shared record can't be changed in place."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+class PostRecord(Mapping):
+    """
+    Read-only mapping of a post's metadata, with the body and keywords loaded on demand.
+
+    Keys match the post dicts PostAnalyzer has always produced: file_path,
+    title, category, tags, date, excerpt, keywords and content.
+    """
+
+    __slots__ = ('path', '_fields', '_keywords', '_extract_keywords')
+
+    def __init__(self, path: Path, fields: Dict[str, Any], keywords: List[str] = None,
+                 extract_keywords: KeywordExtractor = None):
+        """
+        Initialize a record.
+
+        Args:
+            path: Post file
+            fields: Front matter fields and date
+            keywords: Keywords already extracted for the post, if known
+            extract_keywords: Computes keywords from (body, title) when they aren't known
+        """
+        self.path = Path(path)
+        self._fields = {'file_path': str(path)}
+        self._fields.update((key, _immutable(value)) for key, value in fields.items())
+        self._keywords = tuple(keywords) if keywords is not None else None
+        self._extract_keywords = extract_keywords
+
+    @classmethod
+    def read(cls, path: Path, extract_keywords: KeywordExtractor, default_date: Any = None) -> 'PostRecord':
+        """
+        Read a post's front matter into a record.
+
+        Args:
+            path: Post file
+            extract_keywords: Computes keywords from (body, title) on first use
+            default_date: Date used when the front matter has none
+
+        Returns:
+            Record whose body hasn't been read
+        """
+        metadata = read_front_matter(path)
+        fields = {key: metadata.get(key, default) for key, default in RECORD_FIELDS.items()}
+        fields['date'] = metadata.get('date', default_date)
+        return cls(path, fields, extract_keywords=extract_keywords)
+
+    @property
+    def body(self) -> str:
+        """The post body, read from disk on every access."""
+        return read_body(self.path)
+
+    @property
+    def keywords(self) -> Tuple[str, ...]:
+        """Keywords of the post, extracted from its body once."""
+        if self._keywords is None:
+            if self._extract_keywords is None:
+                return ()
+            try:
+                body = self.body
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read body of {self.path}: {e}")
+                body = ''
+            self._keywords = tuple(self._extract_keywords(body, self._fields.get('title', '')))
+        return self._keywords
+
+    def __getitem__(self, key: str) -> Any:
+        """Look up a field; keywords and content are loaded on first use."""
+        if key == 'keywords':
+            return self.keywords
+        if key == 'content':
+            return self.body
+        return self._fields[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Whether the record has a field, without loading the body."""
+        return key in self._fields or key in ('keywords', 'content')
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over field names."""
+        yield from self._fields
+        yield 'keywords'
+        yield 'content'
+
+    def __len__(self) -> int:
+        """Number of fields."""
+        return len(self._fields) + 2
+
+    def __repr__(self) -> str:
+        """Short representation naming the post file."""
+        return f"PostRecord({self._fields['file_path']!r})"
@@ -0,0 +1,210 @@
+"""
+Readiness Module
+
+Decides when a rendered listing page is ready to read, instead of sleeping
+for a fixed random time. A page is ready once the document has loaded, no
+fetch/XHR requests are in flight, the DOM has stopped mutating and the
+number of event containers has stopped changing. Each source's observed
+ready times are learned so the wait is capped close to what it needs, and
+the cap backs off toward the full timeout after pages stop being ready in
+time.
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+# Installed before any page script runs: tracks in-flight requests and the last DOM mutation
+PROBE_JS = """
+(() => {
+  if (window.__readiness) return;
+  const state = window.__readiness = {inflight: 0, lastMutation: performance.now()};
+  const done = () => { state.inflight = Math.max(0, state.inflight - 1); };
+  const originalFetch = window.fetch;
+  if (originalFetch) {
+    window.fetch = function() {
+      state.inflight++;
+      return originalFetch.apply(this, arguments).finally(done);
+    };
+  }
+  const originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function() {
+    state.inflight++;
+    this.addEventListener('loadend', done, {once: true});
+    return originalSend.apply(this, arguments);
+  };
+  const observe = () => new MutationObserver(() => { state.lastMutation = performance.now(); })
+    .observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+  if (document.documentElement) observe(); else document.addEventListener('DOMContentLoaded', observe);
+})();
+"""
+
+_SNAPSHOT_JS = PROBE_JS + """
+const state = window.__readiness;
+return {
+  loaded: document.readyState !== 'loading',
+  inflight: state.inflight,
+  quietMs: performance.now() - state.lastMutation,
+  count: arguments[0] ? document.querySelectorAll(arguments[0]).length : 0
+};
+"""
+
+
+# How many quiet periods a stable container count must last on a page that never goes idle
+_BUSY_PAGE_FACTOR = 4
+
+
+@dataclass
+class ReadinessResult:
+    """Outcome of waiting for a page to become ready."""
+    elapsed: float
+    element_count: int
+    timed_out: bool
+
+
+def install_readiness_probe(driver: webdriver.Chrome) -> bool:
+    """Install the probe into every document the session loads from now on."""
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': PROBE_JS})
+        return True
+    except WebDriverException as e:
+        # The snapshot script installs the probe late instead
+        logger.debug(f"Could not pre-install readiness probe: {e}")
+        return False
+
+
+def wait_until_ready(driver: webdriver.Chrome, selectors: List[str], timeout: float,
+                     quiet_period: float = None, poll_interval: float = None) -> ReadinessResult:
+    """
+    Wait until the page is loaded, idle and its event containers are stable.
+
+    Args:
+        driver: Chrome session that has just navigated
+        selectors: Event container selectors; the page must have at least one match
+        timeout: Maximum seconds to wait
+        quiet_period: Seconds without DOM mutations or requests that count as idle
+        poll_interval: Seconds between readiness checks
+
+    Returns:
+        How long the wait took, the final container count and whether it timed out
+    """
+    quiet_period = quiet_period if quiet_period is not None else config.get('houston_events.readiness_quiet_ms', 500) / 1000
+    poll_interval = poll_interval if poll_interval is not None else config.get('houston_events.readiness_poll_interval', 0.1)
+    combined = ", ".join(selectors)
+
+    started = time.monotonic()
+    deadline = started + timeout
+    last_count = -1
+    stable_since = started
+    count = 0
+
+    while True:
+        now = time.monotonic()
+        try:
+            snapshot = driver.execute_script(_SNAPSHOT_JS, combined)
+        except WebDriverException as e:
+            logger.debug(f"Readiness check failed: {e}")
+            snapshot = None
+
+        if snapshot:
+            count = snapshot['count']
+            if count != last_count:
+                last_count, stable_since = count, now
+
+            idle = snapshot['loaded'] and snapshot['inflight'] == 0 and snapshot['quietMs'] >= quiet_period * 1000
+
+            stable_for = now - stable_since if count > 0 else 0
+            # Pages that poll or animate forever never go idle; a long-stable count is enough
+            if (idle and stable_for >= quiet_period) or stable_for >= quiet_period * _BUSY_PAGE_FACTOR:
+                return ReadinessResult(now - started, count, False)
+
+        if now >= deadline:
+            return ReadinessResult(now - started, max(count, 0), True)
+
+        time.sleep(min(poll_interval, max(deadline - now, 0)))
+
+
+class LatencyProfiles:
+    """Persisted per-source statistics of how long listing pages take to become ready."""
+
+    def __init__(self, path: Path = None, smoothing: float = 0.3):
+        """
+        Initialize the latency profiles.
+
+        Args:
+            path: JSON file the profiles are persisted to
+            smoothing: Weight of the newest observation in the moving averages
+        """
+        cache_dir = Path(config.get('houston_events.cache_dir', '.cache/houston_events'))
+        self.path = path or cache_dir / 'latency_profiles.json'
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self.profiles: Dict[str, Dict[str, float]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        """Load profiles, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def timeout_for(self, source: str, cap: float, floor: float = 5.0) -> float:
+        """
+        Readiness timeout for a source: generous versus its history, never above the cap.
+
+        Args:
+            source: Source identifier
+            cap: Upper bound in seconds
+            floor: Lower bound in seconds
+
+        Returns:
+            Seconds to wait before giving up
+        """
+        profile = self.profiles.get(source)
+        if not profile:
+            return cap
+        learned = max(floor, profile['mean'] + 4 * profile['deviation'])
+        # Each consecutive miss doubles the wait, so a source that slowed down recovers
+        return min(cap, learned * 2 ** profile.get('misses', 0))
+
+    def record(self, source: str, elapsed: float) -> None:
+        """Fold a successful ready time into the source's profile and persist it."""
+        self._observe(source, elapsed, missed=False)
+
+    def record_timeout(self, source: str, waited: float) -> None:
+        """Record that a page wasn't ready within the wait, backing off the next timeout."""
+        # The wait is a lower bound on the true ready time; folding it in also moves the mean up
+        self._observe(source, waited, missed=True)
+
+    def _observe(self, source: str, elapsed: float, missed: bool) -> None:
+        """Update a source's profile with one observation and persist it."""
+        with self._lock:
+            profile = self.profiles.get(source)
+            if profile is None:
+                profile = {'mean': elapsed, 'deviation': elapsed / 2, 'samples': 0}
+            else:
+                error = elapsed - profile['mean']
+                profile['mean'] += self.smoothing * error
+                profile['deviation'] += self.smoothing * (abs(error) - profile['deviation'])
+            profile['samples'] += 1
+            profile['misses'] = profile.get('misses', 0) + 1 if missed else 0
+            self.profiles[source] = profile
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    json.dump(self.profiles, f, indent=2)
+            except OSError as e:
+                logger.warning(f"Could not persist latency profiles: {e}")
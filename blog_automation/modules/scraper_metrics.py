@@ -0,0 +1,192 @@
+"""
+Scraper Metrics Module
+
+Structured per-source, per-stage timings for the Houston events scraper.
+Each stage of a run (driver lease, navigation, readiness wait, page source,
+parse, dedup, scoring, ...) is recorded with its duration and counters, and
+the run's records are appended to a JSONL file that the CLI can summarize.
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+# Record keys that describe a record rather than count something
+_RECORD_KEYS = ('run_id', 'ts', 'source', 'stage', 'duration')
+
+
+def default_metrics_path() -> Path:
+    """Metrics file from configuration, defaulting to the scraper cache directory."""
+    configured = config.get('houston_events.metrics_file')
+    if configured:
+        return Path(configured)
+    return Path(config.get('houston_events.cache_dir', '.cache/houston_events')) / 'metrics.jsonl'
+
+
+class ScraperMetrics:
+    """Collects stage records for a scraping run and appends them to a JSONL file."""
+
+    def __init__(self, path: Path = None, enabled: bool = None, max_bytes: int = None):
+        """
+        Initialize the metrics recorder.
+
+        Args:
+            path: JSONL file records are appended to
+            enabled: Whether records are kept at all
+            max_bytes: Size after which the file is rotated to a ".1" backup
+        """
+        self.path = Path(path) if path else default_metrics_path()
+        self.enabled = enabled if enabled is not None else config.get('houston_events.metrics_enabled', True)
+        self.max_bytes = max_bytes if max_bytes is not None else config.get('houston_events.metrics_max_bytes', 10 * 1024 * 1024)
+        self.run_id: Optional[str] = None
+        self._records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def start_run(self) -> str:
+        """Start a new run; later records carry its id."""
+        self.run_id = datetime.now().strftime('%Y%m%dT%H%M%S.%f')
+        return self.run_id
+
+    def record(self, source: str, stage: str, duration: float, **fields: Any) -> None:
+        """
+        Record one stage measurement.
+
+        Args:
+            source: Source identifier
+            stage: Stage name
+            duration: Seconds the stage took
+            **fields: Counters and attributes such as url, bytes or events
+        """
+        if not self.enabled:
+            return
+        entry = {'run_id': self.run_id, 'ts': round(time.time(), 3), 'source': source,
+                 'stage': stage, 'duration': round(duration, 4)}
+        entry.update(fields)
+        with self._lock:
+            self._records.append(entry)
+
+    @contextmanager
+    def stage(self, source: str, stage: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block as a stage.
+
+        Yields a dict the block can add counters to; it is recorded even if
+        the block raises.
+        """
+        started = time.monotonic()
+        try:
+            yield fields
+        finally:
+            self.record(source, stage, time.monotonic() - started, **fields)
+
+    def flush(self) -> int:
+        """
+        Append the pending records to the metrics file.
+
+        Returns:
+            Number of records written
+        """
+        with self._lock:
+            records, self._records = self._records, []
+        if not records:
+            return 0
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size > self.max_bytes:
+                self.path.replace(self.path.with_name(self.path.name + '.1'))
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for entry in records:
+                    f.write(json.dumps(entry) + '\n')
+        except OSError as e:
+            logger.warning(f"Could not write scraper metrics: {e}")
+            return 0
+
+        logger.debug(f"Wrote {len(records)} scraper metrics to {self.path}")
+        return len(records)
+
+
+def load_metrics(path: Path = None, runs: Optional[int] = 1, source: str = None,
+                 stage: str = None) -> List[Dict[str, Any]]:
+    """
+    Read recorded metrics, newest runs last.
+
+    Args:
+        path: JSONL metrics file
+        runs: Only keep the last N runs; None keeps all
+        source: Only keep records for this source
+        stage: Only keep records for this stage
+
+    Returns:
+        Matching records in file order
+    """
+    path = Path(path) if path else default_metrics_path()
+    records = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        return []
+
+    if runs:
+        run_ids = list(dict.fromkeys(entry.get('run_id') for entry in records))[-runs:]
+        keep = set(run_ids)
+        records = [entry for entry in records if entry.get('run_id') in keep]
+
+    return [
+        entry for entry in records
+        if (source is None or entry.get('source') == source) and (stage is None or entry.get('stage') == stage)
+    ]
+
+
+def summarize_metrics(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Aggregate records per source and stage.
+
+    Args:
+        records: Records from load_metrics
+
+    Returns:
+        One row per (source, stage) with count, total, mean, p95 and max
+        durations plus the sum of every numeric counter, slowest total first
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for entry in records:
+        groups.setdefault((entry.get('source'), entry.get('stage')), []).append(entry)
+
+    rows = []
+    for (source, stage), entries in groups.items():
+        durations = sorted(entry.get('duration', 0.0) for entry in entries)
+        counters: Dict[str, float] = {}
+        for entry in entries:
+            for key, value in entry.items():
+                if key not in _RECORD_KEYS and isinstance(value, (int, float)) and not isinstance(value, bool):
+                    counters[key] = counters.get(key, 0) + value
+
+        rows.append({
+            'source': source,
+            'stage': stage,
+            'count': len(entries),
+            'total': sum(durations),
+            'mean': sum(durations) / len(durations),
+            'p95': durations[min(len(durations) - 1, math.ceil(0.95 * len(durations)) - 1)],
+            'max': durations[-1],
+            'counters': counters,
+        })
+
+    rows.sort(key=lambda row: row['total'], reverse=True)
+    return rows
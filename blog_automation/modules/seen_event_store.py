@@ -0,0 +1,191 @@
+"""
+Seen Event Store Module
+
+Local SQLite record of every event the scraper has seen, keyed by a
+fingerprint of its normalized title, date, venue and source. Lets a run
+tell new and changed listings apart from ones it already handled, with a
+retention policy that keeps the database small. Looking an event up
+doesn't record it; events are recorded once a run has used them.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+from ..config import config
+from ..models import HoustonEvent
+
+logger = logging.getLogger(__name__)
+
+SEEN_NEW = 'new'
+SEEN_CHANGED = 'changed'
+SEEN_UNCHANGED = 'unchanged'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_events (
+    fingerprint TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    event_date TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seen_events_last_seen ON seen_events (last_seen);
+"""
+
+
+class SeenObservation(NamedTuple):
+    """An event as a run saw it, ready to be recorded once the run has used it."""
+    fingerprint: str
+    source: str
+    content_hash: str
+    event_date: str
+    status: str
+
+
+def _normalize(text: Optional[str]) -> str:
+    """Lowercase and collapse whitespace so cosmetic edits don't change a fingerprint."""
+    return ' '.join((text or '').lower().split())
+
+
+def event_fingerprint(event: HoustonEvent, source: str) -> str:
+    """Identity of an event: normalized title, day, venue and source."""
+    key = '|'.join([_normalize(event.title), event.date.date().isoformat(), _normalize(event.venue), source])
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def event_content_hash(event: HoustonEvent) -> str:
+    """Hash of the details that can change while the event stays the same."""
+    parts = [
+        _normalize(event.description),
+        event.time or '',
+        event.end_date.date().isoformat() if event.end_date else '',
+        event.address or '',
+        event.price or '',
+        event.url or '',
+        event.image_url or '',
+    ]
+    return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+class SeenEventStore:
+    """SQLite store of event fingerprints with first-seen and last-seen times."""
+
+    def __init__(self, path: Path = None, retention_days: int = None, max_rows: int = None):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file
+            retention_days: Events not seen for this long are dropped
+            max_rows: Upper bound on stored events; least recently seen go first
+        """
+        cache_dir = Path(config.get('houston_events.cache_dir', '.cache/houston_events'))
+        self.path = path or cache_dir / 'seen_events.sqlite3'
+        self.retention_days = retention_days or config.get('houston_events.seen_event_retention_days', 60)
+        self.max_rows = max_rows or config.get('houston_events.seen_event_max_rows', 50000)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def observe(self, event: HoustonEvent, source: str) -> SeenObservation:
+        """
+        Report whether an event is new or changed, without recording it.
+
+        Args:
+            event: Scraped event
+            source: Source identifier
+
+        Returns:
+            Observation whose status is SEEN_NEW, SEEN_CHANGED or SEEN_UNCHANGED
+        """
+        fingerprint = event_fingerprint(event, source)
+        content_hash = event_content_hash(event)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash FROM seen_events WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+
+        if row is None:
+            status = SEEN_NEW
+        else:
+            status = SEEN_UNCHANGED if row[0] == content_hash else SEEN_CHANGED
+        return SeenObservation(fingerprint, source, content_hash, event.date.date().isoformat(), status)
+
+    def record(self, observations: Iterable[SeenObservation], now: float = None) -> int:
+        """
+        Record observed events as seen and commit them.
+
+        Args:
+            observations: Observations made while scraping
+            now: Timestamp to record (defaults to the current time)
+
+        Returns:
+            Number of events recorded
+        """
+        now = now or time.time()
+        rows = [
+            (seen.fingerprint, seen.source, seen.content_hash, seen.event_date, now, now)
+            for seen in observations
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO seen_events (fingerprint, source, content_hash, event_date, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (fingerprint) DO UPDATE SET content_hash = excluded.content_hash, "
+                "last_seen = excluded.last_seen",
+                rows
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def compact(self, now: float = None) -> int:
+        """
+        Apply the retention policy and reclaim space when it is worth it.
+
+        Args:
+            now: Reference timestamp (defaults to the current time)
+
+        Returns:
+            Number of events removed
+        """
+        now = now or time.time()
+        cutoff = now - self.retention_days * 86400
+
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM seen_events WHERE last_seen < ?", (cutoff,)).rowcount
+            removed += self._conn.execute(
+                "DELETE FROM seen_events WHERE fingerprint IN ("
+                "SELECT fingerprint FROM seen_events ORDER BY last_seen DESC LIMIT -1 OFFSET ?)",
+                (self.max_rows,)
+            ).rowcount
+            self._conn.commit()
+
+            # Only rewrite the file once a quarter of it is free pages
+            free_pages = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+            total_pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            if total_pages and free_pages * 4 > total_pages:
+                self._conn.execute("VACUUM")
+
+        if removed:
+            logger.info(f"Removed {removed} expired events from the seen-event store")
+        return removed
+
+    def count(self) -> int:
+        """Number of stored events."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_events").fetchone()[0]
+
+    def close(self) -> None:
+        """Commit and close the database."""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,78 @@
+"""
+Selector Cache Module
+
+Remembers which CSS selector matched each source's event containers last
+time so it is tried first on the next run instead of walking the whole
+fallback list.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+
+class SelectorCache:
+    """Persisted per-source record of the selectors that worked."""
+
+    def __init__(self, path: Path = None):
+        """
+        Initialize the selector cache.
+
+        Args:
+            path: JSON file the learned selectors are persisted to
+        """
+        cache_dir = Path(config.get('houston_events.cache_dir', '.cache/houston_events'))
+        self.path = path or cache_dir / 'selectors.json'
+        self._lock = threading.Lock()
+        self.selectors: Dict[str, Dict[str, str]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        """Load learned selectors, ignoring a missing or corrupt file."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, source: str, kind: str) -> Optional[str]:
+        """Get the selector that last worked for a source and selector kind."""
+        return self.selectors.get(source, {}).get(kind)
+
+    def ordered(self, source: str, kind: str, candidates: List[str]) -> List[str]:
+        """
+        Order candidate selectors with the learned one first.
+
+        Args:
+            source: Source identifier
+            kind: Which selector list this is, e.g. "containers" or "events"
+            candidates: Fallback selectors in priority order
+
+        Returns:
+            Candidates with the previously successful selector moved to the front
+        """
+        learned = self.get(source, kind)
+        if learned in candidates:
+            return [learned] + [selector for selector in candidates if selector != learned]
+        return list(candidates)
+
+    def record(self, source: str, kind: str, selector: str) -> None:
+        """Record the selector that worked and persist it if it changed."""
+        with self._lock:
+            if self.get(source, kind) == selector:
+                return
+
+            self.selectors.setdefault(source, {})[kind] = selector
+            logger.info(f"Learned {kind} selector for {source}: {selector}")
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, 'w', encoding='utf-8') as f:
+                    json.dump(self.selectors, f, indent=2)
+            except OSError as e:
+                logger.warning(f"Could not persist learned selectors: {e}")
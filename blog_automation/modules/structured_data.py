@@ -0,0 +1,207 @@
+"""
+Structured Data Module
+
+Extracts schema.org Event objects embedded in listing pages as JSON-LD or
+microdata. These carry exact dates, addresses, prices and images, so they
+are preferred over heuristic CSS parsing whenever a page provides them.
+"""
+
+import html
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+logger = logging.getLogger(__name__)
+
+# Selectors whose presence means a page may carry structured event data
+STRUCTURED_DATA_SELECTORS = ["script[type='application/ld+json']", "[itemtype*='schema.org']"]
+
+_EVENT_TYPE_RE = re.compile(r'(Event|Festival)$')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _is_event_type(type_value: Any) -> bool:
+    """Whether a schema.org @type (or list of types) is an Event subtype."""
+    types = type_value if isinstance(type_value, list) else [type_value]
+    return any(isinstance(t, str) and _EVENT_TYPE_RE.search(t.rsplit('/', 1)[-1]) for t in types)
+
+
+def _first(value: Any) -> Any:
+    """Unwrap single-item lists that schema.org allows anywhere."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _text(value: Any) -> Optional[str]:
+    """Plain text for a schema.org text value, with markup and entities removed."""
+    value = _first(value)
+    if value is None or isinstance(value, dict):
+        return None
+    text = html.unescape(_TAG_RE.sub(' ', str(value)))
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text or None
+
+
+def _walk_json_ld(node: Any, found: List[Dict]) -> None:
+    """Collect Event objects from a JSON-LD document, including @graph and ItemList."""
+    if isinstance(node, list):
+        for item in node:
+            _walk_json_ld(item, found)
+        return
+
+    if not isinstance(node, dict):
+        return
+
+    if _is_event_type(node.get('@type')):
+        found.append(node)
+        return
+
+    for key in ('@graph', 'itemListElement', 'item', 'mainEntity', 'subEvent'):
+        if key in node:
+            _walk_json_ld(node[key], found)
+
+
+def _microdata_value(element: Tag) -> Any:
+    """Value of a microdata itemprop element."""
+    if element.has_attr('itemscope'):
+        return _microdata_item(element)
+    if element.name == 'meta':
+        return element.get('content')
+    if element.name in ('a', 'link', 'area'):
+        return element.get('href')
+    if element.name in ('img', 'audio', 'video', 'source', 'embed', 'iframe'):
+        return element.get('src')
+    if element.name == 'time' and element.get('datetime'):
+        return element['datetime']
+    if element.name == 'data' or element.has_attr('content'):
+        return element.get('content') or element.get('value')
+    return element.get_text(' ', strip=True)
+
+
+def _microdata_item(scope: Tag) -> Dict[str, Any]:
+    """Properties of a microdata item, excluding those of nested items."""
+    item: Dict[str, Any] = {'@type': scope.get('itemtype', '')}
+
+    for prop in scope.find_all(attrs={'itemprop': True}):
+        # Skip properties that belong to a nested itemscope
+        owner = prop.parent
+        while owner is not None and owner is not scope and not owner.has_attr('itemscope'):
+            owner = owner.parent
+        if owner is not scope:
+            continue
+
+        for name in prop['itemprop'].split():
+            item.setdefault(name, _microdata_value(prop))
+
+    return item
+
+
+def _format_address(address: Any) -> Optional[str]:
+    """Single-line address from a text or PostalAddress value."""
+    address = _first(address)
+    if isinstance(address, dict):
+        parts = [
+            _text(address.get(key))
+            for key in ('streetAddress', 'addressLocality', 'addressRegion', 'postalCode')
+        ]
+        return ', '.join(part for part in parts if part) or None
+    return _text(address)
+
+
+def _format_price(offers: Any) -> Optional[str]:
+    """Price text from an Offer or AggregateOffer value."""
+    offer = _first(offers)
+    if not isinstance(offer, dict):
+        return None
+
+    currency = _text(offer.get('priceCurrency'))
+    low, high = _text(offer.get('lowPrice')), _text(offer.get('highPrice'))
+    if low and high and low != high:
+        price = f"{low}-{high}"
+    else:
+        price = _text(offer.get('price')) or low or high
+
+    if price is None:
+        return None
+    if price in ('0', '0.0', '0.00'):
+        return 'Free'
+    return f"{price} {currency}" if currency else price
+
+
+def _format_image(image: Any) -> Optional[str]:
+    """Image URL from a URL or ImageObject value."""
+    image = _first(image)
+    if isinstance(image, dict):
+        return _text(image.get('url') or image.get('contentUrl'))
+    return _text(image)
+
+
+def _normalize(event: Dict[str, Any]) -> Optional[Dict[str, Optional[str]]]:
+    """Flatten a schema.org Event into the fields HoustonEvent needs."""
+    title = _text(event.get('name'))
+    if not title:
+        return None
+
+    location = _first(event.get('location'))
+    venue = address = None
+    if isinstance(location, dict):
+        venue = _text(location.get('name'))
+        address = _format_address(location.get('address'))
+    else:
+        venue = _text(location)
+
+    return {
+        'title': title,
+        'description': _text(event.get('description')) or "",
+        'start_date': _text(event.get('startDate')),
+        'end_date': _text(event.get('endDate')),
+        'venue': venue,
+        'address': address,
+        'price': _format_price(event.get('offers')),
+        'url': _text(event.get('url')),
+        'image_url': _format_image(event.get('image')),
+    }
+
+
+def extract_structured_events(soup: BeautifulSoup) -> List[Dict[str, Optional[str]]]:
+    """
+    Extract schema.org events from JSON-LD and microdata.
+
+    Args:
+        soup: Parsed page
+
+    Returns:
+        Flattened event records; empty if the page has no structured events
+    """
+    raw_events: List[Dict] = []
+
+    for script in soup.find_all('script', attrs={'type': 'application/ld+json'}):
+        payload = script.string or script.get_text()
+        if not payload or not payload.strip():
+            continue
+        try:
+            _walk_json_ld(json.loads(payload), raw_events)
+        except ValueError as e:
+            logger.debug(f"Skipping malformed JSON-LD block: {e}")
+
+    if not raw_events:
+        for scope in soup.find_all(attrs={'itemscope': True, 'itemtype': True}):
+            if _is_event_type(scope['itemtype']):
+                raw_events.append(_microdata_item(scope))
+
+    events = []
+    seen = set()
+    for raw_event in raw_events:
+        record = _normalize(raw_event)
+        if record is None:
+            continue
+        key = (record['title'], record['start_date'])
+        if key not in seen:
+            seen.add(key)
+            events.append(record)
+
+    return events
@@ -110,6 +110,7 @@ class BlogAutomationOrchestrator:
             publish_result = await self.publisher.publish_post(final_post, filename)
             if not publish_result.success:
                 raise Exception(f"Publishing failed: {publish_result.error_message}")
+            self._invalidate_post_snapshot()
             
             published_file = publish_result.file_path
             logger.info(f"Successfully published post: {published_file}")
@@ -247,6 +248,11 @@ class BlogAutomationOrchestrator:
             self._post_analyzer = PostAnalyzer()
         return self._post_analyzer
     
+    def _invalidate_post_snapshot(self):
+        """Make the next post analysis rescan existing posts, after a publish or between runs."""
+        if self._post_analyzer is not None:
+            self._post_analyzer.invalidate_snapshot()
+    
     async def run_events_workflow(self, max_events: int = 20) -> Dict[str, Any]:
         """
         Run Houston events-specific blog generation workflow.
@@ -262,6 +268,9 @@ class BlogAutomationOrchestrator:
         
         logger.info(f"Starting Houston events workflow: {workflow_id}")
         
+        # Existing posts are scanned once per run and shared by every duplicate check
+        self._invalidate_post_snapshot()
+        
         try:
             # Check if Houston events are enabled
             if not config.get('houston_events.enabled', False):
@@ -347,6 +356,9 @@ class BlogAutomationOrchestrator:
             publish_result = await self.publisher.publish_post(final_post, filename)
             if not publish_result.success:
                 raise Exception(f"Publishing failed: {publish_result.error_message}")
+            self._invalidate_post_snapshot()
+            # Only a published run marks its events as seen, so later runs skip them
+            self.houston_events_scraper.commit_seen_events(events)
             
             published_file = publish_result.file_path
             logger.info(f"Successfully published event post: {published_file}")
@@ -9,6 +9,7 @@ without requiring a full blog post generation workflow.
 import asyncio
 import logging
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add the blog_automation directory to the path
@@ -17,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from blog_automation.modules.houston_events_scraper import HoustonEventsScraper
 from blog_automation.modules.event_content_generator import EventContentGenerator
 from blog_automation.modules.post_analyzer import PostAnalyzer
+from blog_automation.modules.date_parsing import parse_event_date
 from blog_automation.config import config, setup_logging
 
 # Setup logging for testing
@@ -148,6 +150,33 @@ async def test_duplicate_detection(events):
         logger.error(f"Duplicate detection test failed: {e}")
 
 
+def test_date_parsing():
+    """Test event date ranges that end at a later time on the same day."""
+    print("📆 Testing Date Parsing...")
+    
+    now = datetime(2026, 10, 1, 12, 0)
+    cases = [
+        ("Friday, October 24, 2026 7:00 PM - 10:00 PM", datetime(2026, 10, 24, 19, 0), datetime(2026, 10, 24, 22, 0)),
+        ("Oct 24 7 PM - 11 PM", datetime(2026, 10, 24, 19, 0), datetime(2026, 10, 24, 23, 0)),
+        ("Oct 24, 2026 11 AM - 12 PM", datetime(2026, 10, 24, 11, 0), datetime(2026, 10, 24, 12, 0)),
+        ("Dec 5, 7 PM - 9 PM", datetime(2026, 12, 5, 19, 0), datetime(2026, 12, 5, 21, 0)),
+        ("Dec 5-7, 2026", datetime(2026, 12, 5), datetime(2026, 12, 7)),
+    ]
+    
+    failures = 0
+    for text, start, end in cases:
+        parsed = parse_event_date(text, now)
+        if parsed is None or parsed.start != start or parsed.end != end:
+            failures += 1
+            print(f"❌ '{text}' parsed as {parsed}, expected {start} - {end}")
+    
+    if failures:
+        print(f"❌ {failures} of {len(cases)} date ranges parsed incorrectly")
+    else:
+        print(f"✅ All {len(cases)} date ranges parsed correctly")
+    return failures == 0
+
+
 def test_configuration():
     """Test Houston events configuration."""
     print("⚙️  Testing Configuration...")
@@ -180,7 +209,10 @@ async def main():
     print("🚀 Houston Events System Test")
     print("=" * 50)
     
-    # Test configuration first
+    # Offline checks first
+    test_date_parsing()
+    
+    # Test configuration
     config_ok = test_configuration()
     
     if not config_ok: